@@ -0,0 +1,262 @@
+"""Write synthetic Django projects to disk, so the management commands can be benchmarked end to end.
+
+``build_synthetic_models`` in ``_schema.py`` creates models in memory, which is enough to time a single function.
+The commands themselves look models up in the app registry, read their source files and load migrations from
+disk, so timing them needs a real project: settings, app packages, ``models.py`` files and migrations.
+"""
+
+import random
+import textwrap
+from dataclasses import dataclass
+from pathlib import Path
+
+from ._schema import SchemaSpec, _relation_count
+
+SETTINGS_PACKAGE = "bench_project"
+
+
+@dataclass
+class ProjectSpec(SchemaSpec):
+    """Shape of a synthetic project written to disk.
+
+    On top of the relations described by ``SchemaSpec``, each app gets an abstract base model and a custom
+    manager and queryset. The ``*_ratio`` values are the chance of each concrete model using them, or being a
+    multi-table inheritance child of an earlier concrete model in its app. ``proxies_per_app`` proxy models are
+    added to each app, and each app has a chain of ``migrations_per_app`` migrations.
+    """
+
+    abstract_ratio: float = 0.3
+    mti_ratio: float = 0.1
+    manager_ratio: float = 0.2
+    proxies_per_app: int = 5
+    methods_per_model: int = 2
+    migrations_per_app: int = 3
+
+    @property
+    def app_labels(self) -> list[str]:
+        """Labels of the generated apps, in dependency order."""
+        return [f"bench_app_{app_index}" for app_index in range(self.apps)]
+
+    @property
+    def settings_module(self) -> str:
+        """Dotted path of the generated settings module."""
+        return f"{SETTINGS_PACKAGE}.settings"
+
+
+@dataclass
+class _ModelSource:
+    """What is known about a generated model while the rest of its app is written."""
+
+    name: str
+    base: str
+    lines: list[str]
+    related_apps: set[str]
+
+
+def _model_source(spec: ProjectSpec, rng: random.Random, app_label: str, index: int, state: dict) -> _ModelSource:
+    """Generate the source of one concrete model, choosing its base class and relations."""
+    name = f"Model{index}"
+    prefix = f"m{index}"
+    app_concrete = state["concrete"].get(app_label, [])
+
+    if app_concrete and rng.random() < spec.mti_ratio:
+        base = rng.choice(app_concrete)
+    elif rng.random() < spec.abstract_ratio:
+        base = "AbstractBase"
+    else:
+        base = "models.Model"
+
+    lines = [f"class {name}({base}):", f'    """Synthetic model {index} of {app_label}."""', ""]
+    lines += [
+        f"    {prefix}_field_{field_index} = models.CharField(max_length=50, blank=True)"
+        for field_index in range(spec.fields_per_model)
+    ]
+
+    related_apps = set()
+    targets = state["targets"]
+    relation_kinds = (
+        ("fk", "ForeignKey", spec.fk_per_model, ", on_delete=models.CASCADE"),
+        ("m2m", "ManyToManyField", spec.m2m_per_model, ""),
+        ("o2o", "OneToOneField", spec.o2o_per_model, ", on_delete=models.CASCADE"),
+    )
+    if targets:
+        for kind, field_class, per_model, extra in relation_kinds:
+            for relation_index in range(_relation_count(rng, per_model)):
+                target = rng.choice(targets)
+                related_apps.add(target.split(".")[0])
+                related_name = f"{app_label}_{name.lower()}_{kind}_{relation_index}"
+                lines.append(
+                    f'    {prefix}_{kind}_{relation_index} = models.{field_class}("{target}"{extra}, '
+                    f'related_name="{related_name}")'
+                )
+
+    if rng.random() < spec.manager_ratio:
+        lines += ["", "    objects = AppManager()"]
+
+    for method_index in range(spec.methods_per_model):
+        lines += [
+            "",
+            f"    def {prefix}_method_{method_index}(self, value=None):",
+            f'        """Synthetic method {method_index}."""',
+            "        return value",
+        ]
+
+    return _ModelSource(name=name, base=base, lines=lines, related_apps=related_apps - {app_label})
+
+
+def _app_header(app_label: str) -> list[str]:
+    """Generate the imports, custom manager and queryset, and abstract base shared by an app's models."""
+    return textwrap.dedent(
+        f'''\
+        """Models for {app_label}, generated by benchmarks/_project.py."""
+
+        from django.db import models
+
+
+        class AppQuerySet(models.QuerySet):
+            """Custom queryset shared by some of the app's models."""
+
+            def recent(self):
+                return self.order_by("-pk")
+
+            def with_label(self, label):
+                return self.filter(pk__isnull=False)
+
+
+        class AppManager(models.Manager.from_queryset(AppQuerySet)):
+            """Custom manager shared by some of the app's models."""
+
+            def get_queryset(self):
+                return super().get_queryset()
+
+
+        class AbstractBase(models.Model):
+            """Abstract base for some of the app's models."""
+
+            label = models.CharField(max_length=50, blank=True)
+            created = models.DateTimeField(auto_now_add=True)
+
+            class Meta:
+                abstract = True
+
+            def describe(self):
+                return self.label
+        '''
+    ).splitlines()
+
+
+def _migration_source(app_label: str, number: int, dependencies: list[tuple[str, str]], model_names: list[str]) -> str:
+    """Generate a migration that creates the app's models (the first one) or adds a field to one of them.
+
+    The migrations are only ever loaded into a migration graph, never applied, so the fields they describe don't
+    need to match the models.
+    """
+    if number == 1:
+        operations = [
+            f'migrations.CreateModel(name="{name}", fields=[("id", models.BigAutoField(primary_key=True))])'
+            for name in model_names
+        ]
+    else:
+        model_name = model_names[number % len(model_names)]
+        operations = [
+            f'migrations.AddField(model_name="{model_name.lower()}", name="extra_{number}", '
+            "field=models.CharField(max_length=50, blank=True))"
+        ]
+
+    return "\n".join(
+        [
+            "from django.db import migrations, models",
+            "",
+            "",
+            "class Migration(migrations.Migration):",
+            f"    initial = {number == 1}",
+            "    dependencies = [",
+            *(f"        ({dep_app!r}, {dep_name!r})," for dep_app, dep_name in dependencies),
+            "    ]",
+            "    operations = [",
+            *(f"        {operation}," for operation in operations),
+            "    ]",
+            "",
+        ]
+    )
+
+
+def _migration_name(number: int) -> str:
+    """Get the name of an app's migration by its number."""
+    return "0001_initial" if number == 1 else f"{number:04d}_step_{number}"
+
+
+def _write_settings(spec: ProjectSpec, directory: Path) -> None:
+    """Write the settings package of the project."""
+    package = directory / SETTINGS_PACKAGE
+    package.mkdir(parents=True, exist_ok=True)
+    (package / "__init__.py").write_text("")
+    installed_apps = ["django.contrib.contenttypes", "django.contrib.auth", "django_model_info", *spec.app_labels]
+    (package / "settings.py").write_text(
+        "\n".join(
+            [
+                '"""Settings for a synthetic project, generated by benchmarks/_project.py."""',
+                "",
+                'SECRET_KEY = "benchmark"',
+                f"INSTALLED_APPS = {installed_apps!r}",
+                'DATABASES = {"default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}}',
+                'DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"',
+                "USE_TZ = True",
+                "",
+            ]
+        )
+    )
+
+
+def write_project(spec: ProjectSpec, directory: Path) -> None:
+    """Write the project described by ``spec`` to ``directory``, which should then be put on ``sys.path``.
+
+    Relations always point at concrete models created earlier, in the same app or an earlier one, and each app's
+    first migration depends on the first migration of every app its models point at, as ``makemigrations``
+    would do.
+    """
+    directory = Path(directory)
+    _write_settings(spec, directory)
+    rng = random.Random(spec.seed)
+    state = {"targets": [], "concrete": {}}
+
+    for app_label in spec.app_labels:
+        app_dir = directory / app_label
+        (app_dir / "migrations").mkdir(parents=True, exist_ok=True)
+        (app_dir / "__init__.py").write_text("")
+        (app_dir / "migrations" / "__init__.py").write_text("")
+
+        lines = _app_header(app_label)
+        related_apps = set()
+        model_names = []
+        for model_index in range(spec.models_per_app):
+            model = _model_source(spec, rng, app_label, model_index, state)
+            lines += ["", "", *model.lines]
+            related_apps |= model.related_apps
+            model_names.append(model.name)
+            state["targets"].append(f"{app_label}.{model.name}")
+            state["concrete"].setdefault(app_label, []).append(model.name)
+
+        for proxy_index in range(spec.proxies_per_app if model_names else 0):
+            lines += [
+                "",
+                "",
+                f"class Proxy{proxy_index}({rng.choice(model_names)}):",
+                f'    """Synthetic proxy model {proxy_index} of {app_label}."""',
+                "",
+                "    class Meta:",
+                "        proxy = True",
+                "",
+                "    def proxy_method(self):",
+                "        return self.pk",
+            ]
+
+        (app_dir / "models.py").write_text("\n".join(lines) + "\n")
+
+        for number in range(1, spec.migrations_per_app + 1):
+            if number == 1:
+                dependencies = [(related_app, "0001_initial") for related_app in sorted(related_apps)]
+            else:
+                dependencies = [(app_label, _migration_name(number - 1))]
+            migration = _migration_source(app_label, number, dependencies, model_names or ["Model0"])
+            (app_dir / "migrations" / f"{_migration_name(number)}.py").write_text(migration)
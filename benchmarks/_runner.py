@@ -0,0 +1,69 @@
+"""Run a single management command in a synthetic project and report how long it took, as one line of JSON.
+
+``bench_commands`` starts this module in a fresh process for every run, so each timing includes the cold caches
+a real invocation starts with::
+
+    python -m benchmarks._runner PROJECT_DIR SETTINGS_MODULE OUTPUT_DIR modelinfo -v 2
+"""
+
+import io
+import json
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+
+
+class CountingWriter(io.TextIOBase):
+    """A text stream that discards everything written to it, keeping count of the characters."""
+
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        self.count += len(text)
+        return len(text)
+
+
+def get_directory_size(path: str) -> int:
+    """Get the total size of the files under ``path``, in bytes."""
+    return sum(entry.stat().st_size for entry in os.scandir(path) if entry.is_file()) + sum(
+        get_directory_size(entry.path) for entry in os.scandir(path) if entry.is_dir()
+    )
+
+
+def main():
+    """Set up Django, run the command with its output discarded, and print the timings."""
+    project_dir, settings_module, output_dir, command, *args = sys.argv[1:]
+    sys.path.insert(0, project_dir)
+    os.environ["DJANGO_SETTINGS_MODULE"] = settings_module
+    args = [arg.replace("{output_dir}", output_dir) for arg in args]
+    result = {}
+
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    import django
+    from django.core.management import call_command
+
+    django.setup()
+    result["setup_wall"] = time.perf_counter() - wall_start
+    result["setup_cpu"] = time.process_time() - cpu_start
+
+    # rich and the markdown writers print to sys.stdout directly, rather than to the command's stdout
+    output = CountingWriter()
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    with redirect_stdout(output):
+        call_command(command, *args, stdout=output, stderr=output)
+    result["command_wall"] = time.perf_counter() - wall_start
+    result["command_cpu"] = time.process_time() - cpu_start
+    result["output_chars"] = output.count
+    result["file_bytes"] = get_directory_size(output_dir)
+
+    sys.__stdout__.write(json.dumps(result) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Synthetic Django schemas for benchmarking the management commands."""
+
+import os
+import random
+from dataclasses import dataclass
+
+import django
+
+
+def setup_django(settings_module: str = "example_project.settings") -> None:
+    """Configure Django so benchmarks can be run as plain scripts from the repository root."""
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", settings_module)
+    django.setup()
+
+
+@dataclass
+class SchemaSpec:
+    """Shape of a synthetic schema.
+
+    The ``*_per_model`` values are averages: a value of ``1.5`` gives every model one relation of that kind, and
+    half of the models a second one. Relations always point at models that were created earlier, so the schema
+    can be built in a single pass.
+    """
+
+    apps: int = 10
+    models_per_app: int = 50
+    fields_per_model: int = 8
+    fk_per_model: float = 1.0
+    m2m_per_model: float = 0.2
+    o2o_per_model: float = 0.1
+    seed: int = 0
+
+    @property
+    def model_count(self) -> int:
+        """Total number of concrete models in the schema."""
+        return self.apps * self.models_per_app
+
+
+def _relation_count(rng: random.Random, per_model: float) -> int:
+    """Turn an average relation count into a whole number for one model."""
+    whole = int(per_model)
+    return whole + (1 if rng.random() < per_model - whole else 0)
+
+
+def build_synthetic_models(spec: SchemaSpec) -> list:
+    """Create the models described by ``spec`` in an isolated app registry and return them.
+
+    The models never touch ``django.apps.apps``, so they do not leak into the project the benchmark runs in.
+    """
+    from django.apps.registry import Apps
+    from django.db import models
+    from django.db.migrations.state import AppConfigStub
+
+    app_labels = [f"bench_app_{app_index}" for app_index in range(spec.apps)]
+    registry = Apps([AppConfigStub(label) for label in app_labels])
+    rng = random.Random(spec.seed)
+    model_list = []
+
+    for app_label in app_labels:
+        for model_index in range(spec.models_per_app):
+            model_name = f"Model{model_index}"
+            attrs = {
+                "__module__": __name__,
+                "Meta": type("Meta", (), {"app_label": app_label, "apps": registry}),
+            }
+            for field_index in range(spec.fields_per_model):
+                attrs[f"field_{field_index}"] = models.CharField(max_length=50, blank=True)
+
+            if model_list:
+                for relation_index in range(_relation_count(rng, spec.fk_per_model)):
+                    attrs[f"fk_{relation_index}"] = models.ForeignKey(
+                        rng.choice(model_list),
+                        on_delete=models.CASCADE,
+                        related_name=f"{app_label}_{model_name.lower()}_fk_{relation_index}",
+                    )
+                for relation_index in range(_relation_count(rng, spec.m2m_per_model)):
+                    attrs[f"m2m_{relation_index}"] = models.ManyToManyField(
+                        rng.choice(model_list),
+                        related_name=f"{app_label}_{model_name.lower()}_m2m_{relation_index}",
+                    )
+                for relation_index in range(_relation_count(rng, spec.o2o_per_model)):
+                    attrs[f"o2o_{relation_index}"] = models.OneToOneField(
+                        rng.choice(model_list),
+                        on_delete=models.CASCADE,
+                        related_name=f"{app_label}_{model_name.lower()}_o2o_{relation_index}",
+                    )
+
+            model_list.append(type(model_name, (models.Model,), attrs))
+
+    return model_list
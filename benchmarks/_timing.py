@@ -0,0 +1,23 @@
+"""Timing helpers shared by the benchmark scripts."""
+
+import time
+from collections.abc import Callable
+
+
+def best_of(func: Callable[[], object], repeat: int = 5) -> float:
+    """Run ``func`` ``repeat`` times and return the fastest wall time in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def print_comparison(title: str, before: float, after: float, before_label: str = "before", after_label: str = "after"):
+    """Print two timings side by side with the speedup between them."""
+    speedup = before / after if after else float("inf")
+    print(f"{title}")
+    print(f"  {before_label:<12} {before * 1000:10.2f} ms")
+    print(f"  {after_label:<12} {after * 1000:10.2f} ms")
+    print(f"  speedup      {speedup:10.2f}x")
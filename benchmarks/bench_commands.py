@@ -0,0 +1,150 @@
+"""Time every management command and output format against a synthetic project written to disk.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_commands --apps 10 --models-per-app 50 --output results.json
+
+Each run of each scenario is a fresh process, so timings include Django setup and cold caches, as a real
+invocation does. A summary table is printed, and ``--output`` writes every run, the schema, and the versions of
+Python, Django and django-model-info as JSON, so results can be compared across releases.
+
+The ``modelgraph-dot`` scenario is skipped unless Graphviz's ``dot`` is on the path.
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, fields
+from importlib.metadata import version
+from pathlib import Path
+
+from ._project import ProjectSpec, write_project
+
+REPOSITORY_ROOT = Path(__file__).resolve().parent.parent
+
+SCENARIOS = {
+    "modelinfo-v0": ["modelinfo", "-v", "0"],
+    "modelinfo-v1": ["modelinfo", "-v", "1"],
+    "modelinfo-v2": ["modelinfo", "-v", "2"],
+    "modelinfo-v3": ["modelinfo", "-v", "3"],
+    "modelinfo-markdown": ["modelinfo", "--markdown"],
+    "modelinfo-ndjson": ["modelinfo", "--format", "ndjson"],
+    "modelinfo-plain": ["modelinfo", "--renderer", "plain"],
+    "modelinfo-tsv": ["modelinfo", "--renderer", "tsv"],
+    "modelinfo-html": ["modelinfo", "-o", "{output_dir}/modelinfo.html"],
+    "modelinfo-output-dir": ["modelinfo", "--output-dir", "{output_dir}/docs"],
+    "modelfilters": ["modelfilters", "{model}", "--max-depth", "{max_depth}"],
+    "modelfilters-markdown": ["modelfilters", "{model}", "--max-depth", "{max_depth}", "--markdown"],
+    "modelgraph-analysis": ["modelgraph", "-f", "analysis"],
+    "modelgraph-mermaid": ["modelgraph", "-f", "mermaid"],
+    "modelgraph-dot": ["modelgraph", "-f", "dot", "-o", "{output_dir}/graph.dot"],
+    "migrationgraph": ["migrationgraph"],
+}
+"""Scenario names and the command line each runs. ``{output_dir}`` is an empty directory for each run."""
+
+
+def get_versions() -> dict:
+    """Get the versions of everything that affects the timings."""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "django": version("django"),
+        "django_model_info": version("django-model-info"),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def run_scenario(project_dir: Path, spec: ProjectSpec, command_line: list[str]) -> dict:
+    """Run one scenario in a fresh process, and return the timings it reports."""
+    with tempfile.TemporaryDirectory() as output_dir:
+        process = subprocess.run(
+            [sys.executable, "-m", "benchmarks._runner", str(project_dir), spec.settings_module, output_dir]
+            + command_line,
+            cwd=REPOSITORY_ROOT,
+            env={**os.environ, "COLUMNS": "200", "PYTHONHASHSEED": "0"},
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    if process.returncode:
+        raise RuntimeError(f"{' '.join(command_line)} failed:\n{process.stderr}")
+    return json.loads(process.stdout.strip().splitlines()[-1])
+
+
+def summarize(runs: list[dict], key: str) -> dict:
+    """Summarize one of the timings across runs."""
+    values = [run[key] for run in runs]
+    return {"min": min(values), "median": statistics.median(values), "max": max(values)}
+
+
+def main():
+    """Write the synthetic project, run each scenario, then print and optionally save the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    for spec_field in fields(ProjectSpec):
+        parser.add_argument(f"--{spec_field.name.replace('_', '-')}", type=type(spec_field.default))
+    parser.add_argument("--max-depth", type=int, default=3, help="--max-depth for the modelfilters scenarios")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per scenario")
+    parser.add_argument("--scenario", nargs="+", choices=list(SCENARIOS), help="Only run these scenarios")
+    parser.add_argument("--project-dir", type=Path, help="Write the project here and keep it, instead of a temp dir")
+    parser.add_argument("--output", type=Path, help="Write the results to this JSON file")
+    args = parser.parse_args()
+
+    spec = ProjectSpec(
+        **{f.name: getattr(args, f.name) for f in fields(ProjectSpec) if getattr(args, f.name) is not None}
+    )
+    scenario_names = args.scenario or list(SCENARIOS)
+    if shutil.which("dot") is None and "modelgraph-dot" in scenario_names:
+        print("Skipping modelgraph-dot, since Graphviz's dot is not on the path")
+        scenario_names.remove("modelgraph-dot")
+    placeholders = {
+        "{model}": f"{spec.app_labels[-1]}.Model{spec.models_per_app - 1}",
+        "{max_depth}": str(args.max_depth),
+    }
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        project_dir = args.project_dir or Path(temp_dir)
+        write_project(spec, project_dir)
+
+        results = []
+        print(f"{'scenario':<24} {'min (s)':>10} {'median (s)':>12} {'cpu (s)':>10} {'setup (s)':>10} {'output':>12}")
+        for name in scenario_names:
+            command_line = [placeholders.get(arg, arg) for arg in SCENARIOS[name]]
+            runs = [run_scenario(project_dir, spec, command_line) for _ in range(args.repeat)]
+            result = {
+                "name": name,
+                "command": command_line,
+                "runs": runs,
+                "command_wall": summarize(runs, "command_wall"),
+                "command_cpu": summarize(runs, "command_cpu"),
+                "setup_wall": summarize(runs, "setup_wall"),
+            }
+            results.append(result)
+            output_size = runs[0]["output_chars"] + runs[0]["file_bytes"]
+            print(
+                f"{name:<24} {result['command_wall']['min']:>10.3f} {result['command_wall']['median']:>12.3f} "
+                f"{result['command_cpu']['median']:>10.3f} {result['setup_wall']['median']:>10.3f} {output_size:>12,}"
+            )
+
+    if args.output:
+        report = {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "versions": get_versions(),
+            "spec": asdict(spec),
+            "max_depth": args.max_depth,
+            "repeat": args.repeat,
+            "scenarios": results,
+        }
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Compare resolving every field's database type through the default connection proxy against modelinfo's lookup.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_db_type --apps 20 --models-per-app 100
+
+The lookup uses a connection resolved once, instead of the thread-local proxy, and memoizes foreign key types
+per target field.
+"""
+
+import argparse
+
+from ._schema import SchemaSpec, build_synthetic_models, setup_django
+from ._timing import best_of, print_comparison
+
+
+def main():
+    """Resolve the database type of every field of every synthetic model, both ways."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--apps", type=int, default=20)
+    parser.add_argument("--models-per-app", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.db import connection, connections
+
+    from django_model_info.management.commands.modelinfo_utils import _field_attr_utils
+
+    model_list = build_synthetic_models(SchemaSpec(apps=args.apps, models_per_app=args.models_per_app))
+    field_list = [field for model in model_list for field in model._meta.get_fields()]
+
+    def direct():
+        for field in field_list:
+            try:
+                str(field.db_type(connection=connection))
+            except (AttributeError, TypeError):
+                pass
+
+    def resolved():
+        # Start from an empty cache each time, so filling it is part of the measurement
+        _field_attr_utils.DB_TYPE_CACHE.clear()
+        default_connection = connections["default"]
+        for field in field_list:
+            _field_attr_utils.resolve_db_type(field, default_connection)
+
+    before = best_of(direct, args.repeat)
+    after = best_of(resolved, args.repeat)
+    print_comparison(f"Database type lookups, {len(field_list)} fields", before, after, "proxy", "resolved")
+
+
+if __name__ == "__main__":
+    main()
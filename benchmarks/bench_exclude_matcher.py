@@ -0,0 +1,158 @@
+"""Compare modelfilters traversals checking compiled exclude patterns against matching every pattern per field.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_exclude_matcher --apps 4 --models-per-app 25 --depths 4 5 --extra-patterns 0 20
+
+Before the patterns were compiled, every field was checked twice, and each check looped over every pattern,
+converted the field path and model name to snake case with regular expressions and split the model path. Now the
+patterns are compiled once per run, names are normalized once per field in the relation index, and each step of
+the walk only checks the model it enters and the end of the field path. ``--extra-patterns`` adds patterns that
+match nothing, as a long ``--exclude`` list would.
+"""
+
+import argparse
+
+from ._schema import SchemaSpec, build_synthetic_models, setup_django
+from ._timing import best_of, print_comparison
+
+
+def main():
+    """Traverse a sample of root models of a dense synthetic schema at each depth, both ways."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--apps", type=int, default=4)
+    parser.add_argument("--models-per-app", type=int, default=25)
+    parser.add_argument("--fk-per-model", type=float, default=1.5)
+    parser.add_argument("--m2m-per-model", type=float, default=0.3)
+    parser.add_argument("--roots", type=int, default=5, help="Number of root models traversed per run")
+    parser.add_argument("--depths", type=int, nargs="+", default=[4, 5])
+    parser.add_argument("--extra-patterns", type=int, nargs="+", default=[0, 20])
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    setup_django()
+    from django_model_info.management.commands.modelfilters_utils._field_utils import (
+        FilterConfig,
+        RelationIndex,
+        check_redundant,
+        get_fields,
+        matches_target_filters,
+        normalize_model_name,
+    )
+
+    def legacy_should_skip_field(full_field, model_name, model_path, excludes):
+        """``should_skip_field`` before the patterns were compiled."""
+        if not excludes:
+            return False
+        normalized_field_path = normalize_model_name(full_field)
+        normalized_current_model = normalize_model_name(model_name)
+        model_paths = model_path.split(",")
+        for exclude_pattern in excludes:
+            if "__" in exclude_pattern:
+                if exclude_pattern.lower() in normalized_field_path:
+                    return True
+            elif "." in exclude_pattern:
+                exclude_app, exclude_model = exclude_pattern.split(".")
+                exclude_app = exclude_app.lower()
+                normalized_exclude_model = normalize_model_name(exclude_model)
+                for path in model_paths:
+                    if "." in path:
+                        path_app, path_model = path.split(".")
+                        if (
+                            path_app.lower() == exclude_app
+                            and normalize_model_name(path_model) == normalized_exclude_model
+                        ):
+                            return True
+            else:
+                normalized_exclude = normalize_model_name(exclude_pattern)
+                for path in model_paths:
+                    if "." in path:
+                        _, path_model = path.split(".")
+                        if normalize_model_name(path_model) == normalized_exclude:
+                            return True
+                if normalized_exclude == normalized_current_model:
+                    return True
+        return False
+
+    def legacy_get_fields(Model, filter_config, relation_index):
+        """The explicit-stack traversal ``get_fields`` used before, without max_paths and target filters."""
+        excludes = filter_config.excludes
+        model_stack = [Model]
+        adjacency = relation_index[Model]
+        frames = [(iter(adjacency.edges), Model, adjacency, "", adjacency.label)]
+        seen = set()
+        out_fields = []
+        while frames:
+            edges, model, adjacency, parent_field, path = frames[-1]
+            for edge in edges:
+                full_field = f"{parent_field}__{edge.name}" if parent_field else edge.name
+                key = (full_field, adjacency.name, edge.name, edge.type_name)
+                if (
+                    key not in seen
+                    and not legacy_should_skip_field(full_field, adjacency.name, path, excludes)
+                    and matches_target_filters(model, edge.name, None, None)
+                ):
+                    seen.add(key)
+                    out_fields.append([*key, path])
+                RelModel = edge.related_model
+                if RelModel is not None:
+                    model_stack.append(RelModel)
+                    if not check_redundant(model_stack, 2, filter_config.max_depth) and not legacy_should_skip_field(
+                        full_field, RelModel.__name__, path, excludes
+                    ):
+                        related = relation_index[RelModel]
+                        frames.append((iter(related.edges), RelModel, related, full_field, f"{path},{related.label}"))
+                        break
+                    model_stack.pop()
+            else:
+                frames.pop()
+                model_stack.pop()
+        return out_fields
+
+    spec = SchemaSpec(
+        apps=args.apps,
+        models_per_app=args.models_per_app,
+        fk_per_model=args.fk_per_model,
+        m2m_per_model=args.m2m_per_model,
+    )
+    model_list = build_synthetic_models(spec)
+    roots = model_list[:: max(1, len(model_list) // args.roots)][: args.roots]
+    excluded_model = model_list[-1]
+    relation_index = RelationIndex()
+
+    for extra_patterns in args.extra_patterns:
+        excludes = [
+            "permissions",
+            "comment",
+            "content_type",
+            excluded_model._meta.label,
+            *(f"Unused{number}" if number % 2 else f"unused__field{number}" for number in range(extra_patterns)),
+        ]
+        for depth in args.depths:
+            filter_config = FilterConfig(excludes, depth, None, None, None, None)
+
+            def legacy():
+                return [legacy_get_fields(root, filter_config, relation_index) for root in roots]
+
+            def compiled():
+                return [get_fields(root, filter_config=filter_config, relation_index=relation_index) for root in roots]
+
+            rows = compiled()
+            if rows != legacy():
+                raise AssertionError(f"The traversals found different rows at depth {depth}")
+            row_count = sum(len(root_rows) for root_rows in rows)
+            del rows
+
+            before = best_of(legacy, args.repeat)
+            after = best_of(compiled, args.repeat)
+            print_comparison(
+                f"--max-depth {depth}, {len(excludes)} patterns, {len(roots)} roots, {row_count} rows",
+                before,
+                after,
+                "per pattern",
+                "compiled",
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Compare the single-pass field index against the previous three-scan field classification.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_field_index --apps 14 --models-per-app 100
+"""
+
+import argparse
+
+from ._schema import SchemaSpec, build_synthetic_models, setup_django
+from ._timing import best_of, print_comparison
+
+
+def classify_with_three_scans(model):
+    """The classification ``ModelProcessor`` used before the field index: one ``get_fields`` walk per group."""
+    relations = [
+        field
+        for field in model._meta.get_fields(include_hidden=True)
+        if hasattr(field, "related_model")
+        and field.related_model is not None
+        and "reverse_related" not in str(field.__class__.__module__)
+    ]
+    reverse_relations = [
+        field
+        for field in model._meta.get_fields(include_hidden=True)
+        if hasattr(field, "related_model")
+        and field.related_model is not None
+        and "reverse_related" in str(field.__class__.__module__)
+    ]
+    # Mirrors the original build_other_field_info() condition, which kept every field not in COMMON_DJANGO_FIELDS.
+    others = [
+        field
+        for field in model._meta.get_fields(include_hidden=True)
+        if getattr(field, "related_model", None) is None and (True, False) or field.name not in ()
+    ]
+    return relations, reverse_relations, others
+
+
+def main():
+    """Build the synthetic schema and time both classification strategies over every model."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--apps", type=int, default=14)
+    parser.add_argument("--models-per-app", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    setup_django()
+    from django_model_info.management.commands.modelinfo_utils._field_index import build_field_index
+
+    model_list = build_synthetic_models(SchemaSpec(apps=args.apps, models_per_app=args.models_per_app))
+    # Warm Django's own get_fields() cache so both strategies are measured on equal footing.
+    for model in model_list:
+        model._meta.get_fields(include_hidden=True)
+
+    before = best_of(lambda: [classify_with_three_scans(model) for model in model_list], args.repeat)
+    after = best_of(lambda: [build_field_index(model) for model in model_list], args.repeat)
+    print_comparison(f"Field classification, {len(model_list)} models", before, after, "three scans", "field index")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Compare manager discovery through a dir(model) scan against the static class dict scan.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_manager_discovery --fields-per-model 60
+"""
+
+import argparse
+
+from ._schema import SchemaSpec, build_synthetic_models, setup_django
+from ._timing import best_of, print_comparison
+
+
+def main():
+    """Find the managers of every synthetic model with both discovery strategies."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--apps", type=int, default=5)
+    parser.add_argument("--models-per-app", type=int, default=40)
+    parser.add_argument("--fields-per-model", type=int, default=60)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    setup_django()
+    from django_model_info.management.commands.modelinfo_utils._manager_utils import (
+        discover_model_managers,
+        scan_model_managers,
+    )
+
+    spec = SchemaSpec(
+        apps=args.apps, models_per_app=args.models_per_app, fields_per_model=args.fields_per_model, fk_per_model=3
+    )
+    model_list = build_synthetic_models(spec)
+
+    before = best_of(lambda: [scan_model_managers(model) for model in model_list], args.repeat)
+    after = best_of(lambda: [discover_model_managers(model) for model in model_list], args.repeat)
+    print_comparison(f"Manager discovery, {len(model_list)} models", before, after, "dir() scan", "class dicts")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Compare method introspection with and without the shared method cache.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_method_cache --apps 5 --models-per-app 40
+"""
+
+import argparse
+
+from ._schema import SchemaSpec, build_synthetic_models, setup_django
+from ._timing import best_of, print_comparison
+
+
+def main():
+    """Build method records for every synthetic model at verbosity 3, with the cache disabled and enabled."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--apps", type=int, default=5)
+    parser.add_argument("--models-per-app", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    setup_django()
+    from django_model_info.management.commands.modelinfo import ModelProcessor, get_clean_method_list
+    from django_model_info.management.commands.modelinfo_utils._method_attr_utils import method_cache
+
+    model_list = build_synthetic_models(SchemaSpec(apps=args.apps, models_per_app=args.models_per_app))
+    method_lists = {model: get_clean_method_list(model) for model in model_list}
+
+    def build_all_methods():
+        method_cache.clear()
+        for model in model_list:
+            ModelProcessor(model, 3, exclude_defaults=False).build_method_info(method_lists[model])
+
+    maxsize = method_cache.maxsize
+    method_cache.maxsize = 0
+    before = best_of(build_all_methods, args.repeat)
+    method_cache.maxsize = maxsize
+    after = best_of(build_all_methods, args.repeat)
+    print_comparison(
+        f"Method introspection at verbosity 3, {len(model_list)} models", before, after, "uncached", "cached"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""Compare building every ModelInfo row against building only the rows shown at verbosity 1.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_modelinfo_rows --apps 5 --models-per-app 40
+"""
+
+import argparse
+
+from ._schema import SchemaSpec, build_synthetic_models, setup_django
+from ._timing import best_of, print_comparison
+
+
+def main():
+    """Build the model information for every synthetic model with all rows, and with the verbosity 1 rows."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--apps", type=int, default=5)
+    parser.add_argument("--models-per-app", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    setup_django()
+    from django_model_info.management.commands.modelinfo import ModelProcessor, get_modelinfo_row_count
+
+    model_list = build_synthetic_models(SchemaSpec(apps=args.apps, models_per_app=args.models_per_app))
+
+    def build_all(modelinfo_rows):
+        for model in model_list:
+            ModelProcessor(model, 1, exclude_defaults=False, modelinfo_rows=modelinfo_rows).build_modelinfo()
+
+    before = best_of(lambda: build_all(None), args.repeat)
+    after = best_of(lambda: build_all(get_modelinfo_row_count(1)), args.repeat)
+    print_comparison(f"Model info at verbosity 1, {len(model_list)} models", before, after, "all rows", "shown rows")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Compare the memory held by modelinfo records in the slotted layout against the previous dataclass layout.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_record_memory --apps 50 --models-per-app 100
+
+Both layouts reference the same strings, so the numbers are the cost of the record containers themselves.
+"""
+
+import argparse
+import tracemalloc
+from dataclasses import dataclass, field, fields, make_dataclass
+
+from ._schema import SchemaSpec, build_synthetic_models, setup_django
+
+
+@dataclass
+class LegacyAnnotated:
+    """The title and value pair that every ``ModelInfo`` row used to be stored as."""
+
+    title: str = ""
+    value: str = ""
+
+
+def legacy_class(cls: type) -> type:
+    """Make a dict-backed dataclass with the same fields as one of the slotted info classes."""
+    return make_dataclass(f"Legacy{cls.__name__}", [(f.name, f.type, field(default="")) for f in fields(cls)])
+
+
+def to_legacy(record, legacy_classes: dict):
+    """Copy a record into the previous layout: dict-backed instances, and one ``LegacyAnnotated`` per row."""
+    from django_model_info.management.commands.modelinfo_utils._info_classes import MODELINFO_TITLES
+
+    modelinfo = {
+        name: LegacyAnnotated(title, getattr(record.modelinfo, name)) for name, title in MODELINFO_TITLES.items()
+    }
+    modelinfo["managers_info"] = record.modelinfo.managers_info
+
+    def copy_rows(rows):
+        return [legacy_classes[type(row)](*(getattr(row, f.name) for f in fields(row))) for row in rows]
+
+    return legacy_classes["ModelRecord"](
+        label=record.label,
+        modelinfo=legacy_classes["ModelInfo"](**modelinfo),
+        fields_other=copy_rows(record.fields_other),
+        fields_relation=copy_rows(record.fields_relation),
+        fields_reverse_relation=copy_rows(record.fields_reverse_relation),
+        method_info=tuple(copy_rows(methods) for methods in record.method_info),
+    )
+
+
+def to_slotted(record):
+    """Copy a record into the current layout, so both copies are measured the same way."""
+    from django_model_info.management.commands.modelinfo_utils._info_classes import ModelInfo, ModelRecord
+
+    def copy_rows(rows):
+        return [type(row)(*(getattr(row, f.name) for f in fields(row))) for row in rows]
+
+    modelinfo = ModelInfo(*(getattr(record.modelinfo, f.name) for f in fields(record.modelinfo)))
+    return ModelRecord(
+        label=record.label,
+        modelinfo=modelinfo,
+        fields_other=copy_rows(record.fields_other),
+        fields_relation=copy_rows(record.fields_relation),
+        fields_reverse_relation=copy_rows(record.fields_reverse_relation),
+        method_info=tuple(copy_rows(methods) for methods in record.method_info),
+    )
+
+
+def measure(func) -> int:
+    """Get the number of bytes still allocated after running ``func``, while its result is alive."""
+    tracemalloc.start()
+    result = func()
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return allocated
+
+
+def main():
+    """Build the records for every synthetic model, then measure a copy of them in each layout."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--apps", type=int, default=50)
+    parser.add_argument("--models-per-app", type=int, default=100)
+    parser.add_argument("--verbosity", type=int, default=3)
+    args = parser.parse_args()
+
+    setup_django()
+    from django_model_info.management.commands.modelinfo import build_model_record
+    from django_model_info.management.commands.modelinfo_utils._info_classes import (
+        MODELINFO_TITLES,
+        FieldOther,
+        FieldRelation,
+        FieldReverseRelation,
+        Method,
+        ModelRecord,
+    )
+
+    legacy_classes = {cls: legacy_class(cls) for cls in (FieldOther, FieldRelation, FieldReverseRelation, Method)}
+    legacy_classes["ModelInfo"] = make_dataclass(
+        "LegacyModelInfo",
+        [(name, object, field(default=None)) for name in (*MODELINFO_TITLES, "managers_info")],
+    )
+    legacy_classes["ModelRecord"] = legacy_class(ModelRecord)
+
+    model_list = build_synthetic_models(SchemaSpec(apps=args.apps, models_per_app=args.models_per_app))
+    records = [build_model_record(model, args.verbosity, False, False) for model in model_list]
+    row_count = sum(
+        len(record.fields_other) + len(record.fields_relation) + len(record.fields_reverse_relation)
+        for record in records
+    ) + sum(len(methods) for record in records for methods in record.method_info)
+
+    before = measure(lambda: [to_legacy(record, legacy_classes) for record in records])
+    after = measure(lambda: [to_slotted(record) for record in records])
+    print(f"Record containers, {len(records)} models, {row_count} field and method rows, verbosity {args.verbosity}")
+    print(f"  dataclasses  {before / 2**20:10.2f} MiB")
+    print(f"  slotted      {after / 2**20:10.2f} MiB")
+    print(f"  saving       {(1 - after / before) * 100:10.1f} %")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Compare modelfilters traversals reading from a per-run relation index against rebuilding field lists per visit.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_relation_index --apps 4 --models-per-app 25 --depths 4 5 6
+
+The number of paths grows quickly with depth on a dense schema, so a run at ``--max-depth 6`` takes about a minute.
+
+Before the index, every visit to a model concatenated ``_meta.fields``, ``_meta.many_to_many`` and
+``_meta.get_fields()``, so forward relations appeared twice and their subtrees were walked twice. The index
+builds each model's fields once per run, without duplicates.
+"""
+
+import argparse
+
+from ._schema import SchemaSpec, build_synthetic_models, setup_django
+from ._timing import best_of, print_comparison
+
+
+def main():
+    """Traverse a sample of root models of a dense synthetic schema at each depth, both ways."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--apps", type=int, default=4)
+    parser.add_argument("--models-per-app", type=int, default=25)
+    parser.add_argument("--fk-per-model", type=float, default=1.5)
+    parser.add_argument("--m2m-per-model", type=float, default=0.3)
+    parser.add_argument("--roots", type=int, default=5, help="Number of root models traversed per run")
+    parser.add_argument("--depths", type=int, nargs="+", default=[4, 5, 6])
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    setup_django()
+    from django_model_info.management.commands.modelfilters_utils._field_utils import (
+        ModelAdjacency,
+        RelationIndex,
+        build_field_edge,
+        get_ordered_fields,
+    )
+
+    class RebuiltOnEveryVisit(RelationIndex):
+        """The previous behaviour: each visit builds the model's field list again, duplicates included."""
+
+        def __getitem__(self, model):
+            meta = model._meta
+            edges = tuple(build_field_edge(field) for field in (*meta.fields, *meta.many_to_many, *meta.get_fields()))
+            return ModelAdjacency(name=model.__name__, label=meta.label, edges=edges)
+
+    spec = SchemaSpec(
+        apps=args.apps,
+        models_per_app=args.models_per_app,
+        fk_per_model=args.fk_per_model,
+        m2m_per_model=args.m2m_per_model,
+    )
+    model_list = build_synthetic_models(spec)
+    roots = model_list[:: max(1, len(model_list) // args.roots)][: args.roots]
+
+    for depth in args.depths:
+
+        def traverse(relation_index_class):
+            relation_index = relation_index_class()
+            return [get_ordered_fields(root, max_depth=depth, relation_index=relation_index) for root in roots]
+
+        rows = traverse(RelationIndex)
+        if rows != traverse(RebuiltOnEveryVisit):
+            raise AssertionError(f"The traversals found different rows at depth {depth}")
+
+        before = best_of(lambda: traverse(RebuiltOnEveryVisit), args.repeat)
+        after = best_of(lambda: traverse(RelationIndex), args.repeat)
+        row_count = sum(len(root_rows) for root_rows in rows)
+        print_comparison(
+            f"--max-depth {depth}, {len(roots)} roots, {row_count} rows", before, after, "per visit", "index"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Compare rendering throughput of the rich tables against the plain renderer, in models per second.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_renderers --apps 5 --models-per-app 40 --verbosity 2
+
+Records are built once up front, so only rendering is measured.
+"""
+
+import argparse
+from io import StringIO
+
+from ._schema import SchemaSpec, build_synthetic_models, setup_django
+from ._timing import best_of, print_comparison
+
+
+def main():
+    """Render the records of every synthetic model with rich and with the plain renderer."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--apps", type=int, default=5)
+    parser.add_argument("--models-per-app", type=int, default=40)
+    parser.add_argument("--verbosity", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    setup_django()
+    from rich.console import Console
+
+    from django_model_info.management.commands.modelinfo import (
+        Command,
+        build_model_record,
+        get_modelinfo_row_count,
+    )
+    from django_model_info.management.commands.modelinfo_utils._plain_renderer import PlainRenderer
+
+    model_list = build_synthetic_models(SchemaSpec(apps=args.apps, models_per_app=args.models_per_app))
+    modelinfo_rows = get_modelinfo_row_count(args.verbosity)
+    records = [(model, build_model_record(model, args.verbosity, False, False, modelinfo_rows)) for model in model_list]
+
+    def render_rich():
+        command = Command()
+        command.verbosity, command.exclude_defaults = args.verbosity, False
+        command.console = Console(file=StringIO(), width=200)
+        for model, record in records:
+            command.render_record(model, record)
+
+    def render_plain():
+        renderer = PlainRenderer(StringIO(), args.verbosity, exclude_defaults=False)
+        for model, record in records:
+            renderer.render_model(model, record, modelinfo_rows)
+
+    before = best_of(render_rich, args.repeat)
+    after = best_of(render_plain, args.repeat)
+    print_comparison(f"Rendering at verbosity {args.verbosity}, {len(records)} models", before, after, "rich", "plain")
+    print(f"  rich         {len(records) / before:10.1f} models/s")
+    print(f"  plain        {len(records) / after:10.1f} models/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Compare line number lookups through inspect.getsourcelines against the per-file source index.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_source_index
+"""
+
+import argparse
+import inspect
+
+from ._schema import setup_django
+from ._timing import best_of, print_comparison
+
+
+def main():
+    """Look up the line number of every model and model method in the example project, both ways."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    setup_django()
+    from django.apps import apps
+
+    from django_model_info.management.commands.modelinfo import get_clean_method_list
+    from django_model_info.management.commands.modelinfo_utils._source_index import (
+        find_source_line_number,
+        get_source_index,
+    )
+
+    objects = []
+    for model in apps.get_models():
+        objects.append(model)
+        objects.extend(getattr(model, name) for name in get_clean_method_list(model) if hasattr(model, name))
+
+    def lookup(find_line_number):
+        for obj in objects:
+            try:
+                find_line_number(obj)
+            except (OSError, TypeError):
+                pass
+
+    def lookup_with_index():
+        # Start from an empty index each time, so parsing the files is part of the measurement
+        get_source_index.cache_clear()
+        lookup(find_source_line_number)
+
+    before = best_of(lambda: lookup(lambda obj: inspect.getsourcelines(obj)[1]), args.repeat)
+    after = best_of(lookup_with_index, args.repeat)
+    print_comparison(f"Line number lookups, {len(objects)} objects", before, after, "inspect", "source index")
+
+
+if __name__ == "__main__":
+    main()
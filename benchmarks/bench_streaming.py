@@ -0,0 +1,97 @@
+"""Compare modelfilters' streamed paths against building and sorting the full list of paths.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_streaming --apps 4 --models-per-app 25 --depth 5 --max-paths 100
+
+``get_ordered_fields`` finds every path and sorts them before returning any. ``iter_ordered_fields`` yields paths
+as they are found: in the order found, by depth by walking the relations again for each depth, or by model by
+walking them again for each model name. For each ordering, this reports the time to the first path, the time to
+the last one, and the peak memory of consuming the paths one at a time, measured with ``tracemalloc`` in a
+separate pass. The last line is the ordering-free walk stopped at ``--max-paths``.
+"""
+
+import argparse
+import time
+import tracemalloc
+from collections import deque
+
+from ._schema import SchemaSpec, build_synthetic_models, setup_django
+
+
+def first_and_last(make_rows):
+    """Time the first and the last row of the rows ``make_rows`` returns, consumed one at a time."""
+    start = time.perf_counter()
+    rows = iter(make_rows())
+    next(rows, None)
+    first = time.perf_counter() - start
+    deque(rows, maxlen=0)
+    return first, time.perf_counter() - start
+
+
+def peak_memory(make_rows):
+    """Measure the peak memory of consuming the rows ``make_rows`` returns, one at a time."""
+    tracemalloc.start()
+    deque(make_rows(), maxlen=0)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    """Consume the paths of a sample of root models of a dense synthetic schema, sorted and streamed."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--apps", type=int, default=4)
+    parser.add_argument("--models-per-app", type=int, default=25)
+    parser.add_argument("--fk-per-model", type=float, default=1.5)
+    parser.add_argument("--m2m-per-model", type=float, default=0.3)
+    parser.add_argument("--roots", type=int, default=5, help="Number of root models traversed per run")
+    parser.add_argument("--depth", type=int, default=5)
+    parser.add_argument("--max-paths", type=int, default=100)
+    args = parser.parse_args()
+
+    setup_django()
+    from django_model_info.management.commands.modelfilters_utils._field_utils import (
+        RelationIndex,
+        get_ordered_fields,
+        iter_ordered_fields,
+    )
+
+    spec = SchemaSpec(
+        apps=args.apps,
+        models_per_app=args.models_per_app,
+        fk_per_model=args.fk_per_model,
+        m2m_per_model=args.m2m_per_model,
+    )
+    model_list = build_synthetic_models(spec)
+    roots = model_list[:: max(1, len(model_list) // args.roots)][: args.roots]
+    relation_index = RelationIndex()
+    for root in roots:
+        get_ordered_fields(root, max_depth=args.depth, relation_index=relation_index)
+
+    print(f"--max-depth {args.depth}, {len(roots)} roots")
+    print(f"  {'':28} {'first (ms)':>11} {'last (ms)':>11} {'peak (MiB)':>11}")
+    orderings = {"unordered": {}, "--by-depth": {"by_depth": True}, "--by-model": {"by_model": True}}
+    cases = [
+        (f"{label}, {way}", function, options)
+        for label, options in orderings.items()
+        for way, function in (("sorted", get_ordered_fields), ("streamed", iter_ordered_fields))
+    ]
+    cases.append((f"--max-paths {args.max_paths}, streamed", iter_ordered_fields, {"max_paths": args.max_paths}))
+
+    for label, function, options in cases:
+
+        def make_rows(function=function, options=options):
+            return (
+                row
+                for root in roots
+                for row in function(root, max_depth=args.depth, relation_index=relation_index, **options)
+            )
+
+        first, last = first_and_last(make_rows)
+        peak = peak_memory(make_rows)
+        print(f"  {label:28} {first * 1000:11.2f} {last * 1000:11.2f} {peak / 1024 / 1024:11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""Compare modelfilters' explicit-stack traversal against the recursive traversal it replaced.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_traversal --apps 4 --models-per-app 25 --depths 4 5 6
+
+Both traversals read from the same relation index and find the same rows.
+The recursive walk built a ``PathTracker``, a copy of the model stack, a model path list and its joined string for
+every relation it followed, re-joined the path for every field, and copied each child's rows into its parent's
+list on the way back up. Peak memory is measured with ``tracemalloc``, in a separate pass from the timings.
+The explicit stack now also checks compiled exclude patterns once per step, see ``bench_exclude_matcher``, so its
+speedup includes that as well.
+"""
+
+import argparse
+import tracemalloc
+
+from ._schema import SchemaSpec, build_synthetic_models, setup_django
+from ._timing import best_of, print_comparison
+
+
+def main():
+    """Traverse a sample of root models of a dense synthetic schema at each depth, both ways."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--apps", type=int, default=4)
+    parser.add_argument("--models-per-app", type=int, default=25)
+    parser.add_argument("--fk-per-model", type=float, default=1.5)
+    parser.add_argument("--m2m-per-model", type=float, default=0.3)
+    parser.add_argument("--roots", type=int, default=5, help="Number of root models traversed per run")
+    parser.add_argument("--depths", type=int, nargs="+", default=[4, 5, 6])
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    setup_django()
+    from django_model_info.management.commands.modelfilters_utils._field_utils import (
+        FilterConfig,
+        PathTracker,
+        RelationIndex,
+        check_redundant,
+        get_fields,
+        get_full_field,
+        matches_target_field_type,
+        matches_target_filters,
+        should_skip_field,
+    )
+
+    def recursive_get_fields(Model, parent_field, path_tracker, filter_config, model_path, relation_index):
+        """The traversal ``get_fields`` used before the explicit stack, reading from the same relation index."""
+        if filter_config.max_paths and path_tracker.result_count[0] >= filter_config.max_paths:
+            return []
+        adjacency = relation_index[Model]
+        path_tracker.model_stack.append(Model)
+        if check_redundant(path_tracker.model_stack, path_tracker.stack_limit, filter_config.max_depth):
+            return []
+
+        out_fields = []
+        for edge in adjacency.edges:
+            full_field = get_full_field(parent_field, edge.name)
+            model_path_str = ",".join(model_path + [adjacency.label])
+            key = (full_field, adjacency.name, edge.name, edge.type_name)
+            if (
+                key not in path_tracker.seen
+                and not should_skip_field(full_field, adjacency.name, model_path_str, filter_config.excludes)
+                and matches_target_field_type(edge.field, filter_config.target_field_type)
+                and matches_target_filters(Model, edge.name, filter_config.target_model, filter_config.target_field)
+                and (not filter_config.max_paths or path_tracker.result_count[0] < filter_config.max_paths)
+            ):
+                path_tracker.seen.add(key)
+                path_tracker.result_count[0] += 1
+                out_fields.append([*key, model_path_str])
+
+            if edge.related_model is not None and (
+                not filter_config.max_paths or path_tracker.result_count[0] < filter_config.max_paths
+            ):
+                current_path = model_path + [Model._meta.label]
+                if not should_skip_field(
+                    full_field, edge.related_model.__name__, ",".join(current_path), filter_config.excludes
+                ):
+                    child_tracker = PathTracker(
+                        seen=path_tracker.seen,
+                        result_count=path_tracker.result_count,
+                        model_stack=list(path_tracker.model_stack),
+                        stack_limit=path_tracker.stack_limit,
+                    )
+                    out_fields.extend(
+                        recursive_get_fields(
+                            edge.related_model, full_field, child_tracker, filter_config, current_path, relation_index
+                        )
+                    )
+        return out_fields
+
+    spec = SchemaSpec(
+        apps=args.apps,
+        models_per_app=args.models_per_app,
+        fk_per_model=args.fk_per_model,
+        m2m_per_model=args.m2m_per_model,
+    )
+    model_list = build_synthetic_models(spec)
+    roots = model_list[:: max(1, len(model_list) // args.roots)][: args.roots]
+    relation_index = RelationIndex()
+
+    for depth in args.depths:
+
+        def filter_config():
+            return FilterConfig(
+                excludes=["permissions", "comment", "content_type"],
+                max_depth=depth,
+                max_paths=None,
+                target_field_type=None,
+                target_model=None,
+                target_field=None,
+            )
+
+        def recursive():
+            return [
+                recursive_get_fields(root, "", PathTracker.create(), filter_config(), [], relation_index)
+                for root in roots
+            ]
+
+        def explicit_stack():
+            return [get_fields(root, filter_config=filter_config(), relation_index=relation_index) for root in roots]
+
+        rows = explicit_stack()
+        if rows != recursive():
+            raise AssertionError(f"The traversals found different rows at depth {depth}")
+        row_count = sum(len(root_rows) for root_rows in rows)
+        del rows
+
+        peaks = {}
+        for name, traverse in (("recursive", recursive), ("explicit stack", explicit_stack)):
+            tracemalloc.start()
+            traverse()
+            peaks[name] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+        before = best_of(recursive, args.repeat)
+        after = best_of(explicit_stack, args.repeat)
+        print_comparison(
+            f"--max-depth {depth}, {len(roots)} roots, {row_count} rows", before, after, "recursive", "stack"
+        )
+        print(
+            f"  peak memory  {peaks['recursive'] / 1024 / 1024:8.2f} MiB -> "
+            f"{peaks['explicit stack'] / 1024 / 1024:.2f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,19 @@
+"""Shared fixtures for the example project's tests."""
+
+import pytest
+from django.db import connections
+
+
+@pytest.fixture
+def second_database():
+    """Add a second database alias, named ``second``, whose ``CharField`` and ``TextField`` types differ.
+
+    Both aliases use SQLite, so the differing types stand in for a second vendor.
+    """
+    connections.settings["second"] = {**connections.settings["default"], "NAME": ":memory:"}
+    connection = connections["second"]
+    connection.data_types = {**connection.data_types, "CharField": "varchar2(%(max_length)s)", "TextField": "clob"}
+    yield "second"
+    connection.close()
+    del connections["second"]
+    del connections.settings["second"]
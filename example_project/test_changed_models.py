@@ -0,0 +1,119 @@
+"""Tests for modelinfo_utils/_changed_models.py."""
+
+import json
+from io import StringIO
+
+import pytest
+from django.apps import apps
+from django.core.management import CommandError, call_command
+
+from django_model_info.management.commands.modelinfo_utils._changed_models import (
+    build_snapshot,
+    get_affected_models,
+    get_changed_files,
+    normalize_path,
+)
+
+
+def labels(models):
+    return [model._meta.label for model in models]
+
+
+class TestGetAffectedModels:
+    """Tests for get_affected_models."""
+
+    def test_models_in_changed_file_and_their_relation_targets(self):
+        models = list(apps.get_models())
+        affected = labels(get_affected_models(models, {"example_project/sales/models.py"}))
+
+        assert "sales.Order" in affected
+        assert "sales.OrderItem" in affected
+        # Order and OrderItem point at these, so their reverse relations come from the changed file
+        assert "common.Customer" in affected
+        assert "inventory.Product" in affected
+        assert "inventory.Category" not in affected
+
+    def test_parent_class_file_affects_children(self):
+        models = list(apps.get_models())
+        affected = labels(get_affected_models(models, {"example_project/common/models.py"}))
+
+        assert {"inventory.Product", "sales.Order", "analytics.SalesMetrics"} <= set(affected)
+        assert "sessions.Session" not in affected
+
+    def test_previous_relations_are_included(self):
+        from example_project.inventory.models import Supplier
+
+        models = [Supplier, apps.get_model("auth.User")]
+        files = {"example_project/inventory/models.py"}
+        assert labels(get_affected_models(models, files)) == ["inventory.Supplier"]
+
+        # A relation from Supplier to User that the snapshot knows about, but which has since been removed
+        snapshot = {"relations": {"inventory.Supplier": ["auth.User"]}}
+        assert labels(get_affected_models(models, files, snapshot)) == ["inventory.Supplier", "auth.User"]
+
+
+class TestSnapshots:
+    """Tests for build_snapshot and get_changed_files."""
+
+    def test_changed_files(self):
+        from example_project.inventory.models import Product
+
+        snapshot = build_snapshot([Product])
+        product_file = normalize_path("example_project/inventory/models.py")
+
+        assert product_file in snapshot["files"]
+        assert "inventory.Category" in snapshot["relations"]["inventory.Product"]
+        assert get_changed_files(snapshot, snapshot) == set()
+
+        previous = {"files": {**snapshot["files"], product_file: "outdated"}, "relations": {}}
+        assert get_changed_files(previous, snapshot) == {product_file}
+
+    def test_command_changed_since_snapshot(self, tmp_path):
+        path = tmp_path / "snapshot.json"
+        call_command("modelinfo", "--save-snapshot", str(path), verbosity=0, stdout=StringIO())
+
+        out = StringIO()
+        call_command("modelinfo", "--changed-since", str(path), "--format", "ndjson", verbosity=0, stdout=out)
+        assert out.getvalue() == ""
+
+        out = StringIO()
+        call_command(
+            "modelinfo",
+            "--changed-files",
+            "example_project/analytics/models.py",
+            "--format",
+            "ndjson",
+            verbosity=0,
+            stdout=out,
+        )
+        assert '"analytics.SalesMetrics"' in out.getvalue()
+        assert "sessions.Session" not in out.getvalue()
+
+    def test_command_changed_since_and_save_snapshot_same_file(self, tmp_path):
+        """The previous snapshot is compared before the same file is overwritten with the current one."""
+        path = tmp_path / "snapshot.json"
+        call_command("modelinfo", "--save-snapshot", str(path), verbosity=0, stdout=StringIO())
+        product_file = normalize_path("example_project/inventory/models.py")
+        snapshot = json.loads(path.read_text())
+        current_digest = snapshot["files"][product_file]
+        snapshot["files"][product_file] = "outdated"
+        path.write_text(json.dumps(snapshot))
+
+        out = StringIO()
+        call_command(
+            "modelinfo",
+            "--changed-since",
+            str(path),
+            "--save-snapshot",
+            str(path),
+            "--format",
+            "ndjson",
+            verbosity=0,
+            stdout=out,
+        )
+        assert '"inventory.Product"' in out.getvalue()
+        assert json.loads(path.read_text())["files"][product_file] == current_digest
+
+    def test_command_changed_since_missing_snapshot(self, tmp_path):
+        with pytest.raises(CommandError, match="Snapshot not found"):
+            call_command("modelinfo", "--changed-since", str(tmp_path / "missing.json"), verbosity=0, stdout=StringIO())
@@ -0,0 +1,79 @@
+"""Tests for common_utils/_export.py."""
+
+from io import StringIO
+
+from rich.console import Console
+
+from django_model_info.management.commands.common_utils._export import (
+    ConsoleExportWriter,
+    create_console,
+    is_streamed_export,
+    write_if_changed,
+)
+
+
+class TestCreateConsole:
+    """Tests for is_streamed_export and create_console."""
+
+    def test_only_records_for_streamed_exports(self):
+        assert create_console(None).record is False
+        assert create_console("models.md").record is False
+        assert create_console("models.txt").record is True
+        assert create_console("models.html").record is True
+
+    def test_is_streamed_export(self):
+        assert is_streamed_export("out.htm")
+        assert not is_streamed_export("out.md")
+        assert not is_streamed_export(None)
+
+
+class TestConsoleExportWriter:
+    """Tests for ConsoleExportWriter."""
+
+    def test_text_is_written_in_chunks_and_buffer_cleared(self, tmp_path):
+        path = tmp_path / "out.txt"
+        console = Console(record=True, file=StringIO(), width=80)
+
+        with ConsoleExportWriter(console, str(path)) as writer:
+            console.print("first")
+            writer.flush()
+            assert path.read_text() == "first\n"
+            assert not console._record_buffer
+            console.print("second")
+
+        assert path.read_text() == "first\nsecond\n"
+
+    def test_html_document_is_complete(self, tmp_path):
+        path = tmp_path / "out.html"
+        console = Console(record=True, file=StringIO(), width=80)
+
+        with ConsoleExportWriter(console, str(path)) as writer:
+            console.print("[bold]first[/bold]")
+            writer.flush()
+            console.print("second")
+
+        content = path.read_text()
+        assert content.startswith("<!DOCTYPE html>")
+        assert content.rstrip().endswith("</html>")
+        assert "first" in content and "second" in content
+        assert "font-weight: bold" in content
+
+    def test_no_export_is_a_no_op(self):
+        console = Console(record=False, file=StringIO())
+        with ConsoleExportWriter(console, None) as writer:
+            console.print("text")
+            writer.flush()
+
+
+class TestWriteIfChanged:
+    """Tests for write_if_changed."""
+
+    def test_skips_unchanged_content(self, tmp_path):
+        path = tmp_path / "app" / "page.md"
+
+        assert write_if_changed(path, "# Page\n") is True
+        mtime = path.stat().st_mtime_ns
+        assert write_if_changed(path, "# Page\n") is False
+        assert path.stat().st_mtime_ns == mtime
+        assert write_if_changed(path, "# Changed\n") is True
+        assert path.read_text() == "# Changed\n"
@@ -0,0 +1,53 @@
+"""Tests for modelinfo_utils/_field_attr_utils.py."""
+
+from django.db import connections, models
+
+from django_model_info.management.commands.modelinfo_utils import _field_attr_utils
+from django_model_info.management.commands.modelinfo_utils._field_attr_utils import (
+    get_db_type_cache_key,
+    get_field_db_type,
+)
+from example_project.inventory.models import Product
+from example_project.sales.models import Order, OrderItem
+
+
+class TestGetFieldDbType:
+    """Tests for get_field_db_type and its memoization."""
+
+    def test_field_types(self):
+        assert get_field_db_type(Product._meta.get_field("name")) == "varchar(200)"
+        assert get_field_db_type(Product._meta.get_field("category")) == "bigint"
+        assert get_field_db_type(Product._meta.get_field("suppliers")) == "through inventory.ProductSupplier"
+
+    def test_foreign_keys_share_a_key_per_target(self):
+        """Foreign keys to the same field, and their reverse relations, share one entry."""
+        connection = connections["default"]
+        product_key = get_db_type_cache_key(OrderItem._meta.get_field("product"), connection)
+
+        assert product_key is not None
+        assert get_db_type_cache_key(Product._meta.get_field("orderitem"), connection) == product_key
+        assert get_db_type_cache_key(OrderItem._meta.get_field("order"), connection) != product_key
+
+    def test_other_fields_are_not_memoized(self):
+        connection = connections["default"]
+        assert get_db_type_cache_key(Product._meta.get_field("name"), connection) is None
+        assert get_db_type_cache_key(Product._meta.get_field("suppliers"), connection) is None
+
+    def test_memoized_per_target(self, monkeypatch):
+        calls = []
+        original_db_type = models.ForeignKey.db_type
+
+        def db_type(self, connection):
+            calls.append(self)
+            return original_db_type(self, connection)
+
+        monkeypatch.setattr(_field_attr_utils, "DB_TYPE_CACHE", {})
+        monkeypatch.setattr(models.ForeignKey, "db_type", db_type)
+        assert get_field_db_type(OrderItem._meta.get_field("order")) == "bigint"
+        assert get_field_db_type(Order._meta.get_field("items")) == "bigint"
+        assert len(calls) == 1
+
+    def test_resolved_per_database(self, second_database):
+        field = Product._meta.get_field("name")
+        assert get_field_db_type(field) == "varchar(200)"
+        assert get_field_db_type(field, connections[second_database]) == "varchar2(200)"
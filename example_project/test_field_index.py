@@ -0,0 +1,24 @@
+"""Tests for modelinfo_utils/_field_index.py."""
+
+from django_model_info.management.commands.modelinfo_utils._field_index import build_field_index
+
+
+class TestBuildFieldIndex:
+    """Tests for build_field_index."""
+
+    def test_classifies_every_field_once(self):
+        from example_project.inventory.models import Product
+
+        index = build_field_index(Product)
+        assert len(index.all_fields) == len(Product._meta.get_fields(include_hidden=True))
+        assert len(index.relations) + len(index.reverse_relations) + len(index.non_relations) == len(index.all_fields)
+
+    def test_relations_and_reverse_relations(self):
+        from example_project.inventory.models import Category
+
+        index = build_field_index(Category)
+        relation_names = {field.name for field in index.relations}
+        reverse_models = {field.related_model for field in index.reverse_relations}
+        assert "parent" in relation_names
+        assert Category in reverse_models
+        assert all(field.related_model is None for field in index.non_relations)
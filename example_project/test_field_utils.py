@@ -4,7 +4,14 @@ import pytest
 from django.db import models
 
 from django_model_info.management.commands.modelfilters_utils._field_utils import (
+    FilterConfig,
+    PathTracker,
+    RelationIndex,
     camel_to_snake,
+    compile_excludes,
+    get_fields,
+    get_ordered_fields,
+    iter_ordered_fields,
     matches_target_field_type,
     matches_target_filters,
     normalize_app_model,
@@ -115,6 +122,46 @@ class TestShouldSkipField:
         )
 
 
+class TestExcludeMatcher:
+    """Tests for exclude patterns compiled with compile_excludes."""
+
+    def test_patterns_are_sorted_by_kind(self):
+        matcher = compile_excludes(("user__Groups", "auth.Permission", "ContentType", "sales."))
+        assert matcher.field_paths.pattern == "user__groups"
+        assert matcher.app_models == {("auth", "permission"), ("sales", None)}
+        assert matcher.model_names == {"content_type"}
+        assert matcher.matches_model(("contenttypes", "content_type"))
+        assert not matcher.matches_model(("sales", "order"))
+
+    def test_field_path_search_starts_at_offset(self):
+        matcher = compile_excludes(("user__groups", "a__b"))
+        assert matcher.longest_field_path == len("user__groups")
+        assert matcher.matches_field_path("customer__user__groups", 8)
+        assert not matcher.matches_field_path("customer__user__groups", 11)
+
+    @pytest.mark.parametrize(
+        "excludes",
+        [
+            ["permissions", "comment", "content_type"],
+            ["customer__user", "Product"],
+            ["sales.OrderItem", "items__product__category"],
+            ["auth", "common.Customer", "user__groups"],
+        ],
+    )
+    def test_traversal_excludes_what_should_skip_field_excludes(self, excludes):
+        """Excluding during the walk finds the rows of an unexcluded walk that should_skip_field keeps."""
+        from example_project.sales.models import Order
+
+        rows = get_fields(Order, filter_config=FilterConfig(excludes, 4, None, None, None, None))
+        expected = [
+            row
+            for row in get_fields(Order, filter_config=FilterConfig([], 4, None, None, None, None))
+            if not should_skip_field(row[0], row[1], row[4], excludes)
+        ]
+        assert rows == expected
+        assert len(rows) > 0
+
+
 class TestMatchesTargetFilters:
     """Tests for matches_target_field_type and matches_target_filters."""
 
@@ -154,3 +201,111 @@ class TestMatchesTargetFilters:
 
         assert matches_target_filters(Product, "name", None, ["name", "sku"]) is True
         assert matches_target_filters(Product, "name", None, ["sku", "price"]) is False
+
+
+class TestRelationIndex:
+    """Tests for the per-run relation index read by the traversal."""
+
+    def test_fields_are_unique_and_in_traversal_order(self):
+        from example_project.inventory.models import Product
+
+        adjacency = RelationIndex()[Product]
+        fields = [edge.field for edge in adjacency.edges]
+        meta = Product._meta
+        assert len(fields) == len(set(map(id, fields)))
+        assert fields[: len(meta.fields)] == list(meta.fields)
+        assert set(map(id, fields)) == set(map(id, [*meta.fields, *meta.many_to_many, *meta.get_fields()]))
+        assert adjacency.label == "inventory.Product"
+
+    def test_relation_edges(self):
+        from example_project.inventory.models import Category, Product
+        from example_project.sales.models import OrderItem
+
+        edges = {edge.name: edge for edge in RelationIndex()[Product].edges}
+        assert edges["category"].related_model is Category
+        assert edges["orderitem"].related_model is OrderItem
+        assert edges["orderitem"].type_name == "ManyToOneRel"
+        assert edges["name"].related_model is None
+
+    def test_models_are_indexed_once(self):
+        from example_project.sales.models import Order
+
+        relation_index = RelationIndex()
+        assert relation_index[Order] is relation_index[Order]
+        get_ordered_fields(Order, max_depth=2, relation_index=relation_index)
+        indexed = len(relation_index)
+        get_ordered_fields(Order, max_depth=2, relation_index=relation_index)
+        assert len(relation_index) == indexed > 1
+
+    def test_shared_index_finds_the_same_rows(self):
+        from example_project.inventory.models import Product
+        from example_project.sales.models import Order
+
+        relation_index = RelationIndex()
+        for model in (Order, Product):
+            shared = get_ordered_fields(model, max_depth=3, relation_index=relation_index)
+            assert shared == get_ordered_fields(model, max_depth=3)
+
+
+class TestGetFields:
+    """Tests for the explicit-stack traversal in get_fields."""
+
+    def test_rows_are_depth_first(self):
+        """Each relation's row comes before the rows found through it, and the model path leads to the row."""
+        from example_project.sales.models import Order
+
+        rows = get_fields(Order, filter_config=FilterConfig([], 3, None, None, None, None))
+        positions = {row[0]: index for index, row in enumerate(rows)}
+        for index, (full_field, _, _, _, model_path) in enumerate(rows):
+            parts = full_field.split("__")
+            assert model_path.split(",")[0] == "sales.Order"
+            assert len(model_path.split(",")) == len(parts)
+            if len(parts) > 1 and "__".join(parts[:-1]) in positions:
+                assert positions["__".join(parts[:-1])] < index
+
+    def test_max_paths_stops_the_walk(self):
+        from example_project.sales.models import Order
+
+        path_tracker = PathTracker.create()
+        rows = get_fields(Order, path_tracker=path_tracker, filter_config=FilterConfig([], 4, 5, None, None, None))
+        assert len(rows) == 5
+        assert path_tracker.result_count == [5]
+        assert len(path_tracker.seen) == 5
+        assert path_tracker.model_stack == []
+
+
+class TestIterOrderedFields:
+    """Tests for the streamed paths of iter_ordered_fields."""
+
+    def test_unordered_rows_are_found_lazily(self):
+        from example_project.sales.models import Order
+
+        relation_index = RelationIndex()
+        rows = iter_ordered_fields(Order, max_depth=4, relation_index=relation_index)
+        first = next(rows)
+        assert first == get_fields(Order, filter_config=FilterConfig([], 4, None, None, None, None))[0]
+        assert len(relation_index) == 1
+
+    def test_max_paths_stops_the_walk(self):
+        from example_project.sales.models import Order
+
+        relation_index = RelationIndex()
+        rows = list(iter_ordered_fields(Order, max_depth=4, max_paths=5, relation_index=relation_index))
+        assert rows == get_fields(Order, filter_config=FilterConfig([], 4, 5, None, None, None))
+        assert len(relation_index) == 1
+
+    def test_by_depth(self):
+        from example_project.sales.models import Order
+
+        rows = list(iter_ordered_fields(Order, by_depth=True, max_depth=4))
+        depths = [row[0].count("__") for row in rows]
+        assert depths == sorted(depths)
+        assert sorted(rows) == sorted(get_ordered_fields(Order, by_depth=True, max_depth=4))
+        assert list(iter_ordered_fields(Order, by_depth=True, max_depth=4, max_paths=20)) == rows[:20]
+
+    @pytest.mark.parametrize("max_buffered_rows", [1, 20, 10_000])
+    def test_by_model_matches_sorted_rows(self, max_buffered_rows):
+        from example_project.sales.models import Order
+
+        rows = list(iter_ordered_fields(Order, by_model=True, max_depth=4, max_buffered_rows=max_buffered_rows))
+        assert rows == get_ordered_fields(Order, by_model=True, max_depth=4)
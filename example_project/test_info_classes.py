@@ -0,0 +1,47 @@
+"""Tests for modelinfo_utils/_info_classes.py."""
+
+import pickle
+
+from django_model_info.management.commands.modelinfo_utils._info_classes import (
+    FieldOther,
+    Method,
+    ModelInfo,
+    ModelRecord,
+)
+
+
+class TestModelInfo:
+    """Tests for ModelInfo."""
+
+    def test_render_rows(self):
+        info = ModelInfo(model_name="Product", verbose_name="product", mro="(Product, Model)")
+
+        assert info.render_rows(3) == [
+            ("Model Name", "Product"),
+            ("Verbose Name", "product"),
+            ("Verbose Name Plural", ""),
+            ("Docstring", ""),
+        ]
+        assert info.render_rows(19)[-1] == ("Method Resolution Order", "(Product, Model)")
+        assert info.render_rows(20)[-1] == ("Managers Info", "{}")
+        assert str(info) == "Product"
+
+    def test_instances_are_slotted(self):
+        assert not hasattr(ModelInfo(), "__dict__")
+        assert not hasattr(Method(), "__dict__")
+
+
+class TestBaseInfo:
+    """Tests for the field and method info classes."""
+
+    def test_render_row(self):
+        field_info = FieldOther(name="sku", field_type="CharField", field_column="sku", field_db_type="varchar(50)")
+
+        assert field_info.render_row(3) == ["sku", "CharField", "sku"]
+        assert field_info.render_simple_row() == ["sku"]
+
+    def test_records_pickle(self):
+        record = ModelRecord(label="inventory.Product", modelinfo=ModelInfo(model_name="Product"))
+        record.method_info = ([Method(name="save", signature="(self)")],)
+
+        assert pickle.loads(pickle.dumps(record)) == record
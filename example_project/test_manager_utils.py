@@ -3,11 +3,15 @@
 from django.db import models
 
 from django_model_info.management.commands.modelinfo_utils._manager_utils import (
+    analyze_class_methods,
     analyze_manager,
     analyze_queryset,
+    discover_model_managers,
     format_manager_output,
+    get_model_managers,
     group_managers_by_name,
     merge_method_info,
+    scan_model_managers,
 )
 
 
@@ -43,6 +47,59 @@ class TestAnalyzeQueryset:
         assert "out_of_stock" in result["methods"]
 
 
+class TestAnalyzeClassMethods:
+    """Tests for analyze_class_methods."""
+
+    def test_each_class_is_inspected_once(self, monkeypatch):
+        from django_model_info.management.commands.modelinfo_utils import _manager_utils
+
+        from example_project.inventory.models import Product, ProductQuerySet
+
+        analyze_class_methods.cache_clear()
+        calls = []
+        getmembers = _manager_utils.inspect.getmembers
+
+        def tracking_getmembers(cls, *args, **kwargs):
+            calls.append(cls)
+            return getmembers(cls, *args, **kwargs)
+
+        monkeypatch.setattr(_manager_utils.inspect, "getmembers", tracking_getmembers)
+        first = analyze_queryset(ProductQuerySet)
+        second = analyze_queryset(ProductQuerySet)
+        analyze_manager(Product.objects)
+        analyze_manager(Product.objects)
+
+        assert first == second
+        assert first["methods"] is second["methods"]
+        assert calls == [ProductQuerySet, type(Product.objects)]
+
+
+class TestManagerDiscovery:
+    """Tests for discover_model_managers and scan_model_managers."""
+
+    def test_discovery_matches_exhaustive_scan(self):
+        from example_project.inventory.models import Product
+        from example_project.sales.models import Order
+
+        for model in (Product, Order):
+            assert discover_model_managers(model) == scan_model_managers(model)
+            assert get_model_managers(model, exhaustive=False) == get_model_managers(model, exhaustive=True)
+
+    def test_discovery_does_not_trigger_descriptors_on_abstract_models(self):
+        from example_project.inventory.models import ProductManager
+
+        class AbstractWithManager(models.Model):
+            products = ProductManager()
+
+            class Meta:
+                abstract = True
+                app_label = "inventory"
+
+        managers = discover_model_managers(AbstractWithManager)
+        assert list(managers) == ["products"]
+        assert isinstance(managers["products"], ProductManager)
+
+
 class TestMergeAndGroupManagerInfo:
     """Tests for merge_method_info, group_managers_by_name, and format_manager_output."""
 
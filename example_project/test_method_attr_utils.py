@@ -1,6 +1,9 @@
 """Tests for modelinfo_utils/_method_attr_utils.py."""
 
 from django_model_info.management.commands.modelinfo_utils._method_attr_utils import (
+    MethodIntrospectionCache,
+    get_method_cache_key,
+    get_method_details,
     get_method_docstring,
     get_method_file,
     get_method_line_number,
@@ -138,6 +141,48 @@ class TestGetMethodFileAndLineNumber:
         def raise_type_error(*a, **kw):
             raise TypeError("test")
 
-        monkeypatch.setattr(_method_attr_utils.inspect, "getsourcelines", raise_type_error)
+        monkeypatch.setattr(_method_attr_utils, "find_source_line_number", raise_type_error)
         result = get_method_line_number("clean", Product)
         assert result == ""
+
+
+class TestMethodIntrospectionCache:
+    """Tests for MethodIntrospectionCache, get_method_cache_key and get_method_details."""
+
+    def test_evicts_least_recently_used(self):
+        cache = MethodIntrospectionCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+
+    def test_zero_maxsize_disables_cache(self):
+        cache = MethodIntrospectionCache(maxsize=0)
+        cache.set("a", 1)
+        assert cache.get("a") is None
+
+    def test_inherited_method_shares_key_between_models(self):
+        from example_project.inventory.models import Category, Product
+
+        assert get_method_cache_key("save", Product, 3) == get_method_cache_key("save", Category, 3)
+        assert get_method_cache_key("check", Product, 3) == get_method_cache_key("check", Category, 3)
+        assert get_method_cache_key("__str__", Product, 3) != get_method_cache_key("__str__", Category, 3)
+
+    def test_details_are_introspected_once(self, monkeypatch):
+        from django_model_info.management.commands.modelinfo_utils import _method_attr_utils
+
+        from example_project.inventory.models import Category, Product
+
+        monkeypatch.setattr(_method_attr_utils, "method_cache", MethodIntrospectionCache(maxsize=10))
+        details = get_method_details("full_clean", Product, verbosity=3)
+        assert "self" in details[0]
+        assert details[3].isdigit()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("inherited method should come from the cache")
+
+        monkeypatch.setattr(_method_attr_utils, "get_method_signature", fail)
+        assert get_method_details("full_clean", Category, verbosity=3) == details
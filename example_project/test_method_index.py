@@ -0,0 +1,49 @@
+"""Tests for modelinfo_utils/_method_index.py."""
+
+from django.contrib.auth.models import AbstractUser, User
+from django.db.models import Model
+
+from django_model_info.management.commands.modelinfo_utils._method_index import (
+    get_attribute_owner,
+    is_common_django_method,
+    is_inherited_default,
+    is_project_class,
+)
+from example_project.common.models import BaseModel
+from example_project.inventory.models import Product
+
+
+class TestGetAttributeOwner:
+    """Tests for get_attribute_owner."""
+
+    def test_finds_the_defining_class(self):
+        assert get_attribute_owner(Product, "clean") is Product
+        assert get_attribute_owner(Product, "activate") is BaseModel
+        assert get_attribute_owner(Product, "save") is Model
+        assert get_attribute_owner(User, "get_full_name") is AbstractUser
+
+    def test_unknown_attribute(self):
+        assert get_attribute_owner(Product, "not_an_attribute") is None
+
+
+class TestClassification:
+    """Tests for is_project_class, is_common_django_method, and is_inherited_default."""
+
+    def test_is_project_class(self):
+        assert is_project_class(Product)
+        assert is_project_class(BaseModel)
+        assert not is_project_class(Model)
+        assert not is_project_class(AbstractUser)
+        assert not is_project_class(object)
+
+    def test_is_common_django_method(self):
+        assert is_common_django_method(Product, "save")
+        assert is_common_django_method(Product, "_check_fields")
+        assert not is_common_django_method(Product, "clean")
+        assert not is_common_django_method(Product, "activate")
+
+    def test_is_inherited_default(self):
+        assert not is_inherited_default(Product, "activate")
+        assert not is_inherited_default(User, "get_next_by_date_joined")
+        assert is_inherited_default(User, "get_full_name")
+        assert is_inherited_default(Product, "refresh_from_db")
@@ -27,3 +27,11 @@ class TestMigrationGraphCommand:
         out = StringIO()
         call_command("migrationgraph", "inventory", "sales", stdout=out)
         assert out.getvalue()
+
+    def test_profile(self):
+        """--profile reports the time spent on each app."""
+        out, err = StringIO(), StringIO()
+        call_command("migrationgraph", "inventory", "sales", "--profile", stdout=out, stderr=err)
+        assert "```mermaid" in out.getvalue()
+        assert "Slowest apps (top 2 of 2)" in err.getvalue()
+        assert "loader" in err.getvalue()
@@ -85,7 +85,7 @@ class TestModelAttrErrorBranches:
         def raise_os_error(*a, **kw):
             raise OSError("test")
 
-        monkeypatch.setattr(_model_attr_utils.inspect, "getsourcelines", raise_os_error)
+        monkeypatch.setattr(_model_attr_utils, "find_source_line_number", raise_os_error)
         assert get_model_line_number(Product) == ""
 
 
@@ -1,5 +1,8 @@
 """Tests for the modelfilters management command."""
 
+import json
+import tracemalloc
+
 from django.core.management import call_command
 
 
@@ -40,6 +43,47 @@ class TestModelFiltersCommand:
         call_command("modelfilters", "-o", str(path), "inventory.Product")
         assert path.read_text(), "Exported txt file should not be empty"
 
+    def test_export_to_md_traverses_each_model_once(self, capsys, tmp_path, monkeypatch):
+        """Printing, the total and the markdown export all use the rows found once per model."""
+        from django_model_info.management.commands import modelfilters
+
+        traversed = []
+
+        def get_ordered_fields(model, **kwargs):
+            traversed.append(model)
+            return original(model, **kwargs)
+
+        original = modelfilters.get_ordered_fields
+        monkeypatch.setattr(modelfilters, "get_ordered_fields", get_ordered_fields)
+        path = tmp_path / "output.md"
+        call_command("modelfilters", "-o", str(path), "inventory", "sales.Order")
+
+        assert len(traversed) == len(set(traversed)) > 1
+        lines = path.read_text().splitlines()
+        assert "## sales.Order" in lines
+        rows = [line for line in lines if line.startswith("| ") and not line.startswith("| Field Path")]
+        assert f"Total Fields: {len(rows)}" in capsys.readouterr().out
+
+    def test_stream(self, capsys, tmp_path):
+        """--stream writes the same rows as --markdown, as they are found, to stdout and the .md export."""
+        call_command("modelfilters", "--markdown", "--by-model", "sales.Order", "inventory")
+        expected = capsys.readouterr().out
+        path = tmp_path / "output.md"
+        call_command("modelfilters", "--stream", "--by-model", "sales.Order", "inventory", "-o", str(path))
+        output = capsys.readouterr().out
+        assert output == expected
+        assert path.read_text() == output.rsplit("\n\n**Total Fields", 1)[0] + "\n"
+
+    def test_stream_max_paths(self, capsys):
+        call_command("modelfilters", "--stream", "--by-depth", "sales.Order", "--max-paths", "3")
+        assert "**Total Fields: 3**" in capsys.readouterr().out
+
+    def test_stream_only_exports_markdown(self, capsys, tmp_path):
+        path = tmp_path / "output.txt"
+        call_command("modelfilters", "--stream", "sales.Order", "-o", str(path))
+        assert "--stream can only export to .md files" in capsys.readouterr().err
+        assert not path.exists()
+
     def test_by_depth_sort(self, capsys):
         """Command sorts by depth with --by-depth."""
         call_command("modelfilters", "inventory.Product", "--by-depth")
@@ -63,3 +107,33 @@ class TestModelFiltersCommand:
         # or are single field names. The exact format depends on output mode,
         # but with max-paths=5 we should have at most 5 field entries.
         assert output  # At minimum, output should not be empty
+
+    def test_profile(self, capsys):
+        """--profile times the traversal of each model."""
+        call_command("modelfilters", "inventory.Product", "sales.Order", "--profile", "--profile-format", "json")
+        report = json.loads(capsys.readouterr().err)
+        assert report["phases"]["traversal"]["calls"] == 2
+        assert {entry["model"] for entry in report["slowest_models"]} == {"inventory.Product", "sales.Order"}
+
+    def test_memory_report_before_filter(self, capsys):
+        """--memory-report takes no value, so a filter can follow it."""
+        call_command("modelfilters", "--memory-report", "sales.Order")
+        assert "sales.Order" in capsys.readouterr().err
+
+    def test_memory_report(self, capsys):
+        """--memory-report traces memory for the run only, and reports each phase."""
+        call_command(
+            "modelfilters",
+            "inventory.Product",
+            "--memory-report",
+            "--memory-report-format",
+            "json",
+            "--memory-top",
+            "3",
+        )
+        report = json.loads(capsys.readouterr().err)
+        assert not tracemalloc.is_tracing()
+        assert report["peak"] > 0
+        assert {"discovery", "traversal", "render"} <= set(report["phases"])
+        assert report["largest_models"][0]["model"] == "inventory.Product"
+        assert 0 < len(report["allocation_sites"]) <= 3
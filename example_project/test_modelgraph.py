@@ -1,5 +1,6 @@
 """Tests for the modelgraph management command."""
 
+import json
 import shutil
 
 import pytest
@@ -53,3 +54,22 @@ class TestModelGraphCommand:
     def test_include_proxy(self, capsys):
         """Command includes proxy models with -p."""
         call_command("modelgraph", "-p", "-f", "analysis")
+
+    def test_profile(self, capsys):
+        """--profile times the edges of each model in the graph."""
+        call_command("modelgraph", "inventory", "-f", "mermaid", "--profile")
+        err = capsys.readouterr().err
+        assert "edges" in err
+        assert "inventory.Product" in err
+
+    def test_profile_before_filter(self, capsys):
+        call_command("modelgraph", "--profile", "--profile-format", "json", "inventory", "-f", "mermaid")
+        report = json.loads(capsys.readouterr().err)
+        assert "inventory.Product" in {entry["model"] for entry in report["slowest_models"]}
+
+    def test_memory_report(self, capsys):
+        """--memory-report covers building the graph."""
+        call_command("modelgraph", "inventory", "-f", "mermaid", "--memory-report")
+        err = capsys.readouterr().err
+        assert "MiB peak" in err
+        assert "nodes" in err
@@ -1,6 +1,13 @@
 """Tests for the modelinfo management command."""
 
+import json
+from io import StringIO
+
+import pytest
 from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from django_model_info.management.commands import modelinfo
 
 
 class TestModelInfoCommand:
@@ -66,3 +73,238 @@ class TestModelInfoCommand:
         call_command("modelinfo", "-o", str(path), "inventory.Product")
         content = path.read_text()
         assert "html" in content.lower() or "Product" in content
+
+    def test_jobs_matches_serial_output(self, capsys):
+        """Command output with a worker pool matches the serial output, in the same order."""
+        call_command("modelinfo", "inventory", verbosity=3)
+        serial_output = capsys.readouterr().out
+        call_command("modelinfo", "inventory", "--jobs", "2", verbosity=3)
+        assert capsys.readouterr().out == serial_output
+
+    def test_jobs_markdown_matches_serial_output(self, capsys):
+        """Markdown output with a worker pool matches the serial output."""
+        call_command("modelinfo", "--markdown", "inventory", "sales")
+        serial_output = capsys.readouterr().out
+        call_command("modelinfo", "--markdown", "--jobs", "2", "inventory", "sales")
+        assert capsys.readouterr().out == serial_output
+
+    def test_markdown_is_streamed_per_model(self, monkeypatch):
+        """Each model's markdown section is written before the next model is built."""
+        from example_project.inventory.models import Category, Product
+
+        events = []
+        build_model_record = modelinfo.build_model_record
+
+        def tracking_build(*args, **kwargs):
+            events.append("build")
+            return build_model_record(*args, **kwargs)
+
+        class TrackingStream(StringIO):
+            def write(self, text):
+                events.append("write")
+                return super().write(text)
+
+        monkeypatch.setattr(modelinfo, "build_model_record", tracking_build)
+        command = modelinfo.Command()
+        stream = TrackingStream()
+        command.write_markdown([Category, Product], stream)
+
+        assert events[:3] == ["build", "write", "build"]
+        assert stream.getvalue() == command.export_markdown([Category, Product])
+
+    def test_ndjson_output(self):
+        """NDJSON output has one JSON object per model, holding its model info, fields, methods, and managers."""
+        out = StringIO()
+        call_command("modelinfo", "--format", "ndjson", "inventory", stdout=out)
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+
+        product = next(record for record in records if record["model"] == "inventory.Product")
+        assert len(records) == len(set(record["model"] for record in records))
+        assert product["modelinfo"]["model_name"] == "Product"
+        assert {field["name"] for field in product["fields"]["relation"]} >= {"category"}
+        assert list(product["methods"]) == ["other", "private", "dunder", "common_django"]
+        assert "managers_info" in product
+
+    def test_ndjson_export_to_file(self, tmp_path):
+        """NDJSON output is written to the --output file, with only labels at verbosity 0."""
+        path = tmp_path / "output.ndjson"
+        call_command("modelinfo", "--format", "ndjson", "-o", str(path), "inventory.Product", verbosity=0)
+        assert path.read_text() == '{"model": "inventory.Product"}\n'
+
+    def test_output_dir_per_app(self, tmp_path):
+        """Each app gets a page linked from the index, and unchanged pages are not rewritten."""
+        out = StringIO()
+        call_command("modelinfo", "--output-dir", str(tmp_path), "inventory", "sales", stdout=out)
+
+        assert sorted(path.name for path in tmp_path.iterdir()) == ["index.md", "inventory.md", "sales.md"]
+        assert "[inventory](inventory.md)" in (tmp_path / "index.md").read_text()
+        assert "Wrote 3 of 3" in out.getvalue()
+        assert (tmp_path / "sales.md").read_text().startswith("# sales.")
+
+        out = StringIO()
+        call_command("modelinfo", "--output-dir", str(tmp_path), "inventory", "sales", stdout=out)
+        assert "Wrote 0 of 3" in out.getvalue()
+
+    def test_output_dir_per_model(self, tmp_path):
+        """Each model gets a page in a directory for its app."""
+        call_command(
+            "modelinfo", "--output-dir", str(tmp_path), "--split", "model", "inventory.Product", stdout=StringIO()
+        )
+
+        assert (tmp_path / "inventory" / "Product.md").read_text().startswith("# inventory.Product")
+        assert "[Product](inventory/Product.md)" in (tmp_path / "index.md").read_text()
+
+    def test_plain_renderer(self):
+        """The plain renderer writes aligned tables holding the same rows as the rich output."""
+        out = StringIO()
+        call_command("modelinfo", "--renderer", "plain", "inventory.Product", stdout=out)
+        output = out.getvalue()
+
+        assert "\ninventory.Product\n" in output
+        assert "Other Fields" in output and "Reverse Relations" in output
+        lines = output.splitlines()
+        table_start = lines.index("        Other Fields")
+        header, row = lines[table_start + 1], lines[table_start + 3]
+        assert row.strip().startswith("category ")
+        assert row.index("ForeignKey") == header.index("Field Type")
+        assert output.endswith("Total Models Listed: 1\n")
+
+    def test_tsv_renderer(self):
+        """The TSV renderer separates cells with tabs and keeps each row on one line."""
+        out = StringIO()
+        call_command("modelinfo", "--renderer", "tsv", "inventory.Product", verbosity=3, stdout=out)
+        lines = out.getvalue().splitlines()
+
+        assert "Method Name\tSignature\tDocstring\tFile\tLine Number" in lines
+        assert any(line.startswith("Docstring\tProduct model representing items") for line in lines)
+
+    @pytest.mark.parametrize("arguments", [["--markdown"], ["-o", "models.html"], ["-o", "models.md"]])
+    def test_plain_renderer_rejects_markdown_and_html(self, arguments):
+        with pytest.raises(CommandError, match="--renderer plain can't"):
+            call_command("modelinfo", "--renderer", "plain", "inventory.Product", *arguments, stdout=StringIO())
+
+    def test_multiple_databases(self, second_database):
+        out = StringIO()
+        call_command(
+            "modelinfo", "inventory.Product", "--renderer", "tsv", "--database", "default", "second", stdout=out
+        )
+        lines = out.getvalue().splitlines()
+        header = (
+            "Field Name\tField Type\tDatabase Column\tDatabase Type (default)\tDatabase Type (second)\tVerbose Name"
+        )
+        assert header in lines
+        assert "description\tTextField\tdescription\ttext\tclob\tdescription" in lines
+
+    def test_unknown_database(self):
+        with pytest.raises(CommandError, match="missing"):
+            call_command("modelinfo", "--database", "missing", stdout=StringIO())
+
+    def test_profile_table(self, capsys):
+        """The profile goes to stderr, leaving the regular output unchanged."""
+        call_command("modelinfo", "inventory", verbosity=3)
+        plain_output = capsys.readouterr().out
+        call_command("modelinfo", "inventory", "--profile", "--profile-top", "2", verbosity=3)
+        captured = capsys.readouterr()
+
+        assert captured.out == plain_output
+        assert "Slowest models (top 2 of" in captured.err
+        for phase in ("discovery", "modelinfo", "fields", "methods", "managers", "render"):
+            assert phase in captured.err
+
+    def test_profile_before_filter(self, capsys):
+        """--profile takes no value, so a filter can follow it."""
+        call_command("modelinfo", "--profile", "inventory.Product")
+        assert "inventory.Product" in capsys.readouterr().err
+
+    def test_profile_json_with_jobs(self, capsys):
+        """Timings recorded in worker processes are merged into the report."""
+        err = StringIO()
+        call_command(
+            "modelinfo",
+            "--format",
+            "ndjson",
+            "--jobs",
+            "2",
+            "--profile",
+            "--profile-format",
+            "json",
+            "inventory",
+            stderr=err,
+        )
+        report = json.loads(err.getvalue())
+        model_count = report["model_count"]
+
+        assert model_count == len(capsys.readouterr().out.splitlines())
+        assert report["phases"]["fields"]["calls"] == model_count
+        assert len(report["slowest_models"]) == min(model_count, 10)
+
+
+class TestModelProcessor:
+    """Tests for ModelProcessor."""
+
+    def test_modelinfo_rows_skip_unshown_lookups(self, monkeypatch):
+        """Rows past ``modelinfo_rows`` and, at verbosity 1, managers are never looked up."""
+        from example_project.inventory.models import Product
+
+        def fail(*args, **kwargs):
+            raise AssertionError("should not be called")
+
+        monkeypatch.setitem(modelinfo.MODELINFO_GETTERS, "line_number", fail)
+        monkeypatch.setattr(modelinfo.ModelProcessor, "build_manager_info", fail)
+        processor = modelinfo.ModelProcessor(Product, 1, exclude_defaults=False, modelinfo_rows=3)
+        info = processor.build_modelinfo()
+
+        assert info.model_name == "Product"
+        assert info.docstring
+        assert info.is_abstract == ""
+        assert info.managers_info == {}
+
+    def test_all_rows_by_default(self):
+        """Without ``modelinfo_rows`` every row is built."""
+        from example_project.inventory.models import Product
+
+        info = modelinfo.ModelProcessor(Product, 2, exclude_defaults=False).build_modelinfo()
+        assert info.line_number.isdigit()
+        assert "Product" in info.mro
+        assert info.managers_info
+
+    def test_method_info_classified_by_defining_class(self):
+        """Overrides in the project are not common Django methods, while every method from ``Model`` is."""
+        from example_project.inventory.models import Product
+
+        processor = modelinfo.ModelProcessor(Product, 1, exclude_defaults=False)
+        other, private, dunder, common_django = processor.build_method_info(modelinfo.get_clean_method_list(Product))
+
+        assert "clean" in {method.name for method in other}
+        assert {"save", "full_clean", "_do_insert"} <= {method.name for method in common_django}
+        assert not {method.name for method in private} & {method.name for method in common_django}
+        assert "__str__" in {method.name for method in dunder}
+
+    def test_exclude_defaults_hides_inherited_methods(self):
+        """Methods inherited from outside the project are hidden, but ones the model defines itself are kept."""
+        from django.contrib.auth.models import User
+
+        processor = modelinfo.ModelProcessor(User, 1, exclude_defaults=True)
+        method_info = processor.build_method_info(modelinfo.get_clean_method_list(User))
+        names = {method.name for methods in method_info for method in methods}
+
+        assert len(method_info) == 2
+        assert "get_next_by_date_joined" in names
+        assert not names & {"get_full_name", "check_password", "has_perm"}
+
+    def test_extra_database_types(self, second_database):
+        """With several databases, each field has a type per database, rendered right after the first one."""
+        from example_project.inventory.models import Product
+
+        processor = modelinfo.ModelProcessor(Product, 2, exclude_defaults=False, databases=("default", second_database))
+        name_field = next(field for field in processor.build_other_field_info() if field.name == "name")
+
+        assert name_field.extra_db_types == (("second", "varchar2(200)"),)
+        assert name_field.render_row(column_count=5) == [
+            "name",
+            "CharField",
+            "name",
+            "varchar(200)",
+            "varchar2(200)",
+            "name",
+        ]
@@ -0,0 +1,109 @@
+"""Tests for common_utils/_profiling.py."""
+
+import json
+import tracemalloc
+
+from django_model_info.management.commands.common_utils._profiling import Profiler
+
+
+class TestProfiler:
+    """Tests for the Profiler class."""
+
+    def test_disabled_records_nothing(self):
+        profiler = Profiler()
+        with profiler.phase("discovery"), profiler.phase("fields", "sales.Order"):
+            pass
+        profiler.merge_items({"sales.Order": {"fields": {"calls": 1, "wall": 1.0, "cpu": 1.0}}})
+        assert profiler.phases == {}
+        assert profiler.items == {}
+
+    def test_phases_and_items(self):
+        profiler = Profiler(enabled=True)
+        with profiler.phase("discovery"):
+            pass
+        for _ in range(2):
+            with profiler.phase("fields", "sales.Order"):
+                pass
+        assert profiler.phases["discovery"].calls == 1
+        assert profiler.phases["fields"].calls == 2
+        assert list(profiler.items) == ["sales.Order"]
+        assert profiler.items["sales.Order"]["fields"].calls == 2
+
+    def test_nested_phases_exclude_inner_time(self):
+        profiler = Profiler(enabled=True)
+        with profiler.phase("outer"):
+            with profiler.phase("inner"):
+                sum(range(200_000))
+        assert profiler.phases["outer"].wall < profiler.phases["inner"].wall
+
+    def test_merge_items(self):
+        worker = Profiler(enabled=True)
+        with worker.phase("methods", "sales.Order"):
+            pass
+        profiler = Profiler(enabled=True)
+        profiler.merge_items(worker.export_items())
+        profiler.merge_items(worker.export_items())
+        assert profiler.phases["methods"].calls == 2
+        assert profiler.items["sales.Order"]["methods"].calls == 2
+
+    def test_slowest_items(self):
+        profiler = Profiler(enabled=True)
+        profiler.add("fields", 1, 0.5, 0.4, "sales.Order")
+        profiler.add("methods", 1, 0.6, 0.5, "sales.Order")
+        profiler.add("fields", 1, 0.9, 0.8, "inventory.Product")
+        profiler.add("fields", 1, 0.1, 0.1, "inventory.Category")
+
+        slowest = profiler.get_slowest_items(2)
+        assert [item for item, _, _ in slowest] == ["sales.Order", "inventory.Product"]
+        assert slowest[0][1].wall == 1.1
+
+        table = profiler.render_table(2)
+        assert "Slowest models (top 2 of 3)" in table
+        assert "methods (0.600s)" in table
+        assert "inventory.Category" not in table
+
+    def test_json_report(self):
+        profiler = Profiler(enabled=True, item_name="app")
+        profiler.add("migrations", 1, 0.2, 0.1, "sales")
+        report = profiler.to_dict(5)
+        assert report["app_count"] == 1
+        assert report["slowest_apps"][0]["app"] == "sales"
+        assert report["phases"]["migrations"] == {"calls": 1, "wall": 0.2, "cpu": 0.1, "memory": 0, "peak": 0}
+        json.dumps(report)
+
+
+class TestMemoryTracing:
+    """Tests for the Profiler class when memory is traced."""
+
+    def setup_method(self):
+        tracemalloc.start()
+
+    def teardown_method(self):
+        tracemalloc.stop()
+
+    def test_phase_memory(self):
+        profiler = Profiler(enabled=True, trace_memory=True)
+        with profiler.phase("outer", "sales.Order"):
+            retained = [str(number) for number in range(20_000)]
+            with profiler.phase("inner"):
+                temporary = [str(number) for number in range(50_000)]
+                del temporary
+
+        outer, inner = profiler.phases["outer"], profiler.phases["inner"]
+        assert outer.memory > 500_000
+        assert abs(inner.memory) < 100_000
+        assert inner.peak > 1_000_000
+        assert outer.peak >= inner.peak
+        assert profiler.items["sales.Order"]["outer"].memory == outer.memory
+        assert len(retained) == 20_000
+
+    def test_allocation_sites(self):
+        profiler = Profiler(enabled=True, trace_memory=True)
+        with profiler.phase("build"):
+            retained = [str(number) for number in range(20_000)]
+
+        report = profiler.memory_to_dict(5)
+        assert report["peak"] >= report["phases"]["build"]["peak"] > 0
+        assert any(site["file"] == __file__ for site in report["allocation_sites"])
+        assert "Top allocation sites" in profiler.render_memory_table(5)
+        assert len(retained) == 20_000
@@ -0,0 +1,62 @@
+"""Tests for modelinfo_utils/_record_cache.py."""
+
+import os
+
+from django.core.cache import caches
+from django.core.management import call_command
+
+from django_model_info.management.commands import modelinfo
+from django_model_info.management.commands.modelinfo_utils import _record_cache
+from django_model_info.management.commands.modelinfo_utils._record_cache import (
+    get_model_fingerprint,
+    get_model_source_files,
+    get_record_cache_key,
+)
+
+
+class TestModelFingerprint:
+    """Tests for get_model_source_files and get_model_fingerprint."""
+
+    def test_source_files_include_parents_and_related_models(self):
+        from example_project.inventory.models import Product
+
+        files = get_model_source_files(Product)
+        assert any(file.endswith(os.path.join("inventory", "models.py")) for file in files)
+        assert any(file.endswith(os.path.join("common", "models.py")) for file in files)
+
+    def test_fingerprint_changes_with_mtime(self, monkeypatch, tmp_path):
+        from example_project.inventory.models import Product
+
+        source = tmp_path / "models.py"
+        source.write_text("")
+        monkeypatch.setattr(_record_cache, "get_model_source_files", lambda model: [str(source)])
+
+        os.utime(source, ns=(1_000_000_000, 1_000_000_000))
+        before = get_model_fingerprint(Product)
+        os.utime(source, ns=(2_000_000_000, 2_000_000_000))
+        assert get_model_fingerprint(Product) != before
+
+    def test_cache_key_depends_on_options(self):
+        from example_project.inventory.models import Product
+
+        assert get_record_cache_key(Product, 2, False, False) != get_record_cache_key(Product, 3, False, False)
+        assert get_record_cache_key(Product, 2, False, False) != get_record_cache_key(Product, 2, False, True)
+
+
+class TestModelInfoCache:
+    """Tests for the --use-cache option of the modelinfo command."""
+
+    def test_warm_run_skips_introspection(self, monkeypatch, capsys):
+        monkeypatch.setattr(modelinfo, "CACHE_ENABLED", True)
+        monkeypatch.setattr(_record_cache, "cache", caches["default"])
+        caches["default"].clear()
+
+        call_command("modelinfo", "--use-cache", "inventory.Product")
+        cold_output = capsys.readouterr().out
+
+        def fail_build(self):
+            raise AssertionError("record should have been loaded from the cache")
+
+        monkeypatch.setattr(modelinfo.ModelProcessor, "build_record", fail_build)
+        call_command("modelinfo", "--use-cache", "inventory.Product")
+        assert capsys.readouterr().out == cold_output
@@ -0,0 +1,76 @@
+"""Tests for modelinfo_utils/_source_index.py."""
+
+import functools
+import inspect
+
+import pytest
+
+from django_model_info.management.commands.modelinfo_utils._source_index import (
+    find_source_line_number,
+    get_source_index,
+)
+
+
+def _decorator(func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+class _Outer:
+    class Inner:
+        @_decorator
+        def decorated(self):
+            pass
+
+    def redefined(self):
+        pass
+
+    def redefined(self):  # noqa: F811
+        pass
+
+
+class TestGetSourceIndex:
+    """Tests for get_source_index."""
+
+    def test_maps_qualified_names_to_line_numbers(self):
+        index = get_source_index(__file__)
+        assert index["_Outer.Inner"] == [inspect.getsourcelines(_Outer.Inner)[1]]
+        assert "_decorator.<locals>.wrapper" in index
+        assert len(index["_Outer.redefined"]) == 2
+
+    def test_unreadable_file_returns_none(self):
+        assert get_source_index("<string>") is None
+
+
+class TestFindSourceLineNumber:
+    """Tests for find_source_line_number."""
+
+    def test_matches_inspect_for_models_and_methods(self):
+        from example_project.inventory.models import Product
+
+        for obj in (Product, Product.save, Product.__str__, Product.get_next_by_created_at, Product.objects.create):
+            assert find_source_line_number(obj) == inspect.getsourcelines(obj)[1]
+
+    def test_decorated_and_redefined_functions(self):
+        assert find_source_line_number(_Outer.Inner.decorated) == inspect.getsourcelines(_Outer.Inner.decorated)[1]
+        assert find_source_line_number(_Outer.redefined) == _Outer.redefined.__code__.co_firstlineno
+
+    def test_reads_each_file_once(self):
+        from example_project.sales.models import Order
+
+        get_source_index.cache_clear()
+        for name in ("save", "delete", "full_clean", "clean_fields", "validate_unique"):
+            find_source_line_number(getattr(Order, name))
+        assert get_source_index.cache_info().misses == 1
+
+    def test_objects_without_source_raise_like_inspect(self):
+        namespace = {}
+        exec("def generated():\n    pass\n", namespace)
+
+        with pytest.raises(OSError):
+            find_source_line_number(namespace["generated"])
+        with pytest.raises(TypeError):
+            find_source_line_number(len)
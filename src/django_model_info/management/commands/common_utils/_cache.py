@@ -24,7 +24,11 @@ def get_cache_version() -> int:
 
 def increment_cache_version(command: BaseCommand) -> None:
     """Increment the cache version to invalidate all cached results."""
-    current_version = command.get_cache_version()
+    if not CACHE_ENABLED:
+        command.stdout.write("Caching is not enabled, so there are no cached results to clear")
+        return
+
+    current_version = get_cache_version()
     cache.set(CACHE_VERSION_KEY, current_version + 1)
     command.stdout.write(command.style.SUCCESS("Cleared all cached results"))
 
@@ -0,0 +1,96 @@
+"""Stream console output to .txt and .html export files as it is produced."""
+
+from pathlib import Path
+
+from rich.console import CONSOLE_HTML_FORMAT, Console
+from rich.terminal_theme import DEFAULT_TERMINAL_THEME
+
+STREAMED_EXTENSIONS = (".txt", ".html", ".htm")
+
+_CODE_MARKER = "\0code\0"
+
+
+def is_streamed_export(export_option: str | None) -> bool:
+    """Check whether an export file is written from the console output rather than generated separately."""
+    return bool(export_option) and Path(export_option).suffix in STREAMED_EXTENSIONS
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """Write ``content`` to ``path``, unless the file already holds exactly that content.
+
+    Unchanged files are left untouched, modification time included, so incremental builds skip them. Returns
+    whether the file was written.
+    """
+    data = content.encode("utf-8")
+    try:
+        existing = path.read_bytes()
+    except OSError:
+        existing = None
+
+    if existing == data:
+        return False
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return True
+
+
+def create_console(export_option: str | None) -> Console:
+    """Create a console that only records its output when that output will be exported."""
+    return Console(record=is_streamed_export(export_option))
+
+
+class ConsoleExportWriter:
+    """Write a recording console's output to a .txt or .html file in chunks.
+
+    Call ``flush`` after each unit of output (such as one model's tables) to move the recorded segments into the
+    file and clear the console's record buffer, so the buffer never holds more than one unit at a time. With no
+    export path, or a path that is not streamed, every method is a no-op.
+
+    HTML chunks use inline styles, since a shared stylesheet can only be built once all of the output is known.
+    """
+
+    def __init__(self, console: Console, export_option: str | None):
+        self.console = console
+        self.path = Path(export_option) if is_streamed_export(export_option) else None
+        self.is_html = self.path is not None and self.path.suffix in (".html", ".htm")
+        self._file = None
+
+    def __enter__(self) -> "ConsoleExportWriter":
+        if self.path is not None:
+            self._file = open(self.path, "w", encoding="utf-8")
+            if self.is_html:
+                self._file.write(self._html_document()[0])
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._file is None:
+            return
+        try:
+            self.flush()
+            if self.is_html:
+                self._file.write(self._html_document()[1])
+        finally:
+            self._file.close()
+            self._file = None
+
+    def flush(self) -> None:
+        """Move everything recorded since the last flush into the export file."""
+        if self._file is None:
+            return
+        if self.is_html:
+            self._file.write(self.console.export_html(clear=True, inline_styles=True, code_format="{code}"))
+        else:
+            self._file.write(self.console.export_text(clear=True))
+        self._file.flush()
+
+    def _html_document(self) -> tuple[str, str]:
+        """Get the parts of rich's HTML page that come before and after the exported code."""
+        document = CONSOLE_HTML_FORMAT.format(
+            code=_CODE_MARKER,
+            stylesheet="",
+            foreground=DEFAULT_TERMINAL_THEME.foreground_color.hex,
+            background=DEFAULT_TERMINAL_THEME.background_color.hex,
+        )
+        prefix, suffix = document.split(_CODE_MARKER)
+        return prefix, suffix
@@ -0,0 +1,364 @@
+"""Measure the phases of a management command run, overall and per model, for ``--profile`` and ``--memory-report``."""
+
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass
+
+from django.core.management.base import CommandParser
+
+_NULL_CONTEXT = nullcontext()
+
+MIB = 1024 * 1024
+
+SNAPSHOT_GROWTH = 1.1
+"""Retained memory must grow by this factor, between phases, before the allocation sites are captured again."""
+
+MEMORY_REPORT_EXCLUDES = (
+    tracemalloc.__file__,
+    __file__,
+    "<frozen importlib._bootstrap>",
+    "<frozen importlib._bootstrap_external>",
+    "<unknown>",
+)
+"""Files whose allocations are left out of the top allocation sites."""
+
+
+def add_profile_arguments(parser: CommandParser, item_name: str = "model") -> None:
+    """Add the ``--profile`` and ``--memory-report`` options shared by every command."""
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help=f"Record wall and CPU time per phase and per {item_name}, and print a summary to stderr when done.",
+    )
+    parser.add_argument(
+        "--profile-format",
+        choices=["table", "json"],
+        default="table",
+        help="Format of the --profile summary: a table (default) or JSON.",
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=10,
+        help=f"Number of slowest {item_name}s listed by --profile (default: 10).",
+    )
+    parser.add_argument(
+        "--memory-report",
+        action="store_true",
+        help="Trace memory allocations with tracemalloc, and print the peak, the change and peak of each phase, "
+        "and the top allocation sites to stderr when done. Slows the run down.",
+    )
+    parser.add_argument(
+        "--memory-report-format",
+        choices=["table", "json"],
+        default="table",
+        help="Format of the --memory-report summary: a table (default) or JSON.",
+    )
+    parser.add_argument(
+        "--memory-top",
+        type=int,
+        default=10,
+        help=f"Number of allocation sites and {item_name}s listed by --memory-report (default: 10).",
+    )
+
+
+@dataclass(slots=True)
+class PhaseTiming:
+    """Time and memory spent in a phase, excluding the phases nested inside it.
+
+    ``memory`` is the change in traced memory, in bytes, and ``peak`` the highest traced memory above the start of
+    any call, including the phases nested in it. Both stay at 0 unless memory is traced.
+    """
+
+    calls: int = 0
+    wall: float = 0.0
+    cpu: float = 0.0
+    memory: int = 0
+    peak: int = 0
+
+    def add(self, calls: int, wall: float, cpu: float, memory: int = 0, peak: int = 0) -> None:
+        """Add the time and memory of one or more calls."""
+        self.calls += calls
+        self.wall += wall
+        self.cpu += cpu
+        self.memory += memory
+        self.peak = max(self.peak, peak)
+
+
+class Profiler:
+    """Record the wall and CPU time of each phase of a run, overall and per model (or other item, such as an app).
+
+    Phases can be nested; each records only its own time, so the times of all phases add up to the time spent
+    inside them. A disabled profiler's ``phase`` returns a shared no-op context manager, so instrumented code
+    costs next to nothing when ``--profile`` isn't used.
+
+    With ``trace_memory``, phases also record the change in memory traced by ``tracemalloc`` (which must be
+    tracing) and the peak reached. The allocation sites are captured whenever retained memory between top-level
+    phases reaches a new high, so the report shows what was held at the largest point rather than at the end.
+    """
+
+    def __init__(self, enabled: bool = False, item_name: str = "model", trace_memory: bool = False):
+        self.enabled = enabled
+        self.item_name = item_name
+        self.trace_memory = trace_memory
+        self.phases: dict[str, PhaseTiming] = {}
+        self.items: dict[str, dict[str, PhaseTiming]] = {}
+        self.peak_memory = 0
+        self._stack: list[list] = []
+        self._snapshot: tracemalloc.Snapshot | None = None
+        self._snapshot_memory = 0
+        self._start_wall = time.perf_counter()
+        self._start_cpu = time.process_time()
+        self._start_memory = tracemalloc.get_traced_memory()[0] if trace_memory else 0
+
+    def phase(self, name: str, item: str | None = None):
+        """Time a block of code as a phase, attributed to ``item`` (a model label) if given."""
+        if not self.enabled:
+            return _NULL_CONTEXT
+        return self._timed(name, item)
+
+    @contextmanager
+    def _timed(self, name: str, item: str | None):
+        # Each entry on the stack accumulates the wall time, CPU time and memory change of the phases nested
+        # inside it, and holds the highest traced memory seen while it was open
+        start_memory = self._fold_peak() if self.trace_memory else 0
+        nested = [0.0, 0.0, 0, start_memory]
+        self._stack.append(nested)
+        start_wall, start_cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - start_wall
+            cpu = time.process_time() - start_cpu
+            memory = peak = 0
+            if self.trace_memory:
+                current = self._fold_peak()
+                memory = current - start_memory
+                peak = nested[3] - start_memory
+            self._stack.pop()
+            if self._stack:
+                self._stack[-1][0] += wall
+                self._stack[-1][1] += cpu
+                self._stack[-1][2] += memory
+            elif self.trace_memory:
+                self._capture_allocation_sites(current)
+            self.add(name, 1, wall - nested[0], cpu - nested[1], item, memory - nested[2], peak)
+
+    def _fold_peak(self) -> int:
+        """Record the peak traced since the last call in every open phase, and return the current traced memory."""
+        current, peak = tracemalloc.get_traced_memory()
+        self.peak_memory = max(self.peak_memory, peak)
+        for entry in self._stack:
+            entry[3] = max(entry[3], peak)
+        tracemalloc.reset_peak()
+        return current
+
+    def _capture_allocation_sites(self, current: int) -> None:
+        """Take a snapshot of the allocation sites if retained memory has grown enough since the last one."""
+        if current > self._snapshot_memory * SNAPSHOT_GROWTH:
+            self._snapshot = tracemalloc.take_snapshot()
+            self._snapshot_memory = current
+
+    def add(
+        self, name: str, calls: int, wall: float, cpu: float, item: str | None = None, memory: int = 0, peak: int = 0
+    ) -> None:
+        """Add time and memory to a phase, and to the item's share of it."""
+        self.phases.setdefault(name, PhaseTiming()).add(calls, wall, cpu, memory, peak)
+        if item is not None:
+            self.items.setdefault(item, {}).setdefault(name, PhaseTiming()).add(calls, wall, cpu, memory, peak)
+
+    def export_items(self) -> dict:
+        """Get the per-item timings as plain data, to send from a worker process to ``merge_items``."""
+        return {item: {name: asdict(timing) for name, timing in phases.items()} for item, phases in self.items.items()}
+
+    def merge_items(self, items: dict) -> None:
+        """Add per-item timings recorded by another profiler, such as one in a worker process."""
+        if not self.enabled:
+            return
+        for item, phases in items.items():
+            for name, timing in phases.items():
+                self.add(name, item=item, **timing)
+
+    def get_item_totals(self) -> list[tuple[str, PhaseTiming, dict[str, PhaseTiming]]]:
+        """Get each item with its total and per-phase timings."""
+        totals = []
+        for item, phases in self.items.items():
+            total = PhaseTiming()
+            for timing in phases.values():
+                total.add(timing.calls, timing.wall, timing.cpu, timing.memory, timing.peak)
+            totals.append((item, total, phases))
+        return totals
+
+    def get_slowest_items(self, top: int) -> list[tuple[str, PhaseTiming, dict[str, PhaseTiming]]]:
+        """Get the ``top`` items with the most wall time, with their total and per-phase timings."""
+        return sorted(self.get_item_totals(), key=lambda entry: entry[1].wall, reverse=True)[:top]
+
+    def get_largest_items(self, top: int) -> list[tuple[str, PhaseTiming, dict[str, PhaseTiming]]]:
+        """Get the ``top`` items with the highest memory peak, with their total and per-phase timings."""
+        return sorted(self.get_item_totals(), key=lambda entry: entry[1].peak, reverse=True)[:top]
+
+    def get_allocation_sites(self, top: int) -> list[tracemalloc.Statistic]:
+        """Get the ``top`` source lines holding the most memory when retained memory was highest."""
+        if self._snapshot is None:
+            return []
+        snapshot = self._snapshot.filter_traces(
+            [tracemalloc.Filter(False, filename) for filename in MEMORY_REPORT_EXCLUDES]
+        )
+        return snapshot.statistics("lineno")[:top]
+
+    def to_dict(self, top: int) -> dict:
+        """Get the whole report as a dict that can be serialized as JSON."""
+        return {
+            "wall": time.perf_counter() - self._start_wall,
+            "cpu": time.process_time() - self._start_cpu,
+            "phases": {name: asdict(timing) for name, timing in self.phases.items()},
+            f"{self.item_name}_count": len(self.items),
+            f"slowest_{self.item_name}s": [
+                {
+                    self.item_name: item,
+                    "wall": total.wall,
+                    "cpu": total.cpu,
+                    "phases": {name: asdict(timing) for name, timing in phases.items()},
+                }
+                for item, total, phases in self.get_slowest_items(top)
+            ],
+        }
+
+    def memory_to_dict(self, top: int) -> dict:
+        """Get the memory report as a dict that can be serialized as JSON. Sizes are in bytes."""
+        self._fold_peak()
+        return {
+            "peak": self.peak_memory - self._start_memory,
+            "retained": tracemalloc.get_traced_memory()[0] - self._start_memory,
+            "phases": {
+                name: {"calls": timing.calls, "memory": timing.memory, "peak": timing.peak}
+                for name, timing in self.phases.items()
+            },
+            f"largest_{self.item_name}s": [
+                {self.item_name: item, "memory": total.memory, "peak": total.peak}
+                for item, total, _ in self.get_largest_items(top)
+            ],
+            "allocation_sites_retained": self._snapshot_memory - self._start_memory,
+            "allocation_sites": [
+                {
+                    "file": statistic.traceback[0].filename,
+                    "line": statistic.traceback[0].lineno,
+                    "size": statistic.size,
+                    "count": statistic.count,
+                }
+                for statistic in self.get_allocation_sites(top)
+            ],
+        }
+
+    def render_table(self, top: int) -> str:
+        """Render the report as plain text tables."""
+        report = self.to_dict(top)
+        lines = [
+            f"Profile: {report['wall']:.3f}s wall, {report['cpu']:.3f}s CPU",
+            "",
+            f"{'Phase':<24} {'Calls':>8} {'Wall (s)':>10} {'CPU (s)':>10} {'% wall':>7}",
+        ]
+        for name, timing in sorted(self.phases.items(), key=lambda entry: entry[1].wall, reverse=True):
+            share = timing.wall / report["wall"] * 100 if report["wall"] else 0.0
+            lines.append(f"{name:<24} {timing.calls:>8} {timing.wall:>10.3f} {timing.cpu:>10.3f} {share:>7.1f}")
+
+        slowest = self.get_slowest_items(top)
+        if slowest:
+            title = self.item_name.capitalize()
+            lines += [
+                "",
+                f"Slowest {self.item_name}s (top {len(slowest)} of {len(self.items)})",
+                f"{title:<40} {'Wall (s)':>10} {'CPU (s)':>10}  Slowest phase",
+            ]
+            for item, total, phases in slowest:
+                phase_name, phase_timing = max(phases.items(), key=lambda entry: entry[1].wall)
+                lines.append(
+                    f"{item:<40} {total.wall:>10.3f} {total.cpu:>10.3f}  {phase_name} ({phase_timing.wall:.3f}s)"
+                )
+        return "\n".join(lines)
+
+    def render_memory_table(self, top: int) -> str:
+        """Render the memory report as plain text tables, with sizes in MiB."""
+        report = self.memory_to_dict(top)
+        lines = [
+            f"Memory: {report['peak'] / MIB:.2f} MiB peak, {report['retained'] / MIB:.2f} MiB retained at the end",
+            "",
+            f"{'Phase':<24} {'Calls':>8} {'Change (MiB)':>13} {'Peak (MiB)':>11}",
+        ]
+        for name, timing in sorted(self.phases.items(), key=lambda entry: entry[1].peak, reverse=True):
+            lines.append(f"{name:<24} {timing.calls:>8} {timing.memory / MIB:>13.2f} {timing.peak / MIB:>11.2f}")
+
+        largest = report[f"largest_{self.item_name}s"]
+        if largest:
+            title = self.item_name.capitalize()
+            lines += [
+                "",
+                f"Largest {self.item_name}s by peak (top {len(largest)} of {len(self.items)})",
+                f"{title:<40} {'Change (MiB)':>13} {'Peak (MiB)':>11}",
+            ]
+            for entry in largest:
+                lines.append(f"{entry[self.item_name]:<40} {entry['memory'] / MIB:>13.2f} {entry['peak'] / MIB:>11.2f}")
+
+        sites = report["allocation_sites"]
+        if sites:
+            lines += [
+                "",
+                f"Top allocation sites, when {report['allocation_sites_retained'] / MIB:.2f} MiB was retained",
+                f"{'Size (MiB)':>10} {'Blocks':>10}  Location",
+            ]
+            for site in sites:
+                lines.append(f"{site['size'] / MIB:>10.2f} {site['count']:>10}  {site['file']}:{site['line']}")
+        return "\n".join(lines)
+
+    def write_report(self, stream, output_format: str, top: int) -> None:
+        """Write the report to ``stream`` as a table or as JSON."""
+        if output_format == "json":
+            stream.write(json.dumps(self.to_dict(top), indent=2))
+        else:
+            stream.write(self.render_table(top))
+
+    def write_memory_report(self, stream, output_format: str, top: int) -> None:
+        """Write the memory report to ``stream`` as a table or as JSON."""
+        if output_format == "json":
+            stream.write(json.dumps(self.memory_to_dict(top), indent=2))
+        else:
+            stream.write(self.render_memory_table(top))
+
+
+class ProfiledCommandMixin:
+    """Run a management command with a ``Profiler``, and write its reports to stderr when asked to.
+
+    Commands time their phases with ``self.profiler.phase(...)``, which is a no-op unless ``--profile`` or
+    ``--memory-report`` is used, including when ``handle`` is called directly.
+    """
+
+    profiler = Profiler()
+    profile_item_name = "model"
+
+    def execute(self, *args, **options):
+        """Create the profiler for this run, and report once the command has finished."""
+        profile, memory_report = options.get("profile"), options.get("memory_report")
+        start_tracing = bool(memory_report) and not tracemalloc.is_tracing()
+        if start_tracing:
+            tracemalloc.start()
+        try:
+            self.profiler = Profiler(
+                enabled=bool(profile or memory_report),
+                item_name=self.profile_item_name,
+                trace_memory=bool(memory_report),
+            )
+            output = super().execute(*args, **options)
+            if profile:
+                self.profiler.write_report(
+                    self.stderr, options.get("profile_format", "table"), options.get("profile_top", 10)
+                )
+            if memory_report:
+                self.profiler.write_memory_report(
+                    self.stderr, options.get("memory_report_format", "table"), options.get("memory_top", 10)
+                )
+        finally:
+            if start_tracing:
+                tracemalloc.stop()
+        return output
@@ -35,3 +35,9 @@ CACHE_KEY_PREFIX = _DJANGO_MODELINFO.get("CACHE_KEY_PREFIX", "modelfilters:")
 
 CACHE_VERSION_KEY = f"{CACHE_KEY_PREFIX}version"
 """str: The cache key for the cache version."""
+
+METHOD_CACHE_SIZE = _DJANGO_MODELINFO.get("METHOD_CACHE_SIZE", 4096)
+"""int: The maximum number of methods whose introspection results are kept in memory. Use 0 to disable."""
+
+EXHAUSTIVE_MANAGER_SCAN = _DJANGO_MODELINFO.get("EXHAUSTIVE_MANAGER_SCAN", False)
+"""bool: Find model managers by getting every attribute in dir(model), instead of scanning the class dicts."""
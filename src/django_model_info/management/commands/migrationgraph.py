@@ -6,11 +6,14 @@ from django.apps import apps as django_apps
 from django.core.management.base import BaseCommand, CommandError
 from django.db.migrations.loader import MigrationLoader
 
+from .common_utils._profiling import ProfiledCommandMixin, add_profile_arguments
 
-class Command(BaseCommand):
+
+class Command(ProfiledCommandMixin, BaseCommand):
     """A management command to Visualize migrations and dependencies for applications in the project."""
 
     help = "Visualize migrations and dependencies for apps in the project, limiting to the specified apps, if any."
+    profile_item_name = "app"
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -27,11 +30,13 @@ class Command(BaseCommand):
             nargs="*",
             help="Optional list of application labels.",
         )
+        add_profile_arguments(parser, item_name="app")
 
     def handle(self, *args, **options):
         """Handle the command."""
         app_labels = options["app_labels"]
-        self.loader = MigrationLoader(None, ignore_no_migrations=True)
+        with self.profiler.phase("loader"):
+            self.loader = MigrationLoader(None, ignore_no_migrations=True)
 
         if not app_labels:
             app_labels = [app_config.label for app_config in django_apps.get_app_configs()]
@@ -44,17 +49,20 @@ class Command(BaseCommand):
                     raise CommandError(f"{e}. Are you sure your INSTALLED_APPS setting is correct?") from e
 
         self.app_labels = set(app_labels)
-        self._build_reverse_dependencies()
+        with self.profiler.phase("dependencies"):
+            self._build_reverse_dependencies()
 
         for idx, app in enumerate(app_labels):
-            self._print_success(f"[{app}]")
-            self._print_app_migrationgraph(app)
-            if idx != len(app_labels) - 1:
-                self.stdout.write("\n")
+            with self.profiler.phase("migrations", app):
+                self._print_success(f"[{app}]")
+                self._print_app_migrationgraph(app)
+                if idx != len(app_labels) - 1:
+                    self.stdout.write("\n")
 
         # Collect nodes from edges and print MermaidJS flowchart
-        self._collect_nodes_from_edges()
-        self._print_mermaidjs_flowchart()
+        with self.profiler.phase("flowchart"):
+            self._collect_nodes_from_edges()
+            self._print_mermaidjs_flowchart()
 
     def _build_reverse_dependencies(self):
         """Build a mapping of reverse dependencies for all migrations."""
@@ -3,9 +3,12 @@
 import hashlib
 import json
 import logging
+import sys
+from collections.abc import Iterable, Iterator
+from contextlib import ExitStack
 from io import StringIO
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 from django.apps import apps
 from django.core.management.base import BaseCommand, CommandParser
@@ -13,18 +16,23 @@ from rich.console import Console
 from rich.table import Table
 
 from .common_utils._cache import cache, get_cache_version, increment_cache_version
+from .common_utils._export import ConsoleExportWriter, create_console, is_streamed_export
+from .common_utils._profiling import ProfiledCommandMixin, add_profile_arguments
 from .common_utils._settings import (
     CACHE_ALWAYS,
     CACHE_ENABLED,
     CACHE_KEY_PREFIX,
     CACHE_TIMEOUT,
 )
-from .modelfilters_utils._field_utils import get_model_from_input, get_ordered_fields
+from .modelfilters_utils._field_utils import (
+    RelationIndex,
+    get_model_from_input,
+    get_ordered_fields,
+    iter_ordered_fields,
+)
 
 logger = logging.getLogger(__name__)
 
-console = Console(record=True)
-
 
 def get_cache_key(model: Any, options: dict[str, Any]) -> str:
     """Generate a cache key based on model and options."""
@@ -47,7 +55,7 @@ def get_cache_key(model: Any, options: dict[str, Any]) -> str:
     return f"{CACHE_KEY_PREFIX}{key_hash}"
 
 
-class Command(BaseCommand):
+class Command(ProfiledCommandMixin, BaseCommand):
     """Display model field relationships in tabular format."""
 
     help = "Display model field relationships in tabular or markdown format"
@@ -55,6 +63,9 @@ class Command(BaseCommand):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.export_option = None
+        self.console = Console()
+        self.relation_index = RelationIndex()
+        self.results: dict[str, list[list[str]]] = {}
 
     def get_options(self, options) -> tuple:
         """Get verbosity, filter, and export options."""
@@ -128,6 +139,11 @@ class Command(BaseCommand):
             action="store_true",
             help="Sort by related model name",
         )
+        parser.add_argument(
+            "--stream",
+            action="store_true",
+            help="Write each path in markdown as soon as it is found, instead of sorting and tabulating all paths",
+        )
 
         # Export options
         parser.add_argument(
@@ -157,6 +173,8 @@ class Command(BaseCommand):
             help="Invalidate all cached results before running",
         )
 
+        add_profile_arguments(parser)
+
     def handle(self, *args: Any, **options: Any) -> None:
         """Execute command."""
         # Clear cache if requested using version invalidation
@@ -166,30 +184,44 @@ class Command(BaseCommand):
                 return
 
         self.export_option = self.get_options(options)
+        self.relation_index = RelationIndex()
+        self.results = {}
 
-        models = self.get_filtered_models(options["filter"])
+        with self.profiler.phase("discovery"):
+            models = self.get_filtered_models(options["filter"])
 
         if not models:
             self.stderr.write("No models found matching filters")
             return
 
-        for model in sorted(models, key=lambda x: x._meta.label):
-            data = self.get_table_data(model, options)
+        if options["stream"]:
+            self.stream_results(models, options)
+            return
 
-            if options["markdown"]:
-                self.print_markdown(model, data)
-            else:
-                self.print_table(model, data)
+        self.console = create_console(self.export_option)
 
-        total = sum(len(self.get_table_data(m, options)) for m in models)
+        with ConsoleExportWriter(self.console, self.export_option) as export_writer:
+            for model in sorted(models, key=lambda x: x._meta.label):
+                with self.profiler.phase("traversal", model._meta.label):
+                    data = self.get_model_data(model, options)
 
-        if options["markdown"]:
-            print(f"\n**Total Fields: {total}**")
-        else:
-            console.print(f"\nTotal Fields: {total}", style="bold green")
+                with self.profiler.phase("render", model._meta.label):
+                    if options["markdown"]:
+                        self.print_markdown(model, data)
+                    else:
+                        self.print_table(model, data)
+                    export_writer.flush()
+
+            total = sum(len(self.get_model_data(model, options)) for model in models)
+
+            if options["markdown"]:
+                print(f"\n**Total Fields: {total}**")
+            else:
+                self.console.print(f"\nTotal Fields: {total}", style="bold green")
 
-        if self.export_option:
-            self.export_results(models, options)
+        if self.export_option and not is_streamed_export(self.export_option):
+            with self.profiler.phase("export"):
+                self.export_results(models, options)
 
     def get_filtered_models(self, filters: list[str] | None, prefix: str | None = None) -> list[Any]:
         """Get models based on filter arguments."""
@@ -250,15 +282,15 @@ class Command(BaseCommand):
 
         return list(set(processed_excludes))
 
-    def get_table_data(self, model: Any, options: dict[str, Any]) -> list[list[str]]:
-        """Get field data for a model."""
-        if CACHE_ENABLED:
-            if options.get("use_cache") or CACHE_ALWAYS:
-                cache_key = get_cache_key(model, options)
-                cached_data = cache.get(cache_key)
-                if cached_data is not None:
-                    return cached_data
+    def get_model_data(self, model: Any, options: dict[str, Any]) -> list[list[str]]:
+        """Get field data for a model, from the results of this run if it has already been computed."""
+        data = self.results.get(model._meta.label)
+        if data is None:
+            data = self.results[model._meta.label] = self.get_table_data(model, options)
+        return data
 
+    def get_traversal_options(self, options: dict[str, Any]) -> list[dict[str, Any]]:
+        """Get the arguments of each traversal of a model, one for each target model."""
         # Process multiple target models
         target_models = []
         if options.get("target_model"):
@@ -271,42 +303,50 @@ class Command(BaseCommand):
         # Process exclude patterns
         processed_excludes = self.process_exclude_patterns(options.get("exclude", []))
 
+        return [
+            {
+                "by_depth": options["by_depth"],
+                "by_model": options["by_model"],
+                "target_model": target_model,
+                "target_field": options.get("target_field"),
+                "max_depth": options["max_depth"],
+                "max_paths": options["max_paths"],
+                "excludes": processed_excludes,
+                "target_field_type": options.get("target_field_type"),
+                "relation_index": self.relation_index,
+            }
+            for target_model in target_models or [None]
+        ]
+
+    def filter_prefix(self, rows: Iterable[list[str]], prefix: str) -> Iterator[list[str]]:
+        """Filter rows to those with a field path part starting with ``prefix``."""
+        return (row for row in rows if any(part.startswith(prefix.lower()) for part in row[0].split("__")))
+
+    def iter_table_data(self, model: Any, options: dict[str, Any]) -> Iterator[list[str]]:
+        """Yield field data for a model as it is found, without caching or sorting it."""
+        for traversal_options in self.get_traversal_options(options):
+            rows = iter_ordered_fields(model, **traversal_options)
+            if options.get("prefix"):
+                rows = self.filter_prefix(rows, options["prefix"])
+            yield from rows
+
+    def get_table_data(self, model: Any, options: dict[str, Any]) -> list[list[str]]:
+        """Get field data for a model."""
+        if CACHE_ENABLED:
+            if options.get("use_cache") or CACHE_ALWAYS:
+                cache_key = get_cache_key(model, options)
+                cached_data = cache.get(cache_key)
+                if cached_data is not None:
+                    return cached_data
+
         # Get all field data for each target model
         all_data = []
-        if target_models:
-            for target_model in target_models:
-                data = get_ordered_fields(
-                    model,
-                    by_depth=options["by_depth"],
-                    by_model=options["by_model"],
-                    target_model=target_model,
-                    target_field=options.get("target_field"),
-                    max_depth=options["max_depth"],
-                    max_paths=options["max_paths"],
-                    excludes=processed_excludes,
-                    target_field_type=options.get("target_field_type"),
-                )
-                all_data.extend(data)
-        else:
-            all_data = get_ordered_fields(
-                model,
-                by_depth=options["by_depth"],
-                by_model=options["by_model"],
-                target_model=None,
-                target_field=options.get("target_field"),
-                max_depth=options["max_depth"],
-                max_paths=options["max_paths"],
-                excludes=processed_excludes,
-                target_field_type=options.get("target_field_type"),
-            )
+        for traversal_options in self.get_traversal_options(options):
+            all_data.extend(get_ordered_fields(model, **traversal_options))
 
         # Apply prefix filter if specified
         if options.get("prefix"):
-            all_data = [
-                row
-                for row in all_data
-                if any(part.startswith(options["prefix"].lower()) for part in row[0].split("__"))
-            ]
+            all_data = list(self.filter_prefix(all_data, options["prefix"]))
 
         if CACHE_ENABLED:
             if options.get("use_cache") or CACHE_ALWAYS:
@@ -316,28 +356,58 @@ class Command(BaseCommand):
 
     def print_markdown(self, model: Any, data: list[list[str]]) -> None:
         """Print table in markdown format."""
-        if not data:
-            return
+        self.write_markdown_table([sys.stdout], model, data)
 
-        print(f"\n## {model._meta.label}")
-        print("\n| Field Path | Model | Field Name | Field Type | Models in Path |")
-        print("|------------|-------|------------|------------|----------------|")
-        for row in data:
-            print(f"| {row[0]} | {row[1]} | {row[2]} | {row[3]} | {row[4]} |")
+    def write_markdown_table(self, streams: list[TextIO], model: Any, rows: Iterable[list[str]]) -> int:
+        """Write a model's rows as a markdown table to each stream, a row at a time, and return the row count.
+
+        Nothing is written for a model without rows.
+        """
+        count = 0
+        for row in rows:
+            if not count:
+                for stream in streams:
+                    stream.write(f"\n## {model._meta.label}\n")
+                    stream.write("\n| Field Path | Model | Field Name | Field Type | Models in Path |\n")
+                    stream.write("|------------|-------|------------|------------|----------------|\n")
+            line = f"| {row[0]} | {row[1]} | {row[2]} | {row[3]} | {row[4]} |\n"
+            for stream in streams:
+                stream.write(line)
+            count += 1
+        return count
 
     def export_markdown(self, models: list, options: dict[str, Any]) -> str:
         """Export markdown content."""
         output = StringIO()
-        for model in models:
-            data = self.get_table_data(model, options)
-            if data:
-                output.write(f"\n## {model._meta.label}\n")
-                output.write("\n| Field Path | Model | Field Name | Field Type | Models in Path |\n")
-                output.write("|------------|-------|------------|------------|----------------|\n")
-                for row in data:
-                    output.write(f"| {row[0]} | {row[1]} | {row[2]} | {row[3]} | {row[4]} |\n")
+        self.write_markdown(models, options, output)
         return output.getvalue()
 
+    def write_markdown(self, models: list, options: dict[str, Any], stream: TextIO) -> None:
+        """Write markdown content to ``stream``, one row at a time, from the results of this run."""
+        for model in models:
+            self.write_markdown_table([stream], model, self.get_model_data(model, options))
+
+    def stream_results(self, models: list, options: dict[str, Any]) -> None:
+        """Write each model's rows in markdown as they are found, to stdout and to the .md export if there is one.
+
+        Rows are neither cached nor kept, so memory use does not grow with the number of paths.
+        """
+        if self.export_option and Path(self.export_option).suffix != ".md":
+            self.stderr.write("--stream can only export to .md files")
+            return
+
+        with ExitStack() as stack:
+            streams = [sys.stdout]
+            if self.export_option:
+                streams.append(stack.enter_context(open(self.export_option, "w", encoding="utf-8")))
+
+            total = 0
+            for model in sorted(models, key=lambda x: x._meta.label):
+                with self.profiler.phase("stream", model._meta.label):
+                    total += self.write_markdown_table(streams, model, self.iter_table_data(model, options))
+
+        print(f"\n**Total Fields: {total}**")
+
     def print_table(self, model: Any, data: list[list[str]]) -> None:
         """Print table using rich."""
         if not data:
@@ -354,17 +424,12 @@ class Command(BaseCommand):
         for row in data:
             table.add_row(*row)
 
-        console.print(table)
-        console.print("")
+        self.console.print(table)
+        self.console.print("")
 
     def export_results(self, models=None, options=None):
-        """Handle export functionality."""
+        """Handle export functionality for files not streamed from the console (.txt, .html, and .htm are)."""
         extension = Path(self.export_option).suffix
-        if extension in [".html", ".htm"]:
-            console.save_html(path=self.export_option)
-        elif extension == ".txt":
-            console.save_text(path=self.export_option)
-        elif extension == ".md":
-            md_content = self.export_markdown(models, options)
+        if extension == ".md":
             with open(self.export_option, "w", encoding="utf-8") as f:
-                f.write(md_content)
+                self.write_markdown(models, options, f)
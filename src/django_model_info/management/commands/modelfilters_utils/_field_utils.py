@@ -4,8 +4,12 @@ Modified from utils.py in django-drip-campaigns.
 """
 
 import re
+from collections import Counter
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass
 from datetime import timedelta
+from functools import lru_cache
+from itertools import islice
 from typing import NamedTuple, TypeVar
 
 from django.apps import apps
@@ -22,6 +26,9 @@ FieldType = Field | ForeignKey | OneToOneField | RelatedObject | ManyToManyField
 ModelInput = type[models.Model] | str
 basestring = (str, bytes)
 
+MAX_MODEL_STACK = 7
+"""The most models a path can go through, whatever ``max_depth`` is."""
+
 
 class FieldNotFoundError(Exception):
     """Custom exception for when a field is not found."""
@@ -143,7 +150,7 @@ def check_redundant(model_stack: list[type[models.Model]], stack_limit: int, max
     if len(model_stack) > stack_limit:
         if (
             (model_stack[-3] == model_stack[-1])
-            or (len(model_stack) > 7)
+            or (len(model_stack) > MAX_MODEL_STACK)
             or (len(set(model_stack)) != len(model_stack))
         ):
             stop_recursion = True
@@ -181,6 +188,132 @@ def is_valid_instance(field: FieldType) -> bool:
     return isinstance(field, (ForeignKey, OneToOneField, RelatedObject, ManyToManyField))
 
 
+class FieldEdge(NamedTuple):
+    """A field of a model, with what the traversal needs to know about it looked up once."""
+
+    field: FieldType
+    name: str
+    type_name: str
+    related_model: type[models.Model] | None
+    """The model the traversal continues into, or ``None`` if the field is not a followed relation."""
+    normalized_name: str
+    """The field name as field-path exclude patterns are matched against it."""
+    related_key: tuple[str, str] | None
+    """The related model's lowercased app label and normalized name, as model exclude patterns are matched."""
+
+
+@dataclass
+class ModelAdjacency:
+    """A model's fields, in traversal order and without duplicates, and the models its relations lead to."""
+
+    name: str
+    label: str
+    edges: tuple[FieldEdge, ...]
+
+
+def build_field_edge(field: FieldType) -> FieldEdge:
+    """Look up what the traversal needs to know about a field."""
+    name = get_field_name(field)
+    related_model = get_rel_model(field) if is_valid_instance(field) else None
+    return FieldEdge(
+        field=field,
+        name=name,
+        type_name=field.__class__.__name__,
+        related_model=related_model,
+        normalized_name=normalize_model_name(name),
+        related_key=normalize_app_model(related_model._meta.label) if related_model is not None else None,
+    )
+
+
+def build_model_adjacency(model: type[models.Model]) -> ModelAdjacency:
+    """Index a model's concrete fields, many-to-many fields and remaining fields (reverse relations included).
+
+    The fields are taken in that order, each once. Walking a duplicate again only finds rows that were already
+    seen, so the rows are the same as when every list was walked in full.
+    """
+    meta = model._meta
+    unique_fields = {}
+    for field in (*meta.fields, *meta.many_to_many, *meta.get_fields()):
+        unique_fields.setdefault(id(field), field)
+
+    edges = tuple(build_field_edge(field) for field in unique_fields.values())
+    return ModelAdjacency(name=model.__name__, label=meta.label, edges=edges)
+
+
+class RelationIndex:
+    """The adjacency of every model reached during a run, each built the first time the model is visited.
+
+    Create one per command run and pass it to every traversal, so models shared between root models are only
+    indexed once.
+    """
+
+    def __init__(self):
+        self._models: dict[type[models.Model], ModelAdjacency] = {}
+
+    def __getitem__(self, model: type[models.Model]) -> ModelAdjacency:
+        adjacency = self._models.get(model)
+        if adjacency is None:
+            adjacency = self._models[model] = build_model_adjacency(model)
+        return adjacency
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+
+@dataclass(frozen=True)
+class ExcludeMatcher:
+    """Exclude patterns compiled for matching, see ``should_skip_field`` for the kinds of pattern.
+
+    Field-path patterns are searched for with a single regular expression, and ``app.Model`` and bare model name
+    patterns are looked up in sets of normalized names.
+    """
+
+    field_paths: re.Pattern | None
+    longest_field_path: int
+    app_models: frozenset[tuple[str, str | None]]
+    model_names: frozenset[str]
+
+    def matches_field_path(self, normalized_field_path: str, start: int = 0) -> bool:
+        """Check a normalized field path, from ``start`` on, for a field-path pattern."""
+        return self.field_paths is not None and self.field_paths.search(normalized_field_path, start) is not None
+
+    def matches_model(self, key: tuple[str, str]) -> bool:
+        """Check a model, as its lowercased app label and normalized name, for an app.Model or model pattern."""
+        return key in self.app_models or key[1] in self.model_names
+
+    def should_skip(self, full_field: str, model_name: str, model_path: str) -> bool:
+        """Check a field the way ``should_skip_field`` does."""
+        if self.matches_field_path(normalize_model_name(full_field)):
+            return True
+        if not self.app_models and not self.model_names:
+            return False
+        if normalize_model_name(model_name) in self.model_names:
+            return True
+        return any(self.matches_model(normalize_app_model(label)) for label in model_path.split(",") if "." in label)
+
+
+@lru_cache(maxsize=32)
+def compile_excludes(excludes: tuple[str, ...]) -> ExcludeMatcher:
+    """Compile exclude patterns into a matcher, once for each set of patterns."""
+    field_paths = []
+    app_models = set()
+    model_names = set()
+    for exclude_pattern in excludes:
+        if "__" in exclude_pattern:
+            field_paths.append(exclude_pattern.lower())
+        elif "." in exclude_pattern:
+            app_models.add(normalize_app_model(exclude_pattern))
+        else:
+            model_names.add(normalize_model_name(exclude_pattern))
+
+    return ExcludeMatcher(
+        field_paths=re.compile("|".join(map(re.escape, field_paths))) if field_paths else None,
+        longest_field_path=max(map(len, field_paths), default=0),
+        app_models=frozenset(app_models),
+        model_names=frozenset(model_names),
+    )
+
+
 def should_skip_field(full_field: str, model_name: str, model_path: str, excludes: list[str]) -> bool:
     """Check if field should be skipped based on exclusion rules.
 
@@ -197,48 +330,7 @@ def should_skip_field(full_field: str, model_name: str, model_path: str, exclude
     """
     if not excludes:
         return False
-
-    # Normalize the current field information
-    normalized_field_path = normalize_model_name(full_field)
-    normalized_current_model = normalize_model_name(model_name)
-
-    # Get list of all models in the path with their apps
-    model_paths = model_path.split(",")
-
-    for exclude_pattern in excludes:
-        # Case 1: Exclude by field path (e.g., user__profile)
-        if "__" in exclude_pattern:
-            if exclude_pattern.lower() in normalized_field_path:
-                return True
-
-        # Case 2: Exclude by app.Model (e.g., auth.Permission)
-        elif "." in exclude_pattern:
-            exclude_app, exclude_model = exclude_pattern.split(".")
-            exclude_app = exclude_app.lower()
-            normalized_exclude_model = normalize_model_name(exclude_model)
-
-            # Check if any model in the path matches this app.Model combination
-            for path in model_paths:
-                if "." in path:
-                    path_app, path_model = path.split(".")
-                    if path_app.lower() == exclude_app and normalize_model_name(path_model) == normalized_exclude_model:
-                        return True
-
-        # Case 3: Exclude by model name only (e.g., Permission)
-        else:
-            normalized_exclude = normalize_model_name(exclude_pattern)
-            # Check both the current model and models in the path
-            for path in model_paths:
-                if "." in path:
-                    _, path_model = path.split(".")
-                    if normalize_model_name(path_model) == normalized_exclude:
-                        return True
-
-            # Also check the current model
-            if normalized_exclude == normalized_current_model:
-                return True
-
-    return False
+    return compile_excludes(tuple(excludes)).should_skip(full_field, model_name, model_path)
 
 
 def matches_target_field_type(field: FieldType, target_field_type: str | None) -> bool:
@@ -262,72 +354,49 @@ def matches_target_filters(
     return True
 
 
-def create_field_info(
-    field: FieldType, parent_field: str, model: type[models.Model], model_path: list[str]
-) -> FieldInfo:
-    """Create a FieldInfo instance from field data."""
-    field_name = get_field_name(field)
-    full_field = get_full_field(parent_field, field_name)
-    # Join model path with commas
-    model_path_str = ",".join(model_path + [model._meta.label])
-
-    return FieldInfo(
-        full_field=full_field,
-        model_name=model.__name__,
-        field_name=field_name,
-        target_field_type=field.__class__.__name__,
-        model_path=model_path_str,
-    )
-
-
-def process_field(
-    field: FieldType,
-    parent_field: str,
-    model: type[models.Model],
-    path_tracker: PathTracker,
-    filter_config: FilterConfig,
-    model_path: list[str],
+def get_fields(
+    Model: type[models.Model],
+    parent_field: str = "",
+    path_tracker: PathTracker | None = None,
+    filter_config: FilterConfig | None = None,
+    model_path: list[str] | None = None,
+    relation_index: RelationIndex | None = None,
 ) -> list[list[str]]:
-    """Process a single field and return its field information if it matches filters."""
-    field_info = create_field_info(field, parent_field, model, model_path)
-
-    # Skip if we've seen this field
-    if tuple(field_info[:-1]) in path_tracker.seen:  # Exclude model_path from uniqueness check
-        return []
-
-    # Check if field should be excluded
-    if should_skip_field(field_info.full_field, field_info.model_name, field_info.model_path, filter_config.excludes):
-        return []
-
-    # Check if field matches all filters
-    if not (
-        matches_target_field_type(field, filter_config.target_field_type)
-        and matches_target_filters(model, field_info.field_name, filter_config.target_model, filter_config.target_field)
-    ):
-        return []
+    """Given a Model, return a list of lists with field info.
 
-    # Add field to results if we haven't exceeded max_paths
-    if not filter_config.max_paths or path_tracker.result_count[0] < filter_config.max_paths:
-        path_tracker.seen.add(tuple(field_info[:-1]))  # Exclude model_path from uniqueness check
-        path_tracker.result_count[0] += 1
-        return [list(field_info)]
-
-    return []
+    Fields and relations are read from ``relation_index``, which is built as models are visited when not given.
+    """
+    return list(iter_fields(Model, parent_field, path_tracker, filter_config, model_path, relation_index))
 
 
-def get_fields(
+def iter_fields(
     Model: type[models.Model],
     parent_field: str = "",
     path_tracker: PathTracker | None = None,
     filter_config: FilterConfig | None = None,
     model_path: list[str] | None = None,
-) -> list[list[str]]:
-    """Given a Model, return a list of lists with field info."""
+    relation_index: RelationIndex | None = None,
+    depth: int | None = None,
+) -> Iterator[list[str]]:
+    """Yield the rows ``get_fields`` returns, in the same order, as they are found.
+
+    The walk stops as soon as ``max_paths`` rows are found, or when the caller stops iterating. With ``depth``,
+    only the rows found that many relations away from ``Model`` are yielded, and no relation is followed further.
+
+    Relations are followed depth first with an explicit stack of frames, one per model on the current path, rather
+    than by recursion. A frame resumes its fields where it left off once the model it descended into is done, so
+    rows are found in the same order as a recursive walk. Frames share a single model stack, pushed and popped as
+    the walk goes, and each frame joins its model path once, for all of its rows and children.
+
+    Exclusions are checked with the patterns compiled once, against names normalized once per field in the relation
+    index. A model is only entered if nothing on its path is excluded, so each step only checks what it adds: the
+    model it enters, and the end of the field path, from where a pattern could first overlap the new field name.
+    """
     # Initialize configuration
     if isinstance(Model, basestring):
         Model = get_model_from_input(Model)
         if Model is None:
-            return []
+            return
 
     path_tracker = path_tracker or PathTracker.create()
     filter_config = filter_config or FilterConfig(
@@ -338,78 +407,110 @@ def get_fields(
         target_model=None,
         target_field=None,
     )
-    model_path = model_path or []
+    relation_index = relation_index if relation_index is not None else RelationIndex()
+
+    seen = path_tracker.seen
+    result_count = path_tracker.result_count
+    stack_limit = path_tracker.stack_limit
+    matcher = compile_excludes(tuple(filter_config.excludes or ()))
+    max_depth = filter_config.max_depth
+    max_paths = filter_config.max_paths
+    target_field_type = filter_config.target_field_type
 
     # Early exit conditions
-    if filter_config.max_paths and path_tracker.result_count[0] >= filter_config.max_paths:
-        return []
+    if max_paths and result_count[0] >= max_paths:
+        return
 
-    fields = Model._meta.fields + Model._meta.many_to_many + Model._meta.get_fields()
-    path_tracker.model_stack.append(Model)
+    model_stack = [*path_tracker.model_stack, Model]
 
     # Check recursion limits
-    if check_redundant(path_tracker.model_stack, path_tracker.stack_limit, filter_config.max_depth):
-        return []
-
-    out_fields = []
-    for field in fields:
-        # Process current field
-        field_results = process_field(field, parent_field, Model, path_tracker, filter_config, model_path)
-        out_fields.extend(field_results)
-
-        # Continue traversing relations if needed
-        if is_valid_instance(field) and (
-            not filter_config.max_paths or path_tracker.result_count[0] < filter_config.max_paths
-        ):
-            RelModel = get_rel_model(field)
-            full_field = get_full_field(parent_field, get_field_name(field))
-
-            # Update model_path for the recursive call
-            current_path = model_path + [Model._meta.label]
-
-            # Skip traversal if the relationship should be excluded
-            if not should_skip_field(full_field, RelModel.__name__, ",".join(current_path), filter_config.excludes):
-                child_fields = get_fields(
-                    RelModel,
-                    full_field,
-                    PathTracker(
-                        seen=path_tracker.seen,
-                        result_count=path_tracker.result_count,
-                        model_stack=list(path_tracker.model_stack),
-                        stack_limit=path_tracker.stack_limit,
-                    ),
-                    filter_config,
-                    current_path,
-                )
-                out_fields.extend(child_fields)
-
-    return out_fields
+    if check_redundant(model_stack, stack_limit, max_depth):
+        return
+
+    adjacency = relation_index[Model]
+    labels = [*(model_path or []), adjacency.label]
+    # Every field of an excluded model, or of a model reached through one, is excluded
+    if any(matcher.matches_model(normalize_app_model(label)) for label in labels if "." in label):
+        return
+
+    frames = [
+        (iter(adjacency.edges), Model, adjacency, parent_field, normalize_model_name(parent_field), 0, ",".join(labels))
+    ]
+
+    while frames:
+        edges, model, adjacency, parent_field, normalized_parent, search_from, path = frames[-1]
+        found_here = depth is None or len(frames) > depth
+        descend = depth is None or len(frames) <= depth
+        for edge in edges:
+            if parent_field:
+                full_field = f"{parent_field}__{edge.name}"
+                normalized_field = f"{normalized_parent}__{edge.normalized_name}"
+            else:
+                full_field = edge.name
+                normalized_field = edge.normalized_name
+            key = (full_field, adjacency.name, edge.name, edge.type_name)
+            excluded = matcher.matches_field_path(normalized_field, search_from)
+
+            # Add the field, unless it is not at the depth asked for, has been seen, is excluded or doesn't match
+            if (
+                found_here
+                and key not in seen
+                and not excluded
+                and (target_field_type is None or edge.type_name == target_field_type)
+                and matches_target_filters(model, edge.name, filter_config.target_model, filter_config.target_field)
+            ):
+                seen.add(key)
+                result_count[0] += 1
+                yield [*key, path]
+                if max_paths and result_count[0] >= max_paths:
+                    return
+
+            # Descend into the related model, coming back to the next field once it is done. The path limits are
+            # checked before the exclusions, as they are much cheaper and stop every relation at the deepest level.
+            RelModel = edge.related_model
+            if RelModel is not None and descend:
+                model_stack.append(RelModel)
+                if (
+                    not check_redundant(model_stack, stack_limit, max_depth)
+                    and not excluded
+                    and not matcher.matches_model(edge.related_key)
+                ):
+                    related = relation_index[RelModel]
+                    # The field path up to here has no match, so one can only start this close to its end
+                    frames.append(
+                        (
+                            iter(related.edges),
+                            RelModel,
+                            related,
+                            full_field,
+                            normalized_field,
+                            max(0, len(normalized_field) - matcher.longest_field_path + 1),
+                            f"{path},{related.label}",
+                        )
+                    )
+                    break
+                model_stack.pop()
+        else:
+            frames.pop()
+            model_stack.pop()
 
 
-def get_ordered_fields(
-    Model: ModelInput,
-    by_depth: bool = False,
-    by_model: bool = False,
+def get_filter_config(
     target_model: ModelInput = None,
     target_field: str = None,
     max_depth: int = None,
     max_paths: int = None,
     excludes: list[str] = None,
     target_field_type: str = None,
-    **kwargs,
-) -> list:
-    """Get a list of fields from a model object, ordered by field name."""
-    Model = get_model_from_input(Model)
-    if Model is None:
-        return []
-
+) -> FilterConfig | None:
+    """Get the filter configuration of a traversal, or ``None`` if the target model doesn't exist."""
     # Convert target_model if it's a string
     if isinstance(target_model, basestring):
         target_model = get_model_from_input(target_model)
         if target_model is None:
-            return []
+            return None
 
-    filter_config = FilterConfig(
+    return FilterConfig(
         excludes=excludes or ["permissions", "comment", "content_type"],
         max_depth=max_depth,
         max_paths=max_paths,
@@ -418,10 +519,111 @@ def get_ordered_fields(
         target_field=target_field,
     )
 
-    fields = get_fields(Model, filter_config=filter_config)
+
+def get_ordered_fields(
+    Model: ModelInput,
+    by_depth: bool = False,
+    by_model: bool = False,
+    target_model: ModelInput = None,
+    target_field: str = None,
+    max_depth: int = None,
+    max_paths: int = None,
+    excludes: list[str] = None,
+    target_field_type: str = None,
+    relation_index: RelationIndex | None = None,
+    **kwargs,
+) -> list:
+    """Get a list of fields from a model object, ordered by field name.
+
+    Pass the same ``relation_index`` to every call in a run, so each model's fields are only indexed once.
+    """
+    Model = get_model_from_input(Model)
+    if Model is None:
+        return []
+
+    filter_config = get_filter_config(target_model, target_field, max_depth, max_paths, excludes, target_field_type)
+    if filter_config is None:
+        return []
+
+    fields = get_fields(Model, filter_config=filter_config, relation_index=relation_index)
 
     if by_model:
         return sorted(fields, key=lambda x: x[1])
     if by_depth:
         return sorted(fields, key=lambda x: (x[0].count("__"), x[0]))
     return sorted(fields, key=lambda x: x[0])
+
+
+def iter_rows_by_model(
+    walk: Callable[[], Iterator[list[str]]], row_counts: dict[str, int], max_buffered_rows: int
+) -> Iterator[list[str]]:
+    """Yield the rows of ``walk`` by model name, walking once for each run of names with few enough rows to hold.
+
+    A model name with more rows than ``max_buffered_rows`` gets a walk of its own, and its rows are not held.
+    """
+    batches = []
+    for model_name in sorted(row_counts):
+        if batches and batches[-1][1] + row_counts[model_name] <= max_buffered_rows:
+            batches[-1][0].append(model_name)
+            batches[-1][1] += row_counts[model_name]
+        else:
+            batches.append([[model_name], row_counts[model_name]])
+
+    for model_names, _ in batches:
+        if len(model_names) == 1:
+            yield from (row for row in walk() if row[1] == model_names[0])
+            continue
+        held = {model_name: [] for model_name in model_names}
+        for row in walk():
+            if row[1] in held:
+                held[row[1]].append(row)
+        for model_name in model_names:
+            yield from held.pop(model_name)
+
+
+def iter_ordered_fields(
+    Model: ModelInput,
+    by_depth: bool = False,
+    by_model: bool = False,
+    target_model: ModelInput = None,
+    target_field: str = None,
+    max_depth: int = None,
+    max_paths: int = None,
+    excludes: list[str] = None,
+    target_field_type: str = None,
+    relation_index: RelationIndex | None = None,
+    max_buffered_rows: int = 10_000,
+    **kwargs,
+) -> Iterator[list[str]]:
+    """Yield the fields of a model object as they are found, without holding them all to sort them.
+
+    Without an ordering, rows are yielded in the order the walk finds them. ``by_depth`` walks the relations again
+    for each depth, yielding only the rows at that depth, so rows come by depth, then in the order found.
+    ``by_model`` counts the rows on each model, then walks the relations again for each run of model names with up
+    to ``max_buffered_rows`` rows between them, holding those rows until the walk is done, to yield the same rows in
+    the same order as ``get_ordered_fields``. Memory use is bounded either way, at the cost of walking the relations
+    more than once.
+
+    ``max_paths`` limits the rows yielded in this order, and the walk stops as soon as it is reached.
+    """
+    Model = get_model_from_input(Model)
+    if Model is None:
+        return
+
+    filter_config = get_filter_config(target_model, target_field, max_depth, None, excludes, target_field_type)
+    if filter_config is None:
+        return
+    relation_index = relation_index if relation_index is not None else RelationIndex()
+
+    def walk(depth=None):
+        return iter_fields(Model, filter_config=filter_config, relation_index=relation_index, depth=depth)
+
+    if by_model:
+        rows = iter_rows_by_model(walk, Counter(row[1] for row in walk()), max_buffered_rows)
+    elif by_depth:
+        depths = range(min(max_depth, MAX_MODEL_STACK) if max_depth is not None else MAX_MODEL_STACK)
+        rows = (row for depth in depths for row in walk(depth))
+    else:
+        rows = walk()
+
+    yield from islice(rows, max_paths or None)
@@ -5,6 +5,7 @@ from typing import Any
 
 from django.core.management.base import BaseCommand, CommandParser
 
+from .common_utils._profiling import ProfiledCommandMixin, add_profile_arguments
 from .modelgraph_utils._analysis import TextAnalysisOutputFormat
 from .modelgraph_utils._dot import DotOutputFormat
 from .modelgraph_utils._graph import build_modelgraph, get_model_list
@@ -17,7 +18,7 @@ except ImportError as e:
     raise ImportError("The networkx and pydot packages are required for this command.") from e
 
 
-class Command(BaseCommand):
+class Command(ProfiledCommandMixin, BaseCommand):
     """Django management command to generate model relationship graphs."""
 
     help = "Generate a graph showing relationships between models"
@@ -86,6 +87,8 @@ class Command(BaseCommand):
             help="Invalidate all cached results before running",
         )
 
+        add_profile_arguments(parser)
+
     def handle(self, *args: Any, **options: Any) -> None:
         """Handle the command execution."""
         # Store output options
@@ -98,13 +101,14 @@ class Command(BaseCommand):
             return
 
         # Get filtered model list
-        model_list = get_model_list(
-            filter_option=options["filter"],
-            prefix=options.get("prefix"),
-            exclude=options.get("exclude"),
-            abstract=options.get("abstract"),
-            proxy=options.get("proxy"),
-        )
+        with self.profiler.phase("discovery"):
+            model_list = get_model_list(
+                filter_option=options["filter"],
+                prefix=options.get("prefix"),
+                exclude=options.get("exclude"),
+                abstract=options.get("abstract"),
+                proxy=options.get("proxy"),
+            )
 
         if not model_list:
             self.stderr.write("No models found matching filters")
@@ -112,7 +116,7 @@ class Command(BaseCommand):
 
         # Build graph
         try:
-            graph = build_modelgraph(model_list)
+            graph = build_modelgraph(model_list, self.profiler)
         except Exception as e:
             self.stderr.write(f"Error building graph: {str(e)}")
             return
@@ -127,7 +131,8 @@ class Command(BaseCommand):
         output_handler = output_formats[self.output_format]
 
         try:
-            output_handler.output(graph, self.output_path)
+            with self.profiler.phase("render"):
+                output_handler.output(graph, self.output_path)
             if self.output_path:
                 self.stdout.write(self.style.SUCCESS(f"Output written to {self.output_path}"))
         except Exception as e:
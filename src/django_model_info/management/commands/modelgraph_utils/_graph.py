@@ -9,6 +9,8 @@ from django.db import models
 from django.db.models import F, Field, ForeignKey, ManyToManyField, OneToOneField
 from django.db.models.fields.related import ForeignObjectRel as RelatedObject
 
+from ..common_utils._profiling import Profiler
+
 AbstractQuerySetRule = TypeVar("AbstractQuerySetRule")
 TimeDeltaOrStr = timedelta | str
 BoolOrStr = bool | str
@@ -108,41 +110,47 @@ def get_model_list(filter_option=None, prefix=None, exclude=None, abstract=None,
     return sorted(filtered_models, key=lambda x: (x._meta.app_label, x._meta.object_name))
 
 
-def build_modelgraph(model_list: list) -> nx.MultiDiGraph:
-    """Build graph representing model relationships."""
+def build_modelgraph(model_list: list, profiler: Profiler | None = None) -> nx.MultiDiGraph:
+    """Build graph representing model relationships, timing the edges of each model when profiling."""
+    profiler = profiler or Profiler()
     G = nx.MultiDiGraph()
 
     model_labels = {f"{model._meta.app_label}.{model._meta.model_name}" for model in model_list}
 
     # Add nodes
-    for model in model_list:
-        model_label = f"{model._meta.app_label}.{model._meta.model_name}"
-        G.add_node(model_label, model=model)
+    with profiler.phase("nodes"):
+        for model in model_list:
+            model_label = f"{model._meta.app_label}.{model._meta.model_name}"
+            G.add_node(model_label, model=model)
 
     # Add edges
     for model in model_list:
-        model_label = f"{model._meta.app_label}.{model._meta.model_name}"
-        fields = model._meta.get_fields(include_hidden=True)
-
-        for field in fields:
-            if hasattr(field, "related_model") and field.related_model:
-                related_label = f"{field.related_model._meta.app_label}.{field.related_model._meta.model_name}"
-
-                if related_label in model_labels:
-                    relationship_type = get_relationship_type(field)
-                    direction = (
-                        "forward"
-                        if relationship_type in ("OneToOneField", "ForeignKey", "ManyToManyField")
-                        else "reverse"
-                    )
-
-                    G.add_edge(
-                        model_label,
-                        related_label,
-                        key=direction,
-                        relationship_type=relationship_type,
-                        field_name=field.name,
-                        direction=direction,
-                    )
+        with profiler.phase("edges", model._meta.label):
+            _add_model_edges(G, model, model_labels)
 
     return G
+
+
+def _add_model_edges(G: nx.MultiDiGraph, model, model_labels: set[str]) -> None:
+    """Add an edge for each of the model's relations to another model in the graph."""
+    model_label = f"{model._meta.app_label}.{model._meta.model_name}"
+    fields = model._meta.get_fields(include_hidden=True)
+
+    for field in fields:
+        if hasattr(field, "related_model") and field.related_model:
+            related_label = f"{field.related_model._meta.app_label}.{field.related_model._meta.model_name}"
+
+            if related_label in model_labels:
+                relationship_type = get_relationship_type(field)
+                direction = (
+                    "forward" if relationship_type in ("OneToOneField", "ForeignKey", "ManyToManyField") else "reverse"
+                )
+
+                G.add_edge(
+                    model_label,
+                    related_label,
+                    key=direction,
+                    relationship_type=relationship_type,
+                    field_name=field.name,
+                    direction=direction,
+                )
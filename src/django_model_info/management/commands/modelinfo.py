@@ -1,12 +1,22 @@
 """Provides a management command to list out the fields and methods for each model in a Django project."""
 
 import inspect
+import os
+import sys
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import fields
+from functools import cached_property
+from io import StringIO
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
+import django
 from django.apps import apps as django_apps
 from django.conf import settings
-from django.core.management.base import BaseCommand, CommandParser, DjangoHelpFormatter
+from django.core.management.base import BaseCommand, CommandError, CommandParser, DjangoHelpFormatter
+from django.db import DEFAULT_DB_ALIAS, connections
 from rich.align import Align
 from rich.bar import Bar
 from rich.console import Console
@@ -14,6 +24,17 @@ from rich.padding import Padding
 from rich.style import Style
 from rich.table import Table
 
+from .common_utils._cache import increment_cache_version
+from .common_utils._export import ConsoleExportWriter, create_console, is_streamed_export, write_if_changed
+from .common_utils._profiling import ProfiledCommandMixin, Profiler, add_profile_arguments
+from .common_utils._settings import CACHE_ALWAYS, CACHE_ENABLED
+from .modelinfo_utils._changed_models import (
+    build_snapshot,
+    get_affected_models,
+    get_changed_files,
+    load_snapshot,
+    save_snapshot,
+)
 from .modelinfo_utils._common_utils import clean_docstring
 from .modelinfo_utils._field_attr_utils import (
     get_field_column,
@@ -26,21 +47,25 @@ from .modelinfo_utils._field_attr_utils import (
     get_related_model,
     get_related_name,
 )
+from .modelinfo_utils._field_index import FieldIndex, build_field_index
 from .modelinfo_utils._info_classes import (
     FieldOther,
     FieldRelation,
     FieldReverseRelation,
     Method,
     ModelInfo,
+    ModelRecord,
+    expand_db_type_headers,
 )
 from .modelinfo_utils._manager_utils import format_manager_output, get_model_managers
-from .modelinfo_utils._markdown_utils import MarkdownExporter, MarkdownSection
-from .modelinfo_utils._method_attr_utils import (
-    get_method_docstring,
-    get_method_file,
-    get_method_line_number,
-    get_method_signature,
+from .modelinfo_utils._markdown_utils import (
+    MarkdownExporter,
+    MarkdownSection,
+    get_markdown_page_path,
+    render_markdown_index,
 )
+from .modelinfo_utils._method_attr_utils import get_method_details
+from .modelinfo_utils._method_index import is_common_django_method, is_inherited_default
 from .modelinfo_utils._model_attr_utils import (
     get_model_base_manager,
     get_model_constraints,
@@ -63,6 +88,9 @@ from .modelinfo_utils._model_attr_utils import (
     get_model_verbose_name,
     get_model_verbose_name_plural,
 )
+from .modelinfo_utils._ndjson_utils import record_to_json
+from .modelinfo_utils._plain_renderer import PlainRenderer
+from .modelinfo_utils._record_cache import get_cached_record, get_record_cache_key, set_cached_record
 
 SECTION_STYLE = Style(color="green", bold=True, underline=True)
 SUBSECTION_STYLE = Style(color="green", bold=True)
@@ -72,170 +100,129 @@ COMMON_DJANGO_FIELDS = {  # ToDo: Add a setting to allow skipping these when onl
     # "something_else",
 }
 
-DEFAULT_DJANGO_METHODS = (
-    "_check_column_name_clashes",
-    "_check_constraints",
-    "_check_db_table_comment",
-    "_check_default_pk",
-    "_check_field_name_clashes",
-    "_check_fields",
-    "_check_id_field",
-    "_check_index_together",
-    "_check_indexes",
-    "_check_local_fields",
-    "_check_long_column_names",
-    "_check_m2m_through_same_relationship",
-    "_check_managers",
-    "_check_model_name_db_lookup_clashes",
-    "_check_model",
-    "_check_ordering",
-    "_check_property_name_related_field_accessor_clashes",
-    "_check_single_primary_key",
-    "_check_swappable",
-    "_check_unique_together",
-    "_clear_watched_fk_model_cache",
-    "_current_value",
-    "_do_insert",
-    "_do_update",
-    "_get_expr_references",
-    "_get_FIELD_display",
-    "_get_field_expression_map",
-    "_get_field_names",
-    "_get_hooked_methods",
-    "_get_model_descriptor_names",
-    "_get_model_property_names",
-    "_get_next_or_previous_by_FIELD",
-    "_get_next_or_previous_in_order",
-    "_get_pk_val",
-    "_get_unhookable_attribute_names",
-    "_get_unique_checks",
-    "_meta",
-    "_parse_params",
-    "_perform_date_checks",
-    "_perform_unique_checks",
-    "_potentially_hooked_methods",
-    "_prepare_related_fields_for_save",
-    "_reset_initial_state",
-    "_run_hooked_methods",
-    "_sanitize_field_name",
-    "_save_parents",
-    "_save_table",
-    "_set_pk_val",
-    "_validate_force_insert",
-    "_watched_fk_model_fields",
-    "_watched_fk_models",
-    "adelete",
-    "arefresh_from_db",
-    "asave",
-    "check",
-    "clean_fields",
-    "clean",
-    "date_error_message",
-    "delete",
-    "from_db",
-    "full_clean",
-    "get_absolute_url",
-    "get_constraints",
-    "get_decoded",
-    "get_deferred_fields",
-    "get_next_by_expire_date",
-    "get_previous_by_expire_date",
-    "get_session_store_class",
-    "prepare_database_save",
-    "refresh_from_db",
-    "save_base",
-    "save",
-    "serializable_value",
-    "unique_error_message",
-    "validate_constraints",
-    "validate_unique",
-)
+MODELINFO_GETTERS = {
+    "model_name": get_model_name,
+    "verbose_name": get_model_verbose_name,
+    "verbose_name_plural": get_model_verbose_name_plural,
+    "docstring": get_model_docstring,
+    "is_abstract": get_model_is_abstract,
+    "is_proxy": get_model_is_proxy,
+    "is_managed": get_model_is_managed,
+    "ordering": get_model_ordering,
+    "permissions": get_model_permissions,
+    "default_permissions": get_model_default_permissions,
+    "indexes": get_model_indexes,
+    "constraints": get_model_constraints,
+    "database_table": get_model_database_table,
+    "database_tablespace": get_model_database_tablespace,
+    "database_table_comment": get_model_database_table_comment,
+    "base_manager": get_model_base_manager,
+    "default_manager": get_model_default_manager,
+    "file": get_model_file,
+    "line_number": get_model_line_number,
+    "mro": get_model_mro,
+}
+
 
-console = Console(record=True)
+def get_modelinfo_row_count(verbosity: int) -> int:
+    """Get the index of the last ``ModelInfo`` row shown in the console at a verbosity level."""
+    if verbosity > 2:
+        return 19
+    if verbosity > 1:
+        return 5
+    return 3
+
+
+def get_clean_method_list(model):
+    """Clean method list by removing uppercase and non-callable methods."""
+    return [
+        method_name
+        for method_name in dir(model)
+        if method_name is not None
+        and not method_name == ""
+        and not method_name[0].isupper()
+        and hasattr(model, method_name)
+        and callable(getattr(model, method_name))
+    ]
 
 
 class ModelProcessor:
     """Process a model to extract model information, fields, and methods."""
 
-    def __init__(self, model, verbosity_option, exclude_defaults, markdown=False):
+    def __init__(
+        self,
+        model,
+        verbosity_option,
+        exclude_defaults,
+        markdown=False,
+        modelinfo_rows=None,
+        databases=None,
+        profiler=None,
+    ):
         self.model = model
         self.verbosity_option = verbosity_option
         self.exclude_defaults = exclude_defaults
         self.markdown = markdown
+        self.modelinfo_rows = modelinfo_rows
+        self.databases = tuple(databases or (DEFAULT_DB_ALIAS,))
+        self.profiler = profiler or Profiler()
+        self.label = model._meta.label  # pylint: disable=W0212
 
     def build_modelinfo(self):
-        """Return the essential details of the model."""
+        """Return the essential details of the model.
+
+        Only the rows up to ``modelinfo_rows`` (as counted by ``ModelInfo.render_rows``) are looked up, so output
+        that shows a handful of rows never reads source files or walks the MRO. Managers are only analyzed above
+        verbosity 1, the only levels at which they are shown.
+        """
         new_model = ModelInfo()
-        new_model.model_name.value = get_model_name(self.model)
-        new_model.verbose_name.value = get_model_verbose_name(self.model)
-        new_model.verbose_name_plural.value = get_model_verbose_name_plural(self.model)
-        new_model.docstring.value = (
-            clean_docstring(get_model_docstring(self.model)) if self.markdown else get_model_docstring(self.model)
-        )
-        new_model.is_abstract.value = get_model_is_abstract(self.model)
-        new_model.is_proxy.value = get_model_is_proxy(self.model)
-        new_model.is_managed.value = get_model_is_managed(self.model)
-        new_model.ordering.value = get_model_ordering(self.model)
-        new_model.permissions.value = get_model_permissions(self.model)
-        new_model.default_permissions.value = get_model_default_permissions(self.model)
-        new_model.indexes.value = get_model_indexes(self.model)
-        new_model.constraints.value = get_model_constraints(self.model)
-        new_model.database_table.value = get_model_database_table(self.model)
-        new_model.database_tablespace.value = get_model_database_tablespace(self.model)
-        new_model.database_table_comment.value = get_model_database_table_comment(self.model)
-        new_model.base_manager.value = get_model_base_manager(self.model)
-        new_model.default_manager.value = get_model_default_manager(self.model)
-        new_model.file.value = get_model_file(self.model)
-        new_model.line_number.value = get_model_line_number(self.model)
-        new_model.mro.value = get_model_mro(self.model)
-        new_model.managers_info = self.build_manager_info()
+        for row_num, field_info in enumerate(fields(new_model)):
+            if self.modelinfo_rows is not None and row_num > self.modelinfo_rows:
+                break
+            getter = MODELINFO_GETTERS.get(field_info.name)
+            if getter is not None:
+                setattr(new_model, field_info.name, getter(self.model))
+
+        if self.markdown:
+            new_model.docstring = clean_docstring(new_model.docstring)
+        if self.verbosity_option > 1:
+            with self.profiler.phase("managers", self.label):
+                new_model.managers_info = self.build_manager_info()
 
         return new_model
 
+    @cached_property
+    def field_index(self) -> FieldIndex:
+        """Classify the model's fields in a single pass, shared by all of the field builders."""
+        return build_field_index(self.model)
+
     def build_relation_field_info(self):
         """Process and categorize fields into relations."""
-        field_list = self.model._meta.get_fields(include_hidden=True)  # pylint: disable=W0212
-        if not field_list:
-            return []
-        fields_relation = []
-
-        for field in field_list:
-            if hasattr(field, "related_model") and field.related_model is not None:
-                if "reverse_related" not in str(field.__class__.__module__):
-                    fields_relation.append(self.build_relation_field(field))
-
-        return fields_relation
+        return [self.build_relation_field(field) for field in self.field_index.relations]
 
     def build_reverse_relation_field_info(self):
         """Process and categorize fields into reverse relations."""
-        field_list = self.model._meta.get_fields(include_hidden=True)  # pylint: disable=W0212
-        if not field_list:
-            return []
-        fields_reverse_relation = []
-
-        for field in field_list:
-            if hasattr(field, "related_model") and field.related_model is not None:
-                if "reverse_related" in str(field.__class__.__module__):
-                    fields_reverse_relation.append(self.build_reverse_relation_field(field))
-
-        return fields_reverse_relation
+        return [self.build_reverse_relation_field(field) for field in self.field_index.reverse_relations]
 
     def build_other_field_info(self):
         """Process and categorize fields into others."""
-        field_list = self.model._meta.get_fields(include_hidden=True)  # pylint: disable=W0212
-        if not field_list:
-            return []
-        fields_other = []
+        return [
+            self.build_other_field(field)
+            for field in self.field_index.all_fields
+            if getattr(field, "related_model", None) is None or field.name not in COMMON_DJANGO_FIELDS
+        ]
 
-        for field in field_list:
-            if (
-                getattr(field, "related_model", None) is None
-                and (not self.exclude_defaults, False)
-                or field.name not in COMMON_DJANGO_FIELDS
-            ):
-                fields_other.append(self.build_other_field(field))
+    @cached_property
+    def db_connections(self) -> list:
+        """Look up the connection for each database once, rather than through ``connections`` for every field."""
+        return [connections[alias] for alias in self.databases]
 
-        return fields_other
+    def build_extra_db_types(self, field, not_applicable=False) -> tuple:
+        """Get ``(alias, database type)`` pairs for every database after the first, when several are used."""
+        return tuple(
+            (connection.alias, "Not applicable" if not_applicable else get_field_db_type(field, connection))
+            for connection in self.db_connections[1:]
+        )
 
     def build_relation_field(self, field):
         """Build a relation field."""
@@ -244,9 +231,12 @@ class ModelProcessor:
             name=get_field_name(field),
             field_type=get_field_type(field),
             field_column=get_field_column(field),
-            field_db_type=get_field_db_type(field) if not model_is_abstract else "Not applicable",
+            field_db_type=get_field_db_type(field, self.db_connections[0])
+            if not model_is_abstract
+            else "Not applicable",
             related_model=get_related_model(field) if not model_is_abstract else "Not applicable",
             related_name=get_related_name(field, self.model) if not model_is_abstract else "Not applicable",
+            extra_db_types=self.build_extra_db_types(field, not_applicable=model_is_abstract),
         )
 
     def build_reverse_relation_field(self, field):
@@ -254,10 +244,11 @@ class ModelProcessor:
         return FieldReverseRelation(
             name=get_related_name(field, self.model),
             field_type=get_field_type(field),
-            field_db_type=get_field_db_type(field),
+            field_db_type=get_field_db_type(field, self.db_connections[0]),
             related_model=get_related_model(field),
             field_name_on_related_model=get_field_name_on_reverse_model(field),
             field_type_on_related_model=get_field_type_on_reverse_model(field),
+            extra_db_types=self.build_extra_db_types(field),
         )
 
     def build_other_field(self, field):
@@ -266,24 +257,33 @@ class ModelProcessor:
             name=get_field_name(field),
             field_type=get_field_type(field),
             field_column=get_field_column(field),
-            field_db_type=get_field_db_type(field),
+            field_db_type=get_field_db_type(field, self.db_connections[0]),
             field_verbose_name=get_field_verbose_name(field),
+            extra_db_types=self.build_extra_db_types(field),
         )
 
     def build_method_info(self, method_list: list):
-        """Categorize methods into dunder, common Django, private, and other."""
+        """Categorize methods into dunder, common Django, private, and other.
+
+        Methods are classified by the class that defines them: common Django methods are the ones defined by
+        ``django.db.models.Model``, so an override in the project is reported with the project's methods. With
+        ``exclude_defaults``, methods inherited from classes outside the project are left out as well.
+        """
         method_other, method_other_private, method_dunder, method_common_django = [], [], [], []
 
         for method_name in method_list:
-            new_method = self.build_method(method_name)
             if method_name.startswith("__") and method_name.endswith("__"):
-                method_dunder.append(new_method)
-            elif method_name in DEFAULT_DJANGO_METHODS:
-                method_common_django.append(new_method)
+                if not self.exclude_defaults:
+                    method_dunder.append(self.build_method(method_name))
+            elif is_common_django_method(self.model, method_name):
+                if not self.exclude_defaults:
+                    method_common_django.append(self.build_method(method_name))
+            elif self.exclude_defaults and is_inherited_default(self.model, method_name):
+                continue
             elif method_name.startswith("_"):
-                method_other_private.append(new_method)
+                method_other_private.append(self.build_method(method_name))
             else:
-                method_other.append(new_method)
+                method_other.append(self.build_method(method_name))
         if not self.exclude_defaults:
             return method_other, method_other_private, method_dunder, method_common_django
         return method_other, method_other_private
@@ -292,19 +292,69 @@ class ModelProcessor:
         """Build a method's information."""
         method = Method(name=method_name)
         if self.verbosity_option > 1:
-            method.signature = get_method_signature(method_name, self.model, self.verbosity_option)
-        if self.verbosity_option > 2:
-            method.docstring = get_method_docstring(method_name, self.model)
-            method.file = get_method_file(method_name, self.model)
-            method.line_number = get_method_line_number(method_name, self.model)
+            signature, docstring, file, line_number = get_method_details(method_name, self.model, self.verbosity_option)
+            method.signature = signature
+            if self.verbosity_option > 2:
+                method.docstring = docstring
+                method.file = file
+                method.line_number = line_number
         return method
 
     def build_manager_info(self):
         """Process manager information for the model."""
         return get_model_managers(self.model)
 
-
-class Command(BaseCommand):
+    def build_record(self) -> ModelRecord:
+        """Build everything needed to render or export the model at the current verbosity."""
+        with self.profiler.phase("modelinfo", self.label):
+            record = ModelRecord(label=self.label, modelinfo=self.build_modelinfo())
+
+        if self.verbosity_option > 0:
+            with self.profiler.phase("fields", self.label):
+                record.fields_other = self.build_other_field_info()
+                record.fields_relation = self.build_relation_field_info()
+                if not self.model._meta.abstract:  # pylint: disable=W0212
+                    record.fields_reverse_relation = self.build_reverse_relation_field_info()
+            with self.profiler.phase("methods", self.label):
+                record.method_info = self.build_method_info(get_clean_method_list(self.model))
+
+        return record
+
+
+def init_record_worker():
+    """Set up Django in a worker process, for start methods that do not inherit the parent's state."""
+    django.setup()
+
+
+def build_model_record(
+    model,
+    verbosity: int,
+    exclude_defaults: bool,
+    markdown: bool,
+    modelinfo_rows: int | None = None,
+    databases: tuple[str, ...] = (DEFAULT_DB_ALIAS,),
+    profiler: Profiler | None = None,
+) -> ModelRecord:
+    """Build the record for a model. Defined at module level so it can be run in a worker process."""
+    return ModelProcessor(
+        model,
+        verbosity,
+        exclude_defaults,
+        markdown=markdown,
+        modelinfo_rows=modelinfo_rows,
+        databases=databases,
+        profiler=profiler,
+    ).build_record()
+
+
+def build_profiled_model_record(*args) -> tuple[ModelRecord, dict]:
+    """Build the record for a model in a worker process, and return it with the time each phase took."""
+    profiler = Profiler(enabled=True)
+    record = build_model_record(*args, profiler=profiler)
+    return record, profiler.export_items()
+
+
+class Command(ProfiledCommandMixin, BaseCommand):
     """A Django management command to list out the fields and methods for each model."""
 
     help = "List out the fields and methods for each model"
@@ -315,8 +365,14 @@ class Command(BaseCommand):
         self.filter_option = None
         self.export_option = None
         self.exclude_defaults = False
+        self.databases = (DEFAULT_DB_ALIAS,)
         self.markdown = False
+        self.output_format = "table"
+        self.renderer = "rich"
+        self.use_cache = False
+        self.jobs = 1
         self.model_list = []
+        self.console = Console()
 
     def create_parser(self, prog_name: str, subcommand: str, **kwargs):
         """Create and return the ``ArgumentParser`` which will be used to parse the arguments to this command.
@@ -392,6 +448,14 @@ class Command(BaseCommand):
             action="store_true",
             help="Show only user-defined fields and methods, skipping Django's default fields and methods.",
         )
+        parser.add_argument(
+            "--database",
+            nargs="+",
+            default=None,
+            dest="databases",
+            help="Database aliases to resolve field database types for (default: 'default'). "
+            "With several aliases, each gets its own Database Type column, resolved in the same pass.",
+        )
         parser.add_argument(
             "-o",
             "--output",
@@ -406,6 +470,79 @@ class Command(BaseCommand):
             action="store_true",
             help="Output in markdown format to the console",
         )
+        parser.add_argument(
+            "--renderer",
+            choices=["rich", "plain", "tsv"],
+            default="rich",
+            help="How tables are rendered: 'rich' (default) draws styled tables, 'plain' writes fixed-width text "
+            "tables and 'tsv' tab-separated ones, without rich, to the console or to the --output file.",
+        )
+        parser.add_argument(
+            "--output-dir",
+            type=str,
+            default=None,
+            help="Directory to write markdown documentation to, one page per app or model (see --split), "
+            "plus an index.md linking them. Pages whose content has not changed are left untouched.",
+        )
+        parser.add_argument(
+            "--split",
+            choices=["app", "model"],
+            default="app",
+            help="With --output-dir, write one markdown page per app (default) or per model.",
+        )
+        parser.add_argument(
+            "--format",
+            choices=["table", "ndjson"],
+            default="table",
+            help="Output format: 'table' (default) renders rich tables, 'ndjson' writes one JSON object per model "
+            "as soon as it is processed, to the console or to the --output file.",
+        )
+
+        parser.add_argument(
+            "-j",
+            "--jobs",
+            type=int,
+            default=1,
+            help="Number of worker processes used to build model information. "
+            "Use 0 for one per CPU (default: 1, build everything in the main process).",
+        )
+
+        # Incremental options
+        parser.add_argument(
+            "--changed-files",
+            nargs="+",
+            default=None,
+            help="Only process models defined (directly or through a parent class) in these files, plus the models "
+            "their relations point at. Paths can be relative to the working directory, as given by `git diff`.",
+        )
+        parser.add_argument(
+            "--changed-since",
+            type=str,
+            default=None,
+            help="Only process models affected by source files that changed since the snapshot at this path, "
+            "written by an earlier run with --save-snapshot.",
+        )
+        parser.add_argument(
+            "--save-snapshot",
+            type=str,
+            default=None,
+            help="Save a snapshot of the listed models' source files and relations to this path, "
+            "for use with --changed-since.",
+        )
+
+        # Cache options
+        parser.add_argument(
+            "--use-cache",
+            action="store_true",
+            help="Use cached results for models whose source files have not changed (disabled by default)",
+        )
+        parser.add_argument(
+            "--clear-cache",
+            action="store_true",
+            help="Invalidate all cached results before running",
+        )
+
+        add_profile_arguments(parser)
 
     def get_options(self, options) -> tuple:
         """Get verbosity, filter, and export options."""
@@ -435,51 +572,102 @@ class Command(BaseCommand):
 
     def handle(self, *_, **options):
         """Handle the command."""
+        # Clear cache if requested using version invalidation
+        if options.get("clear_cache"):
+            increment_cache_version(self)
+            if not options.get("filter"):  # If only clearing cache
+                return
+
         self.verbosity, self.filter_option, self.export_option, self.exclude_defaults = self.get_options(options)
+        self.databases = self.get_databases(options)
         self.markdown = options.get("markdown", False)
-
-        self.model_list = self.get_model_list()
-
-        if self.markdown:
-            # Print markdown directly to console
-            print(self.export_markdown(self.model_list))
+        self.output_format = options.get("format") or "table"
+        self.renderer = self.get_renderer(options)
+        self.use_cache = CACHE_ENABLED and (options.get("use_cache", False) or CACHE_ALWAYS)
+        self.jobs = options.get("jobs") or 1
+        if options.get("jobs") == 0:
+            self.jobs = os.cpu_count() or 1
+
+        with self.profiler.phase("discovery"):
+            self.model_list = self.get_model_list()
+            self.apply_changed_options(options)
+        self.console = create_console(self.export_option)
+
+        if options.get("output_dir"):
+            output_dir = Path(options["output_dir"])
+            written, total = self.write_markdown_directory(self.model_list, output_dir, options.get("split", "app"))
+            self.stdout.write(
+                f"Wrote {written} of {total} markdown files to {output_dir} ({total - written} unchanged)"
+            )
             return
 
-        for model in self.model_list:
-            if self.verbosity > 0:
-                console.print(Padding("", (1, 0, 0, 0)))
-                console.print(Padding("", (0, 0, 0, 0), style=SECTION_STYLE))
-                console.print(Padding("", (0, 0, 0, 0)))
-            console.print(f"{model._meta.label}", style=SECTION_STYLE)  # pylint: disable=W0212
-
-            if self.verbosity > 0:
-                processor = ModelProcessor(model, self.verbosity, self.exclude_defaults, markdown=False)
-                modelinfo = processor.build_modelinfo()
-                self.render_modelinfo(modelinfo)
-
-                fields_other = processor.build_other_field_info()
-                self.render_other_fields(fields_other)
-
-                fields_relation = processor.build_relation_field_info()
-                self.render_relation_fields(fields_relation)
-
-                if not model._meta.abstract:  # pylint: disable=W0212
-                    fields_reverse_relation = processor.build_reverse_relation_field_info()
-                    self.render_reverse_relation_fields(fields_reverse_relation)
-
-                method_list = self.get_clean_method_list(model)
-                method_info = processor.build_method_info(method_list)
-                self.render_methods(method_info)
+        if self.output_format == "ndjson":
+            if self.export_option:
+                with open(self.export_option, "w", encoding="utf-8") as f:
+                    self.write_ndjson(self.model_list, f)
+            else:
+                self.write_ndjson(self.model_list, self.stdout)
+            return
 
-                if self.verbosity > 1:
-                    # Add manager rendering here
-                    self.render_manager_table(model)
+        if self.renderer != "rich":
+            if self.export_option:
+                with open(self.export_option, "w", encoding="utf-8") as f:
+                    self.write_plain(self.model_list, f)
+            else:
+                self.write_plain(self.model_list, self.stdout)
+            return
 
-        console.print(f"\nTotal Models Listed: {len(self.model_list)}\n", style=SECTION_STYLE)
-        console.print(Align(Bar(size=0.1, begin=0.0, end=0.0, width=100), align="center"), style="red")
+        if self.markdown:
+            # Stream markdown directly to console
+            self.write_markdown(self.model_list, sys.stdout)
+            sys.stdout.write("\n")
+            return
 
-        if self.export_option:
-            self.export_results()
+        if self.verbosity > 0:
+            model_records = self.iter_model_records(
+                self.model_list, markdown=False, modelinfo_rows=get_modelinfo_row_count(self.verbosity)
+            )
+        else:
+            model_records = ((model, None) for model in self.model_list)
+
+        with ConsoleExportWriter(self.console, self.export_option) as export_writer:
+            for model, record in model_records:
+                with self.profiler.phase("render", model._meta.label):  # pylint: disable=W0212
+                    if self.verbosity > 0:
+                        self.console.print(Padding("", (1, 0, 0, 0)))
+                        self.console.print(Padding("", (0, 0, 0, 0), style=SECTION_STYLE))
+                        self.console.print(Padding("", (0, 0, 0, 0)))
+                    self.console.print(f"{model._meta.label}", style=SECTION_STYLE)  # pylint: disable=W0212
+
+                    if record is not None:
+                        self.render_record(model, record)
+                    export_writer.flush()
+
+            self.console.print(f"\nTotal Models Listed: {len(self.model_list)}\n", style=SECTION_STYLE)
+            self.console.print(Align(Bar(size=0.1, begin=0.0, end=0.0, width=100), align="center"), style="red")
+
+        if self.export_option and not is_streamed_export(self.export_option):
+            with self.profiler.phase("export"):
+                self.export_results()
+
+    def get_renderer(self, options) -> str:
+        """Get the table renderer; plain and TSV tables can't be written as markdown or HTML."""
+        renderer = options.get("renderer") or "rich"
+        if renderer != "rich":
+            if options.get("markdown"):
+                raise CommandError(f"--renderer {renderer} can't be combined with --markdown")
+            extension = Path(self.export_option).suffix.lower() if self.export_option else ""
+            if extension in (".html", ".htm", ".md"):
+                raise CommandError(f"--renderer {renderer} can't export to {extension} files")
+        return renderer
+
+    def get_databases(self, options) -> tuple[str, ...]:
+        """Get the database aliases to resolve field types for, in the order given, without duplicates."""
+        databases = tuple(dict.fromkeys(options.get("databases") or (DEFAULT_DB_ALIAS,)))
+        unknown = [alias for alias in databases if alias not in connections]
+        if unknown:
+            raise CommandError(f"Unknown database alias(es): {', '.join(unknown)}")
+        return databases
 
     def get_model_list(self):
         """Retrieve models based on filter option or return all models."""
@@ -524,27 +712,127 @@ class Command(BaseCommand):
             model_list.extend(abstract_models)
         return model_list
 
+    def apply_changed_options(self, options):
+        """Limit the model list to the models affected by changed files, and save a snapshot if requested."""
+        changed_files = set(options.get("changed_files") or ())
+        previous_snapshot = None
+        current_snapshot = None
+
+        if options.get("changed_since") or options.get("save_snapshot"):
+            current_snapshot = build_snapshot(self.model_list)
+        # Load the previous snapshot before saving, as both are often the same file
+        if options.get("changed_since"):
+            try:
+                previous_snapshot = load_snapshot(options["changed_since"])
+            except FileNotFoundError as e:
+                raise CommandError(f"Snapshot not found: {options['changed_since']}") from e
+            changed_files |= get_changed_files(previous_snapshot, current_snapshot)
+        if options.get("save_snapshot"):
+            save_snapshot(options["save_snapshot"], current_snapshot)
+
+        if options.get("changed_files") is not None or previous_snapshot is not None:
+            self.model_list = get_affected_models(self.model_list, changed_files, previous_snapshot)
+
     def get_clean_method_list(self, model):
         """Clean method list by removing uppercase and non-callable methods."""
-        return [
-            method_name
-            for method_name in dir(model)
-            if method_name is not None
-            and not method_name == ""
-            and not method_name[0].isupper()
-            and hasattr(model, method_name)
-            and callable(getattr(model, method_name))
-        ]
+        return get_clean_method_list(model)
+
+    def get_model_record(self, model, markdown: bool, modelinfo_rows: int | None = None) -> ModelRecord:
+        """Build the record for a model, or load it from the cache if its source files have not changed."""
+        if not self.use_cache:
+            return build_model_record(
+                model, self.verbosity, self.exclude_defaults, markdown, modelinfo_rows, self.databases, self.profiler
+            )
+
+        label = model._meta.label  # pylint: disable=W0212
+        with self.profiler.phase("cache", label):
+            cache_key = get_record_cache_key(
+                model, self.verbosity, self.exclude_defaults, markdown, modelinfo_rows, self.databases
+            )
+            record = get_cached_record(cache_key)
+        if record is None:
+            record = build_model_record(
+                model, self.verbosity, self.exclude_defaults, markdown, modelinfo_rows, self.databases, self.profiler
+            )
+            with self.profiler.phase("cache", label):
+                set_cached_record(cache_key, record)
+        return record
+
+    def iter_model_records(self, models: list, markdown: bool, modelinfo_rows: int | None = None):
+        """Yield ``(model, record)`` pairs in the same order as ``models``.
+
+        ``modelinfo_rows`` limits which ``ModelInfo`` rows are built, as in ``ModelProcessor``; by default all are.
+
+        With more than one job, records are built in a pool of worker processes. At most ``jobs * 2`` models are
+        in flight at once, and results are yielded in order, so the output matches a run without a pool.
+        """
+        if self.jobs <= 1:
+            for model in models:
+                yield model, self.get_model_record(model, markdown, modelinfo_rows)
+            return
+
+        with ProcessPoolExecutor(max_workers=self.jobs, initializer=init_record_worker) as executor:
+            pending = deque()
+            for model in models:
+                pending.append(self._submit_model_record(executor, model, markdown, modelinfo_rows))
+                if len(pending) >= self.jobs * 2:
+                    yield self._collect_model_record(*pending.popleft())
+            while pending:
+                yield self._collect_model_record(*pending.popleft())
+
+    def _submit_model_record(
+        self, executor: ProcessPoolExecutor, model, markdown: bool, modelinfo_rows: int | None
+    ) -> tuple:
+        """Load a model's record from the cache, or submit it to the worker pool to be built."""
+        cache_key = None
+        if self.use_cache:
+            with self.profiler.phase("cache", model._meta.label):  # pylint: disable=W0212
+                cache_key = get_record_cache_key(
+                    model, self.verbosity, self.exclude_defaults, markdown, modelinfo_rows, self.databases
+                )
+                record = get_cached_record(cache_key)
+            if record is not None:
+                return model, None, record
+
+        # Workers have their own profilers, whose timings come back with the record
+        builder = build_profiled_model_record if self.profiler.enabled else build_model_record
+        future = executor.submit(
+            builder, model, self.verbosity, self.exclude_defaults, markdown, modelinfo_rows, self.databases
+        )
+        return model, cache_key, future
+
+    def _collect_model_record(self, model, cache_key: str | None, record: ModelRecord | Future) -> tuple:
+        """Wait for a submitted record, caching it if it was built by a worker."""
+        if isinstance(record, Future):
+            with self.profiler.phase("wait"):
+                record = record.result()
+            if self.profiler.enabled:
+                record, timings = record
+                self.profiler.merge_items(timings)
+        if cache_key is not None:
+            with self.profiler.phase("cache", model._meta.label):  # pylint: disable=W0212
+                set_cached_record(cache_key, record)
+        return model, record
+
+    def render_record(self, model, record: ModelRecord):
+        """Render all of the tables for a single model."""
+        self.render_modelinfo(record.modelinfo)
+        self.render_other_fields(record.fields_other)
+        self.render_relation_fields(record.fields_relation)
+
+        if not model._meta.abstract:  # pylint: disable=W0212
+            self.render_reverse_relation_fields(record.fields_reverse_relation)
+
+        self.render_methods(record.method_info)
+
+        if self.verbosity > 1:
+            self.render_manager_table(record.modelinfo.managers_info)
 
     def render_modelinfo(self, modelinfo):
         """Render model information."""
         table = Table(title="Model Info")
 
-        row_count = 3
-        if self.verbosity > 1:
-            row_count = 5
-        if self.verbosity > 2:
-            row_count = 19
+        row_count = get_modelinfo_row_count(self.verbosity)
 
         table.add_column("Key", justify="left", style="blue")
         table.add_column("Value", justify="left", style="magenta")
@@ -557,7 +845,7 @@ class Command(BaseCommand):
         else:
             table.add_row("none")
 
-        console.print(Padding(table, (1, 0, 0, 8)))
+        self.console.print(Padding(table, (1, 0, 0, 8)))
 
     def render_field_relations_table(self, title, data_list):
         """Render table for field relations."""
@@ -572,7 +860,8 @@ class Command(BaseCommand):
             column_count = 6
             table.add_column("Field Type", justify="left", style="magenta")
             table.add_column("Database Column", justify="left", style="magenta")
-            table.add_column("Database Type", justify="left", style="magenta")
+            for header in expand_db_type_headers(["Database Type"], self.databases):
+                table.add_column(header, justify="left", style="magenta")
             table.add_column("Related Model", justify="right", style="dark_red")
             table.add_column("Related Name", justify="right", style="dark_red")
 
@@ -591,7 +880,8 @@ class Command(BaseCommand):
         if self.verbosity >= 2:
             column_count = 7
             table.add_column("Field Type", justify="left", style="magenta")
-            table.add_column("Database Type", justify="left", style="magenta")
+            for header in expand_db_type_headers(["Database Type"], self.databases):
+                table.add_column(header, justify="left", style="magenta")
             table.add_column("Related Model", justify="right", style="dark_red")
             table.add_column("Field Name on Related Model", justify="left", style="dark_red")
             table.add_column("Field Type on Related Model", justify="left", style="dark_red")
@@ -612,7 +902,8 @@ class Command(BaseCommand):
             column_count = 6
             table.add_column("Field Type", justify="left", style="magenta")
             table.add_column("Database Column", justify="left", style="magenta")
-            table.add_column("Database Type", justify="left", style="magenta")
+            for header in expand_db_type_headers(["Database Type"], self.databases):
+                table.add_column(header, justify="left", style="magenta")
             table.add_column("Verbose Name", justify="left", style="white")
 
         field_table = self._fill_table(table, data_list, FieldOther, column_count)
@@ -620,7 +911,7 @@ class Command(BaseCommand):
 
     def render_other_fields(self, fields_other):
         """Render tables for fields."""
-        console.print(Padding("Fields:", (1, 0, 0, 4), style=SUBSECTION_STYLE))
+        self.console.print(Padding("Fields:", (1, 0, 0, 4), style=SUBSECTION_STYLE))
 
         self.render_field_other_table("Other Fields", fields_other)
 
@@ -653,9 +944,9 @@ class Command(BaseCommand):
     def render_methods(self, method_info):
         """Render tables for methods."""
         if self.verbosity == 3:
-            console.print(Padding("Methods (all):", (1, 0, 0, 4), style=SUBSECTION_STYLE))
+            self.console.print(Padding("Methods (all):", (1, 0, 0, 4), style=SUBSECTION_STYLE))
         else:
-            console.print(Padding("Methods (non-private/internal):", (1, 0, 0, 4), style=SUBSECTION_STYLE))
+            self.console.print(Padding("Methods (non-private/internal):", (1, 0, 0, 4), style=SUBSECTION_STYLE))
 
         if not self.exclude_defaults:
             method_other, method_other_private, method_dunder, method_common_django = method_info
@@ -675,17 +966,14 @@ class Command(BaseCommand):
             if method_other_private:
                 self.render_method_table("Private Methods", method_other_private)
 
-    def render_manager_table(self, model):
+    def render_manager_table(self, managers_info):
         """Render manager information."""
         if self.verbosity < 2:
             return
 
-        processor = ModelProcessor(model, self.verbosity, self.exclude_defaults, markdown=False)
-        managers_info = processor.build_manager_info()
-
         if managers_info:
-            console.print(Padding("Custom Managers:", (1, 0, 0, 4), style=SUBSECTION_STYLE))
-            console.print(
+            self.console.print(Padding("Custom Managers:", (1, 0, 0, 4), style=SUBSECTION_STYLE))
+            self.console.print(
                 Padding(format_manager_output(managers_info, indent=8, verbosity=self.verbosity), (1, 0, 0, 0))
             )
 
@@ -705,84 +993,141 @@ class Command(BaseCommand):
 
     def _render_table(self, table):
         """Helper method to print table based on data."""
-        console.print(Padding(table, (1, 0, 0, 8)))
+        self.console.print(Padding(table, (1, 0, 0, 8)))
 
     def export_markdown(self, models: list[Any]) -> str:
         """Generate markdown documentation for Django models."""
-        exporter = MarkdownExporter(self.verbosity, self.exclude_defaults)
-        document_sections = []
+        output = StringIO()
+        self.write_markdown(models, output)
+        return output.getvalue()
+
+    def write_markdown(self, models: list[Any], stream: TextIO) -> None:
+        """Write markdown documentation for Django models to ``stream``, one model at a time.
 
+        Each model's section is written as soon as it is built and then discarded, so memory use does not grow
+        with the number of models.
+        """
+        for index, model_section in enumerate(self.iter_markdown_sections(models)):
+            with self.profiler.phase("write", model_section.title):
+                if index:
+                    stream.write("\n")
+                stream.write(model_section.render())
+
+    def write_markdown_directory(self, models: list[Any], output_dir: Path, split: str) -> tuple[int, int]:
+        """Write one markdown page per app or model to ``output_dir``, plus an ``index.md`` linking them.
+
+        Records are built in order (in the worker pool when ``--jobs`` is used), and each page is handed to a
+        thread pool to be written as soon as its last model is built. Pages whose content has not changed are
+        not rewritten. Returns the number of files written and the total number of files.
+        """
+        pages = {}
         for model in models:
-            model_section = MarkdownSection(title=model._meta.label, content=[], level=1)
-
-            processor = ModelProcessor(model, self.verbosity, self.exclude_defaults, markdown=True)
-            modelinfo = processor.build_modelinfo()
-
-            # Add Model Info section
-            info_table = exporter.format_modelinfo_table(modelinfo)
-            model_section.content.extend(["## Model Info\n", info_table.render(), ""])
-
-            if self.verbosity > 0:
-                # Add Fields sections
-                fields_other = processor.build_other_field_info()
-                if fields_other:
-                    fields_table = exporter.format_fields_table(fields_other, "other")
-                    if fields_table:
-                        model_section.content.extend(["## Fields\n", fields_table.render(), ""])
-
-                # Add Relations section
-                fields_relation = processor.build_relation_field_info()
-                if fields_relation:
-                    relations_table = exporter.format_fields_table(fields_relation, "relation")
-                    if relations_table:
-                        model_section.content.extend(["## Relations\n", relations_table.render(), ""])
-
-                # Add Reverse Relations section
-                if not model._meta.abstract:
-                    fields_reverse_relation = processor.build_reverse_relation_field_info()
-                    model_section.content.extend([f"{fields_reverse_relation=}\n"])
-                    if fields_reverse_relation:
-                        reverse_relations_table = exporter.format_fields_table(
-                            fields_reverse_relation, "reverse relation"
-                        )
-                        if reverse_relations_table:
-                            model_section.content.extend(
-                                ["## Reverse Relations\n", reverse_relations_table.render(), ""]
-                            )
-
-                # Add Methods section
-                method_list = self.get_clean_method_list(model)
-                methods = processor.build_method_info(method_list)
-                if any(methods):
-                    method_types = (
-                        ["Other", "Private"]
-                        if self.exclude_defaults
-                        else ["Other", "Private", "Dunder", "Common Django"]
-                    )
-                    method_sections = exporter.format_methods_section(methods, method_types)
-                    if method_sections:
-                        model_section.content.append("## Methods\n")
-                        for section in method_sections:
-                            model_section.content.extend([section.render(), ""])
-
-                # Add Managers section
-                managers_section = exporter.format_managers_section(modelinfo.managers_info)
-                if managers_section:
-                    model_section.content.append(managers_section.render())
-
-            model_section.content.append("---")
-            document_sections.append(model_section)
-
-        return "\n".join(section.render() for section in document_sections)
+            pages.setdefault(get_markdown_page_path(model, split), []).append(model)
+
+        ordered_models = [model for page_models in pages.values() for model in page_models]
+        sections = self.iter_markdown_sections(ordered_models)
+
+        with ThreadPoolExecutor(max_workers=self.jobs) as writer:
+            futures = [writer.submit(write_if_changed, output_dir / "index.md", render_markdown_index(pages, split))]
+            for path, page_models in pages.items():
+                content = "\n".join(next(sections).render() for _ in page_models)
+                futures.append(writer.submit(write_if_changed, output_dir / path, content))
+
+        return sum(future.result() for future in futures), len(futures)
+
+    def write_plain(self, models: list[Any], stream: TextIO) -> None:
+        """Write the same tables as the console output as fixed-width or tab-separated text, one model at a time."""
+        renderer = PlainRenderer(
+            stream, self.verbosity, self.exclude_defaults, tsv=self.renderer == "tsv", databases=self.databases
+        )
+        modelinfo_rows = get_modelinfo_row_count(self.verbosity)
+        if self.verbosity > 0:
+            model_records = self.iter_model_records(models, markdown=False, modelinfo_rows=modelinfo_rows)
+        else:
+            model_records = ((model, None) for model in models)
+
+        for model, record in model_records:
+            with self.profiler.phase("render", model._meta.label):  # pylint: disable=W0212
+                renderer.render_model(model, record, modelinfo_rows)
+        renderer.render_total(len(models))
+
+    def write_ndjson(self, models: list[Any], stream: TextIO) -> None:
+        """Write one line of JSON per model to ``stream``, flushing each line as soon as its model is processed."""
+        if self.verbosity > 0:
+            model_records = self.iter_model_records(models, markdown=False)
+        else:
+            model_records = ((model, None) for model in models)
+
+        for model, record in model_records:
+            with self.profiler.phase("render", model._meta.label):  # pylint: disable=W0212
+                stream.write(record_to_json(model._meta.label, record) + "\n")  # pylint: disable=W0212
+                stream.flush()
+
+    def iter_markdown_sections(self, models: list[Any]) -> Iterator[MarkdownSection]:
+        """Yield the markdown section for each model, in order."""
+        exporter = MarkdownExporter(self.verbosity, self.exclude_defaults, self.databases)
+
+        for model, record in self.iter_model_records(models, markdown=True):
+            with self.profiler.phase("render", model._meta.label):  # pylint: disable=W0212
+                model_section = self.build_markdown_section(exporter, model, record)
+            yield model_section
+
+    def build_markdown_section(self, exporter: MarkdownExporter, model, record: ModelRecord) -> MarkdownSection:
+        """Build the markdown section for a single model."""
+        model_section = MarkdownSection(title=model._meta.label, content=[], level=1)
+        modelinfo = record.modelinfo
+
+        # Add Model Info section
+        info_table = exporter.format_modelinfo_table(modelinfo)
+        model_section.content.extend(["## Model Info\n", info_table.render(), ""])
+
+        if self.verbosity > 0:
+            # Add Fields sections
+            fields_other = record.fields_other
+            if fields_other:
+                fields_table = exporter.format_fields_table(fields_other, "other")
+                if fields_table:
+                    model_section.content.extend(["## Fields\n", fields_table.render(), ""])
+
+            # Add Relations section
+            fields_relation = record.fields_relation
+            if fields_relation:
+                relations_table = exporter.format_fields_table(fields_relation, "relation")
+                if relations_table:
+                    model_section.content.extend(["## Relations\n", relations_table.render(), ""])
+
+            # Add Reverse Relations section
+            if not model._meta.abstract:
+                fields_reverse_relation = record.fields_reverse_relation
+                model_section.content.extend([f"{fields_reverse_relation=}\n"])
+                if fields_reverse_relation:
+                    reverse_relations_table = exporter.format_fields_table(fields_reverse_relation, "reverse relation")
+                    if reverse_relations_table:
+                        model_section.content.extend(["## Reverse Relations\n", reverse_relations_table.render(), ""])
+
+            # Add Methods section
+            methods = record.method_info
+            if any(methods):
+                method_types = (
+                    ["Other", "Private"] if self.exclude_defaults else ["Other", "Private", "Dunder", "Common Django"]
+                )
+                method_sections = exporter.format_methods_section(methods, method_types)
+                if method_sections:
+                    model_section.content.append("## Methods\n")
+                    for section in method_sections:
+                        model_section.content.extend([section.render(), ""])
+
+            # Add Managers section
+            managers_section = exporter.format_managers_section(modelinfo.managers_info)
+            if managers_section:
+                model_section.content.append(managers_section.render())
+
+        model_section.content.append("---")
+        return model_section
 
     def export_results(self):
-        """Handle export functionality."""
+        """Handle export functionality for files not streamed from the console (.txt, .html, and .htm are)."""
         extension = Path(self.export_option).suffix
-        if extension in [".html", ".htm"]:
-            console.save_html(path=self.export_option)
-        elif extension == ".txt":
-            console.save_text(path=self.export_option)
-        elif extension == ".md":
-            md_content = self.export_markdown(self.model_list)
+        if extension == ".md":
             with open(self.export_option, "w", encoding="utf-8") as f:
-                f.write(md_content)
+                self.write_markdown(self.model_list, f)
@@ -0,0 +1,103 @@
+"""Work out which models are affected by a set of changed source files."""
+
+import hashlib
+import inspect
+import json
+import os
+from pathlib import Path
+
+from django.db.models import Model
+
+from ._field_index import build_field_index
+from ._model_attr_utils import get_model_file
+
+
+def normalize_path(path: str) -> str:
+    """Normalize a file path so paths from ``git diff``, snapshots and ``inspect`` can be compared.
+
+    Paths are resolved, then made relative to the working directory, so a snapshot taken in one checkout can be
+    compared against another checkout of the same project.
+    """
+    return os.path.relpath(os.path.realpath(path))
+
+
+def get_model_class_files(model: Model) -> set[str]:
+    """Get the normalized files of every class in the model's MRO, which is where its definition comes from."""
+    files = {get_model_file(cls) for cls in inspect.getmro(model) if cls is not object}
+    return {normalize_path(file) for file in files if file}
+
+
+def get_related_labels(model: Model) -> list[str]:
+    """Get the labels of the models this model's relations point at, whose reverse relations it defines."""
+    return sorted(
+        {
+            field.related_model._meta.label  # pylint: disable=W0212
+            for field in build_field_index(model).relations
+            if isinstance(field.related_model, type)
+        }
+    )
+
+
+def get_file_digest(path: str) -> str | None:
+    """Get a digest of a file's contents, or None if it can't be read."""
+    try:
+        return hashlib.md5(Path(path).read_bytes(), usedforsecurity=False).hexdigest()
+    except OSError:
+        return None
+
+
+def build_snapshot(models: list) -> dict:
+    """Record the state of the models' source files, and of their relations, for a later ``--changed-since`` run."""
+    files = set()
+    for model in models:
+        files |= get_model_class_files(model)
+
+    return {
+        "files": {file: get_file_digest(file) for file in sorted(files)},
+        "relations": {model._meta.label: get_related_labels(model) for model in models},  # pylint: disable=W0212
+    }
+
+
+def load_snapshot(path: str) -> dict:
+    """Load a snapshot written by ``save_snapshot``."""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_snapshot(path: str, snapshot: dict) -> None:
+    """Write a snapshot to a JSON file."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(snapshot, f, indent=2, sort_keys=True)
+
+
+def get_changed_files(previous: dict, current: dict) -> set[str]:
+    """Get the files that were added, removed, or modified between two snapshots."""
+    previous_files = previous.get("files", {})
+    current_files = current.get("files", {})
+    return {
+        file
+        for file in previous_files.keys() | current_files.keys()
+        if previous_files.get(file) != current_files.get(file)
+    }
+
+
+def get_affected_models(models: list, changed_files: set[str], previous_snapshot: dict | None = None) -> list:
+    """Get the models, in their original order, whose output may differ because of the changed files.
+
+    A model is affected when a class in its MRO (the model itself, an abstract parent, a mixin, or a concrete
+    parent in multi-table inheritance) is defined in a changed file. The models its relations point at are
+    affected too, since their reverse relations come from those relations. With a previous snapshot, the models
+    its relations used to point at are included as well, to cover relations that were removed or retargeted.
+    """
+    changed_files = {normalize_path(file) for file in changed_files}
+    previous_relations = (previous_snapshot or {}).get("relations", {})
+
+    changed_models = [model for model in models if get_model_class_files(model) & changed_files]
+    affected_labels = set()
+    for model in changed_models:
+        label = model._meta.label  # pylint: disable=W0212
+        affected_labels.add(label)
+        affected_labels.update(get_related_labels(model))
+        affected_labels.update(previous_relations.get(label, ()))
+
+    return [model for model in models if model._meta.label in affected_labels]  # pylint: disable=W0212
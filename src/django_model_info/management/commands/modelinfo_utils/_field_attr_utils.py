@@ -1,7 +1,11 @@
 """Get field attributes for a model field."""
 
-from django.db import connection
-from django.db.models import Field, Model
+from django.db import connection as default_connection
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.models import Field, ForeignKey, Model
+
+# Database types of relations already resolved, keyed by ``get_db_type_cache_key``
+DB_TYPE_CACHE: dict[tuple, str] = {}
 
 
 def get_field_name(field: Field) -> str:
@@ -31,16 +35,54 @@ def get_field_verbose_name(field: Field) -> str:
     return ""
 
 
-def get_field_db_type(field: Field) -> str:
-    """Get the database type of the field."""
+def get_db_type_cache_key(field: Field, connection: BaseDatabaseWrapper) -> tuple | None:
+    """Get the key under which a field's database type is memoized, or None if it isn't worth memoizing.
+
+    A foreign key's type is its target field's ``rel_db_type()``, which for the usual auto-incrementing primary
+    keys builds a throwaway field on every call, so it's memoized per target field and database. A reverse
+    relation's type is its forward field's, so the two share an entry. Other fields format their type straight
+    from ``connection.data_types``, which costs no more than building a key, so they are not memoized.
+    """
+    # Reverse relations can't be deconstructed, and take their type from the forward field
+    if not hasattr(field, "deconstruct"):
+        field = getattr(field, "field", None)
+    if field is None or type(field).db_type is not ForeignKey.db_type:
+        return None
+
+    try:
+        target_field = field.target_field
+    except (AttributeError, LookupError, ValueError):
+        return None
+    return (connection.alias, connection.vendor, target_field)
+
+
+def resolve_db_type(field: Field, connection: BaseDatabaseWrapper) -> str:
+    """Get the string form of ``field.db_type()`` on a database, memoized per ``get_db_type_cache_key``."""
+    key = get_db_type_cache_key(field, connection)
+    if key is not None and key in DB_TYPE_CACHE:
+        return DB_TYPE_CACHE[key]
+
+    try:
+        db_type = str(field.db_type(connection=connection))
+    except TypeError:
+        db_type = " TypeError (db_type)"
+    except AttributeError:
+        db_type = " AttributeError (db_type)"
+
+    if key is not None:
+        DB_TYPE_CACHE[key] = db_type
+    return db_type
+
+
+def get_field_db_type(field: Field, connection: BaseDatabaseWrapper = default_connection) -> str:
+    """Get the database type of the field.
+
+    ``connection`` defaults to the default database. Passing a connection from ``django.db.connections`` instead
+    skips the thread-local lookup the default connection proxy makes on every attribute access.
+    """
     db_type = "None"
     if hasattr(field, "db_type"):
-        try:
-            db_type = str(field.db_type(connection=connection))
-        except TypeError:
-            db_type = " TypeError (db_type)"
-        except AttributeError:
-            db_type = " AttributeError (db_type)"
+        db_type = resolve_db_type(field, connection)
 
         if db_type == "None" and hasattr(field, "through"):
             db_type = f"through {field.through._meta.label}"  # pylint: disable=W0212
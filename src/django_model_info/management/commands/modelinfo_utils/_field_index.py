@@ -0,0 +1,35 @@
+"""Single-pass classification of a model's fields."""
+
+from dataclasses import dataclass, field
+
+from django.db.models import Model
+from django.db.models.fields.reverse_related import ForeignObjectRel
+
+
+@dataclass
+class FieldIndex:
+    """A model's fields, classified once into relations, reverse relations, and non-relations."""
+
+    all_fields: tuple = ()
+    relations: list = field(default_factory=list)
+    reverse_relations: list = field(default_factory=list)
+    non_relations: list = field(default_factory=list)
+
+
+def build_field_index(model: Model) -> FieldIndex:
+    """Walk ``model._meta.get_fields(include_hidden=True)`` once and classify each field.
+
+    A field with no ``related_model`` is a non-relation. Otherwise it is a reverse relation if it is a
+    ``ForeignObjectRel`` (``ManyToOneRel``, ``OneToOneRel``, ``ManyToManyRel``, ...) and a forward relation if not.
+    """
+    index = FieldIndex(all_fields=tuple(model._meta.get_fields(include_hidden=True)))  # pylint: disable=W0212
+
+    for model_field in index.all_fields:
+        if getattr(model_field, "related_model", None) is None:
+            index.non_relations.append(model_field)
+        elif isinstance(model_field, ForeignObjectRel):
+            index.reverse_relations.append(model_field)
+        else:
+            index.relations.append(model_field)
+
+    return index
@@ -1,68 +1,89 @@
 """Classes for keeping track of model fields and methods."""
 
-from dataclasses import astuple, dataclass, field, fields
-
-
-@dataclass
-class Annotated:
-    """Class for annotating model fields with title and value."""
-
-    title: str = ""
-    value: str = ""
-
-
-@dataclass
+from dataclasses import dataclass, field, fields
+
+MODELINFO_TITLES = {
+    "model_name": "Model Name",
+    "verbose_name": "Verbose Name",
+    "verbose_name_plural": "Verbose Name Plural",
+    "docstring": "Docstring",
+    "is_abstract": "Is Abstract",
+    "is_proxy": "Is Proxy",
+    "is_managed": "Is Managed",
+    "ordering": "Ordering",
+    "permissions": "Permissions",
+    "default_permissions": "Default Permissions",
+    "indexes": "Indexes",
+    "constraints": "Constraints",
+    "database_table": "Database Table",
+    "database_table_comment": "Database Table Comment",
+    "database_tablespace": "Database Tablespace",
+    "base_manager": "Base Manager",
+    "default_manager": "Default Manager",
+    "file": "File",
+    "line_number": "Starting Line Number",
+    "mro": "Method Resolution Order",
+}
+"""Row titles for ``ModelInfo``, shared by every instance instead of being stored with each value."""
+
+
+def expand_db_type_headers(headers: list[str], databases: tuple[str, ...]) -> list[str]:
+    """Replace the "Database Type" header with one header per database alias, when there are several."""
+    if len(databases) < 2:
+        return headers
+    expanded = []
+    for header in headers:
+        if header == "Database Type":
+            expanded.extend(f"Database Type ({alias})" for alias in databases)
+        else:
+            expanded.append(header)
+    return expanded
+
+
+@dataclass(slots=True)
 class ModelInfo:
-    """Class for keeping track of fields that are relations."""
+    """Class for keeping track of the essential details of a model."""
 
-    model_name: Annotated = field(default_factory=lambda: Annotated(title="Model Name"))
-    verbose_name: Annotated = field(default_factory=lambda: Annotated(title="Verbose Name"))
-    verbose_name_plural: Annotated = field(default_factory=lambda: Annotated(title="Verbose Name Plural"))
-    docstring: Annotated = field(default_factory=lambda: Annotated(title="Docstring"))
-    is_abstract: Annotated = field(default_factory=lambda: Annotated(title="Is Abstract"))
-    is_proxy: Annotated = field(default_factory=lambda: Annotated(title="Is Proxy"))
-    is_managed: Annotated = field(default_factory=lambda: Annotated(title="Is Managed"))
-    ordering: Annotated = field(default_factory=lambda: Annotated(title="Ordering"))
-    permissions: Annotated = field(default_factory=lambda: Annotated(title="Permissions"))
-    default_permissions: Annotated = field(default_factory=lambda: Annotated(title="Default Permissions"))
-    indexes: Annotated = field(default_factory=lambda: Annotated(title="Indexes"))
-    constraints: Annotated = field(default_factory=lambda: Annotated(title="Constraints"))
-    database_table: Annotated = field(default_factory=lambda: Annotated(title="Database Table"))
-    database_table_comment: Annotated = field(default_factory=lambda: Annotated(title="Database Table Comment"))
-    database_tablespace: Annotated = field(default_factory=lambda: Annotated(title="Database Tablespace"))
-    base_manager: Annotated = field(default_factory=lambda: Annotated(title="Base Manager"))
-    default_manager: Annotated = field(default_factory=lambda: Annotated(title="Default Manager"))
-    file: Annotated = field(default_factory=lambda: Annotated(title="File"))
-    line_number: Annotated = field(default_factory=lambda: Annotated(title="Starting Line Number"))
-    mro: Annotated = field(default_factory=lambda: Annotated(title="Method Resolution Order"))
-    base_manager: Annotated = field(default_factory=lambda: Annotated(title="Base Manager"))
-    default_manager: Annotated = field(default_factory=lambda: Annotated(title="Default Manager"))
-    managers_info: dict = field(default_factory=dict)  # Add this line
+    model_name: str = ""
+    verbose_name: str = ""
+    verbose_name_plural: str = ""
+    docstring: str = ""
+    is_abstract: str = ""
+    is_proxy: str = ""
+    is_managed: str = ""
+    ordering: str = ""
+    permissions: str = ""
+    default_permissions: str = ""
+    indexes: str = ""
+    constraints: str = ""
+    database_table: str = ""
+    database_table_comment: str = ""
+    database_tablespace: str = ""
+    base_manager: str = ""
+    default_manager: str = ""
+    file: str = ""
+    line_number: str = ""
+    mro: str = ""
+    managers_info: dict = field(default_factory=dict)
 
     def render_rows(self, row_count: int) -> list:
         """Renders multiple rows."""
         rows = []
-        for row_num, field_info in enumerate(fields(self)):
-            if row_num <= row_count:
-                field_value = getattr(self, field_info.name)
-
-                # Check if the field_value is an instance of Annotated
-                if isinstance(field_value, Annotated):
-                    title = field_value.title
-                    value = field_value.value
-                else:
-                    # If it's not an Annotated instance, treat it as a string or another type
-                    title = field_info.name.replace("_", " ").title()  # Generate title from field name
-                    value = str(field_value)  # Convert to string in case it's not
-
-                rows.append((title, value))
+        for field_info in fields(self)[: row_count + 1]:
+            field_value = getattr(self, field_info.name)
+
+            if field_info.name in MODELINFO_TITLES:
+                rows.append((MODELINFO_TITLES[field_info.name], field_value))
+            else:
+                # Anything without a shared title gets one generated from the attribute name
+                rows.append((field_info.name.replace("_", " ").title(), str(field_value)))
         return rows
 
     def __str__(self):
-        return self.model_name.value
+        return self.model_name
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseInfo:
     """Base class for keeping track of model fields and methods."""
 
@@ -70,7 +91,7 @@ class BaseInfo:
 
     def render_row(self, column_count: int) -> list:
         """Renders a single row."""
-        return list(astuple(self))[:column_count]
+        return [getattr(self, field_info.name) for field_info in fields(self)[:column_count]]
 
     def render_simple_row(self) -> list:
         """Renders a single simple row."""
@@ -82,8 +103,23 @@ class BaseInfo:
         return self.name
 
 
-@dataclass
-class FieldRelation(BaseInfo):
+class DbTypeColumnsMixin:
+    """Render the database types of extra aliases (``extra_db_types``) right after the ``field_db_type`` column."""
+
+    __slots__ = ()
+
+    def render_row(self, column_count: int) -> list:
+        """Renders a single row, with a database type column per alias."""
+        names = [field_info.name for field_info in fields(self)[:column_count] if field_info.name != "extra_db_types"]
+        row = [getattr(self, name) for name in names]
+        if self.extra_db_types and "field_db_type" in names:
+            index = names.index("field_db_type") + 1
+            row[index:index] = [db_type for _, db_type in self.extra_db_types]
+        return row
+
+
+@dataclass(slots=True)
+class FieldRelation(DbTypeColumnsMixin, BaseInfo):
     """Class for keeping track of fields that are relations."""
 
     field_type: str = ""
@@ -91,10 +127,11 @@ class FieldRelation(BaseInfo):
     field_db_type: str = ""
     related_model: str = ""
     related_name: str = ""
+    extra_db_types: tuple = field(default=(), repr=False)
 
 
-@dataclass
-class FieldReverseRelation(BaseInfo):
+@dataclass(slots=True)
+class FieldReverseRelation(DbTypeColumnsMixin, BaseInfo):
     """Class for keeping track of fields that are relations."""
 
     field_type: str = ""
@@ -102,19 +139,21 @@ class FieldReverseRelation(BaseInfo):
     related_model: str = ""
     field_name_on_related_model: str = ""
     field_type_on_related_model: str = ""
+    extra_db_types: tuple = field(default=(), repr=False)
 
 
-@dataclass
-class FieldOther(BaseInfo):
+@dataclass(slots=True)
+class FieldOther(DbTypeColumnsMixin, BaseInfo):
     """Class for keeping track of fields that are relations."""
 
     field_type: str = ""
     field_column: str = ""
     field_db_type: str = ""
     field_verbose_name: str = ""
+    extra_db_types: tuple = field(default=(), repr=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class Method(BaseInfo):
     """Class for keeping track of dunder methods."""
 
@@ -122,3 +161,15 @@ class Method(BaseInfo):
     docstring: str = ""
     file: str = ""
     line_number: str = ""
+
+
+@dataclass(slots=True)
+class ModelRecord:
+    """Class for keeping track of everything built for a single model."""
+
+    label: str = ""
+    modelinfo: ModelInfo = field(default_factory=ModelInfo)
+    fields_other: list = field(default_factory=list)
+    fields_relation: list = field(default_factory=list)
+    fields_reverse_relation: list = field(default_factory=list)
+    method_info: tuple = ()
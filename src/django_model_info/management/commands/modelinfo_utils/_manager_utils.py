@@ -1,11 +1,44 @@
 """Utility functions for analyzing model managers and querysets."""
 
 import inspect
+from functools import cache
 
 from django.db import models
-from django.db.models.manager import Manager
+from django.db.models.manager import Manager, ManagerDescriptor
 from django.db.models.query import QuerySet
 
+from ..common_utils._settings import EXHAUSTIVE_MANAGER_SCAN
+from ._source_index import find_source_line_number
+
+BASE_MANAGER_METHODS = frozenset(dir(models.Manager))
+BASE_QUERYSET_METHODS = frozenset(dir(models.QuerySet))
+
+
+@cache
+def analyze_class_methods(cls: type, base_methods: frozenset) -> dict:
+    """Analyze the public methods a manager or queryset class adds to its base class.
+
+    Shared managers (soft-delete, tenant-scoped, ...) are often attached to many models, so the result is kept
+    for the life of the process and each class is only inspected once. Treat the returned dict as read-only.
+
+    Args:
+        cls: Django Manager or QuerySet class
+        base_methods: Names defined by the base class, which are skipped
+
+    Returns:
+        dict: Method analysis information, keyed by method name
+    """
+    methods = {}
+    for name, method in inspect.getmembers(cls, predicate=inspect.isfunction):
+        if name not in base_methods and not name.startswith("_"):
+            methods[name] = {
+                "docstring": inspect.getdoc(method),
+                "signature": str(inspect.signature(method)),
+                "source_file": inspect.getsourcefile(method),
+                "line_number": find_source_line_number(method),
+            }
+    return methods
+
 
 def analyze_manager(manager_class):
     """Analyze a model Manager class.
@@ -24,27 +57,15 @@ def analyze_manager(manager_class):
     if isinstance(manager_class, Manager):
         manager_class = manager_class.__class__
 
-    info = {
+    return {
         "name": manager_class.__name__,
         "docstring": inspect.getdoc(manager_class),
-        "methods": {},
+        # Get custom methods (skip those from base Manager)
+        "methods": analyze_class_methods(manager_class, BASE_MANAGER_METHODS),
         "is_custom": manager_class != models.Manager,
         "module": manager_class.__module__,
     }
 
-    # Get custom methods (skip those from base Manager)
-    base_methods = set(dir(models.Manager))
-    for name, method in inspect.getmembers(manager_class, predicate=inspect.isfunction):
-        if name not in base_methods and not name.startswith("_"):
-            info["methods"][name] = {
-                "docstring": inspect.getdoc(method),
-                "signature": str(inspect.signature(method)),
-                "source_file": inspect.getsourcefile(method),
-                "line_number": inspect.getsourcelines(method)[1],
-            }
-
-    return info
-
 
 def analyze_queryset(queryset_class):
     """Analyze a model QuerySet class.
@@ -63,37 +84,108 @@ def analyze_queryset(queryset_class):
     if isinstance(queryset_class, QuerySet):
         queryset_class = queryset_class.__class__
 
-    info = {
+    return {
         "name": queryset_class.__name__,
         "docstring": inspect.getdoc(queryset_class),
-        "methods": {},
+        # Get custom methods (skip those from base QuerySet)
+        "methods": analyze_class_methods(queryset_class, BASE_QUERYSET_METHODS),
         "is_custom": queryset_class != models.QuerySet,
         "module": queryset_class.__module__,
     }
 
-    # Get custom methods (skip those from base QuerySet)
-    base_methods = set(dir(models.QuerySet))
-    for name, method in inspect.getmembers(queryset_class, predicate=inspect.isfunction):
-        if name not in base_methods and not name.startswith("_"):
-            info["methods"][name] = {
-                "docstring": inspect.getdoc(method),
-                "signature": str(inspect.signature(method)),
-                "source_file": inspect.getsourcefile(method),
-                "line_number": inspect.getsourcelines(method)[1],
-            }
 
-    return info
+@cache
+def _get_mixin_attributes(cls: type) -> tuple[frozenset, tuple]:
+    """Get the attribute names and manager attributes defined by a class that is not itself a model.
+
+    ``django.db.models.Model``, ``object`` and mixins are in the MRO of every model, and their dicts do not
+    change once they are defined, so each is only walked once.
+    """
+    return frozenset(vars(cls)), tuple(
+        (attr_name, attr) for attr_name, attr in vars(cls).items() if isinstance(attr, (Manager, ManagerDescriptor))
+    )
 
 
-def get_model_managers(model):
+def discover_model_managers(model) -> dict:
+    """Find the managers attached to a model as class attributes, without triggering any descriptors.
+
+    Walks the ``__dict__`` of every class in the MRO, letting the first class that defines a name win, as
+    attribute lookup would. Django stores managers behind a ``ManagerDescriptor``, which is resolved to the
+    model's own copy through ``_meta.managers_map``, so no related or deferred attribute descriptor is touched.
+    Names are returned in the same (sorted) order ``dir(model)`` would give.
+
+    Args:
+        model: Django model class
+
+    Returns:
+        dict: Managers, keyed by attribute name
+    """
+    managers_map = model._meta.managers_map
+    found = {}
+    seen = set()
+    for cls in inspect.getmro(model):
+        if "_meta" in vars(cls):
+            attr_names = vars(cls).keys()
+            attrs = vars(cls).items()
+        else:
+            attr_names, attrs = _get_mixin_attributes(cls)
+
+        for attr_name, attr in attrs:
+            if attr_name in seen:
+                continue
+            if isinstance(attr, ManagerDescriptor):
+                attr = managers_map.get(attr.manager.name, attr.manager)
+            if isinstance(attr, Manager):
+                found[attr_name] = attr
+        seen.update(attr_names)
+
+    return {attr_name: found[attr_name] for attr_name in sorted(found)}
+
+
+def scan_model_managers(model) -> dict:
+    """Find the managers attached to a model by getting every attribute in ``dir(model)``.
+
+    This is the exhaustive scan ``get_model_managers`` used before ``discover_model_managers``. It triggers every
+    descriptor on the class, and raises ``AttributeError`` for abstract models that declare a manager.
+
+    Args:
+        model: Django model class
+
+    Returns:
+        dict: Managers, keyed by attribute name
+    """
+    found = {}
+    for attr_name in dir(model):
+        attr = getattr(model, attr_name)
+        if isinstance(attr, Manager):
+            found[attr_name] = attr
+    return found
+
+
+def add_manager_info(managers: dict, name: str, manager) -> None:
+    """Analyze a custom manager, and its queryset if that is custom too, and add it to ``managers``."""
+    manager_info = analyze_manager(manager)
+    if manager_info:
+        managers[name] = manager_info
+        queryset_class = manager._queryset_class
+        if queryset_class != models.QuerySet:
+            managers[name]["queryset"] = analyze_queryset(queryset_class)
+
+
+def get_model_managers(model, exhaustive: bool | None = None):
     """Get all managers for a model, including custom managers.
 
     Args:
         model: Django model class
+        exhaustive: Find managers with the ``dir(model)`` scan rather than the static class scan. Defaults to the
+            ``EXHAUSTIVE_MANAGER_SCAN`` setting.
 
     Returns:
         dict: Manager information
     """
+    if exhaustive is None:
+        exhaustive = EXHAUSTIVE_MANAGER_SCAN
+
     managers = {}
 
     # Get default manager
@@ -110,23 +202,13 @@ def get_model_managers(model):
         for manager in model._meta._managers:
             if isinstance(manager, Manager) and manager.__class__ != models.Manager:
                 name = manager.name if hasattr(manager, "name") else "unnamed"
-                manager_info = analyze_manager(manager)
-                if manager_info:
-                    managers[name] = manager_info
-                    queryset_class = manager._queryset_class
-                    if queryset_class != models.QuerySet:
-                        managers[name]["queryset"] = analyze_queryset(queryset_class)
+                add_manager_info(managers, name, manager)
 
     # Check for manager attributes directly on model
-    for attr_name in dir(model):
-        attr = getattr(model, attr_name)
-        if isinstance(attr, Manager) and attr.__class__ != models.Manager:
-            manager_info = analyze_manager(attr)
-            if manager_info:
-                managers[attr_name] = manager_info
-                queryset_class = attr._queryset_class
-                if queryset_class != models.QuerySet:
-                    managers[attr_name]["queryset"] = analyze_queryset(queryset_class)
+    model_managers = scan_model_managers(model) if exhaustive else discover_model_managers(model)
+    for attr_name, manager in model_managers.items():
+        if manager.__class__ != models.Manager:
+            add_manager_info(managers, attr_name, manager)
 
     return managers if managers else None
 
@@ -1,9 +1,13 @@
 """Markdown export functionality for Django model documentation."""
 
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
 
+from django.db import DEFAULT_DB_ALIAS
+
 from ._common_utils import clean_docstring
+from ._info_classes import expand_db_type_headers
 
 
 @dataclass
@@ -51,9 +55,10 @@ class MarkdownTable:
 class MarkdownExporter:
     """Handles the generation of markdown documentation for Django models."""
 
-    def __init__(self, verbosity: int, exclude_defaults: bool):
+    def __init__(self, verbosity: int, exclude_defaults: bool, databases: tuple[str, ...] = (DEFAULT_DB_ALIAS,)):
         self.verbosity = verbosity
         self.exclude_defaults = exclude_defaults
+        self.databases = databases
 
     def format_modelinfo_table(self, modelinfo: Any) -> MarkdownTable:
         """Format model information into a markdown table."""
@@ -94,7 +99,7 @@ class MarkdownExporter:
         else:
             headers = ["Field Name"]
 
-        table = MarkdownTable(headers)
+        table = MarkdownTable(expand_db_type_headers(headers, self.databases))
 
         for field in sorted(fields, key=lambda x: x.name):
             if self.verbosity >= 2:
@@ -104,6 +109,7 @@ class MarkdownExporter:
                         field.field_type,
                         field.field_column,
                         field.field_db_type,
+                        *(db_type for _, db_type in field.extra_db_types),
                         field.field_verbose_name,
                     ]
                 elif field_type == "relation":
@@ -112,6 +118,7 @@ class MarkdownExporter:
                         field.field_type,
                         field.field_column,
                         field.field_db_type,
+                        *(db_type for _, db_type in field.extra_db_types),
                         field.related_model,
                         field.related_name,
                     ]
@@ -120,6 +127,7 @@ class MarkdownExporter:
                         f"`{field.name}`",
                         field.field_type,
                         field.field_db_type,
+                        *(db_type for _, db_type in field.extra_db_types),
                         field.related_model,
                         field.field_name_on_related_model,
                         field.field_type_on_related_model,
@@ -219,3 +227,35 @@ class MarkdownExporter:
                         f"Defined in: `{method_info['source_file']}`:`{method_info['line_number']}`\n"
                     )
                 content.extend(method_content)
+
+
+def get_markdown_page_path(model: Any, split: str) -> Path:
+    """Get the path, relative to the output directory, of the page that documents a model.
+
+    With ``split="app"`` every app gets one page (``inventory.md``); with ``split="model"`` every model gets its
+    own page inside a directory for its app (``inventory/Product.md``).
+    """
+    app_label = model._meta.app_label  # pylint: disable=W0212
+    if split == "model":
+        return Path(app_label) / f"{model._meta.object_name}.md"  # pylint: disable=W0212
+    return Path(f"{app_label}.md")
+
+
+def render_markdown_index(pages: dict[Path, list[Any]], split: str) -> str:
+    """Render an index page that links to every page, listing the models each one documents."""
+    lines = ["# Models", ""]
+    current_app = None
+
+    for path, models in pages.items():
+        app_label = models[0]._meta.app_label  # pylint: disable=W0212
+        if split == "model":
+            # Group the links to each model's page under its app
+            if app_label != current_app:
+                lines.append(f"- {app_label}")
+                current_app = app_label
+            lines.append(f"    - [{models[0]._meta.object_name}]({path.as_posix()})")  # pylint: disable=W0212
+        else:
+            lines.append(f"- [{app_label}]({path.as_posix()})")
+            lines.extend(f"    - {model._meta.object_name}" for model in models)  # pylint: disable=W0212
+
+    return "\n".join(lines) + "\n"
@@ -1,10 +1,14 @@
 """Get method attributes for a model."""
 
 import inspect
+from collections import OrderedDict
 from pathlib import Path
 
 from rich.errors import NotRenderableError
 
+from ..common_utils._settings import METHOD_CACHE_SIZE
+from ._source_index import find_source_line_number
+
 
 def shorten_path(file_path, length):
     """Split the path into separate parts, select the last
@@ -61,9 +65,7 @@ def get_method_file(method: str, model: type) -> str:
 def get_method_line_number(method: str, model: type) -> str:
     """Get the line number where the method is defined."""
     try:
-        file_info = inspect.getsourcelines(getattr(model, method))
-        if len(file_info) > 0:
-            return str(file_info[-1])
+        return str(find_source_line_number(getattr(model, method)))
     except AttributeError:
         pass
     except TypeError:
@@ -72,3 +74,83 @@ def get_method_line_number(method: str, model: type) -> str:
         pass
 
     return ""
+
+
+class MethodIntrospectionCache:
+    """A size-bounded, least-recently-used cache of method introspection results."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: OrderedDict = OrderedDict()
+
+    def get(self, key):
+        """Get a cached entry, marking it as recently used, or None if there is no entry."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key, entry) -> None:
+        """Store an entry, evicting the least recently used entries beyond ``maxsize``."""
+        if self.maxsize <= 0:
+            return
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+method_cache = MethodIntrospectionCache(METHOD_CACHE_SIZE)
+
+
+def get_method_cache_key(method: str, model: type, verbosity: int) -> tuple | None:
+    """Get the key under which a method's introspection is cached, or None if it cannot be cached.
+
+    The key is the underlying function (``__func__`` for bound methods such as classmethods), so a method
+    inherited by many models shares one entry.
+    """
+    try:
+        attr = getattr(model, method)
+    except AttributeError:
+        return None
+
+    key = (type(attr), getattr(attr, "__func__", attr), verbosity > 2)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def get_method_details(method: str, model: type, verbosity: int) -> tuple:
+    """Get the signature, docstring, file, and line number of a method.
+
+    Most methods on a model (``save``, ``delete``, ``full_clean``, the ``_check_*`` family, ...) are the same
+    function objects inherited from ``django.db.models.Model``, so results are shared between models through
+    ``method_cache``. The docstring, file, and line number are only looked up above verbosity 2.
+    """
+    cache_key = get_method_cache_key(method, model, verbosity)
+    if cache_key is not None:
+        details = method_cache.get(cache_key)
+        if details is not None:
+            return details
+
+    details = (get_method_signature(method, model, verbosity), "", "", "")
+    if verbosity > 2:
+        details = (
+            details[0],
+            get_method_docstring(method, model),
+            get_method_file(method, model),
+            get_method_line_number(method, model),
+        )
+
+    if cache_key is not None:
+        method_cache.set(cache_key, details)
+    return details
@@ -0,0 +1,65 @@
+"""Work out which class in a model's MRO defines each of its attributes, and whether that class is part of the project."""
+
+import inspect
+import os
+import sysconfig
+from functools import cache
+
+import django
+from django.db.models import Model
+
+# Directories holding code that isn't part of the project: the standard library, installed packages, and Django
+EXTERNAL_PATHS = tuple(
+    os.path.join(os.path.realpath(path), "")
+    for path in {
+        sysconfig.get_path("stdlib"),
+        sysconfig.get_path("platstdlib"),
+        sysconfig.get_path("purelib"),
+        sysconfig.get_path("platlib"),
+        os.path.dirname(django.__file__),
+    }
+    if path
+)
+
+
+@cache
+def get_attribute_owners(model: type) -> dict[str, type]:
+    """Map every attribute name of a class to the class in its MRO that defines it.
+
+    The MRO is walked from ``object`` up, so a class that overrides an attribute replaces its parent as the owner,
+    and each lookup afterwards is a single dict access.
+    """
+    owners = {}
+    for cls in reversed(inspect.getmro(model)):
+        owners.update(dict.fromkeys(vars(cls), cls))
+    return owners
+
+
+def get_attribute_owner(model: type, name: str) -> type | None:
+    """Get the class that defines an attribute of a model, or None if no class in its MRO does."""
+    return get_attribute_owners(model).get(name)
+
+
+@cache
+def is_project_class(cls: type) -> bool:
+    """Check whether a class is defined in the project, rather than in Django, an installed package, or Python."""
+    try:
+        file = inspect.getfile(cls)
+    except TypeError:
+        # Built-in classes have no file
+        return False
+    return not os.path.realpath(file).startswith(EXTERNAL_PATHS)
+
+
+def is_common_django_method(model: type, name: str) -> bool:
+    """Check whether a model's attribute comes from ``django.db.models.Model``, so every model has it."""
+    return get_attribute_owner(model, name) is Model
+
+
+def is_inherited_default(model: type, name: str) -> bool:
+    """Check whether a model's attribute is inherited from a class outside the project.
+
+    Attributes the model defines itself, including the ones Django adds to it for its fields, are never defaults.
+    """
+    owner = get_attribute_owner(model, name)
+    return owner is not model and (owner is None or not is_project_class(owner))
@@ -4,6 +4,8 @@ import inspect
 
 from django.db.models import Model
 
+from ._source_index import find_source_line_number
+
 
 def get_model_name(model: Model) -> str:
     """Get the name of the model."""
@@ -160,9 +162,7 @@ def get_model_file(model: Model) -> str:
 def get_model_line_number(model: Model) -> str:
     """Get the line number where the model is defined."""
     try:
-        file_info = inspect.getsourcelines(model)
-        if len(file_info) > 0:
-            return str(file_info[-1])
+        return str(find_source_line_number(model))
     except AttributeError:
         pass
     except OSError:
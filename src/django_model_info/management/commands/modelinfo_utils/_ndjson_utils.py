@@ -0,0 +1,52 @@
+"""Newline-delimited JSON export functionality for Django model documentation."""
+
+import json
+from dataclasses import asdict
+
+from ._info_classes import MODELINFO_TITLES, ModelInfo, ModelRecord
+
+METHOD_GROUPS = ("other", "private", "dunder", "common_django")
+
+
+def modelinfo_to_dict(modelinfo: ModelInfo) -> dict:
+    """Convert model information into a dict of plain values, keyed by attribute name."""
+    return {name: getattr(modelinfo, name) for name in MODELINFO_TITLES}
+
+
+def field_to_dict(field_info) -> dict:
+    """Convert a field's information into a dict, with the types on any extra databases keyed by alias."""
+    data = asdict(field_info)
+    extra_db_types = data.pop("extra_db_types")
+    if extra_db_types:
+        data["extra_db_types"] = dict(extra_db_types)
+    return data
+
+
+def record_to_dict(label: str, record: ModelRecord | None) -> dict:
+    """Convert a model's record into a dict that can be serialized as JSON.
+
+    Method groups are keyed by ``METHOD_GROUPS``, in the order ``ModelProcessor.build_method_info`` returns them,
+    so with ``--exclude-defaults`` only ``other`` and ``private`` are present. With no record (verbosity 0) only
+    the model's label is included.
+    """
+    data = {"model": label}
+    if record is None:
+        return data
+
+    data["modelinfo"] = modelinfo_to_dict(record.modelinfo)
+    data["fields"] = {
+        "other": [field_to_dict(field_info) for field_info in record.fields_other],
+        "relation": [field_to_dict(field_info) for field_info in record.fields_relation],
+        "reverse_relation": [field_to_dict(field_info) for field_info in record.fields_reverse_relation],
+    }
+    data["methods"] = {
+        group: [asdict(method) for method in methods] for group, methods in zip(METHOD_GROUPS, record.method_info)
+    }
+    data["managers_info"] = record.modelinfo.managers_info
+    return data
+
+
+def record_to_json(label: str, record: ModelRecord | None) -> str:
+    """Serialize a model's record as a single line of JSON."""
+    # Manager analysis can hold values json doesn't know about, so fall back to their string form
+    return json.dumps(record_to_dict(label, record), default=str)
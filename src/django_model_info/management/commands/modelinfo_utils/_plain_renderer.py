@@ -0,0 +1,137 @@
+"""Plain text rendering for Django model documentation, without rich."""
+
+from typing import Any, TextIO
+
+from django.db import DEFAULT_DB_ALIAS
+
+from ._info_classes import (
+    FieldOther,
+    FieldRelation,
+    FieldReverseRelation,
+    Method,
+    ModelInfo,
+    ModelRecord,
+    expand_db_type_headers,
+)
+from ._manager_utils import format_manager_output
+
+FIELD_HEADERS = {
+    FieldOther: ["Field Name", "Field Type", "Database Column", "Database Type", "Verbose Name"],
+    FieldRelation: ["Field Name", "Field Type", "Database Column", "Database Type", "Related Model", "Related Name"],
+    FieldReverseRelation: [
+        "Field Name",
+        "Field Type",
+        "Database Type",
+        "Related Model",
+        "Field Name on Related Model",
+        "Field Type on Related Model",
+    ],
+}
+
+
+class PlainRenderer:
+    """Render model records as fixed-width or tab-separated tables.
+
+    Tables hold the same rows as the rich tables, from the same info objects, but each one is laid out with
+    column widths computed in a single pass and written to ``stream`` with a single call.
+    """
+
+    def __init__(
+        self,
+        stream: TextIO,
+        verbosity: int,
+        exclude_defaults: bool,
+        tsv: bool = False,
+        databases: tuple[str, ...] = (DEFAULT_DB_ALIAS,),
+    ):
+        self.stream = stream
+        self.verbosity = verbosity
+        self.exclude_defaults = exclude_defaults
+        self.tsv = tsv
+        self.databases = databases
+
+    def render_model(self, model: Any, record: ModelRecord | None, modelinfo_rows: int) -> None:
+        """Render a model's label, followed by all of its tables if there is a record."""
+        self.stream.write(f"\n{model._meta.label}\n")  # pylint: disable=W0212
+        if record is None:
+            return
+
+        self.render_modelinfo(record.modelinfo, modelinfo_rows)
+        self.stream.write("\n    Fields:\n")
+        self.render_table("Other Fields", record.fields_other, FieldOther)
+        self.render_table("Relations", record.fields_relation, FieldRelation)
+        if not model._meta.abstract:  # pylint: disable=W0212
+            self.render_table("Reverse Relations", record.fields_reverse_relation, FieldReverseRelation)
+        self.render_methods(record.method_info)
+
+        if self.verbosity > 1 and record.modelinfo.managers_info:
+            self.stream.write("\n" + format_manager_output(record.modelinfo.managers_info, 4, self.verbosity) + "\n")
+
+    def render_total(self, count: int) -> None:
+        """Render the number of models listed."""
+        self.stream.write(f"\nTotal Models Listed: {count}\n")
+
+    def render_modelinfo(self, modelinfo: ModelInfo, row_count: int) -> None:
+        """Render the model info table."""
+        self.write_table("Model Info", ["Key", "Value"], modelinfo.render_rows(row_count))
+
+    def render_methods(self, method_info: tuple) -> None:
+        """Render the method tables, skipping the same groups as the rich output at each verbosity."""
+        if self.verbosity == 3:
+            self.stream.write("\n    Methods (all):\n")
+        else:
+            self.stream.write("\n    Methods (non-private/internal):\n")
+
+        titles = ["Other Methods", "Private Methods"]
+        if not self.exclude_defaults and self.verbosity > 1:
+            titles += ["Dunder Methods", "Common Django Methods"]
+        for title, methods in zip(titles, method_info):
+            self.render_table(title, methods, Method)
+
+    def render_table(self, title: str, info_object_list: list, info_type: type) -> None:
+        """Render a table of field or method info objects, sorted by name. Empty tables are skipped."""
+        if not info_object_list:
+            return
+
+        if info_type is Method:
+            headers = ["Method Name"]
+            if self.verbosity >= 2:
+                headers.append("Signature")
+            if self.verbosity >= 3:
+                headers.extend(["Docstring", "File", "Line Number"])
+        else:
+            headers = FIELD_HEADERS[info_type] if self.verbosity >= 2 else FIELD_HEADERS[info_type][:1]
+        # Extra database type columns are added by ``render_row``, so they don't count towards ``column_count``
+        column_count = len(headers)
+        headers = expand_db_type_headers(headers, self.databases)
+
+        rows = [
+            row.render_row(column_count=column_count) if self.verbosity >= 2 else row.render_simple_row()
+            for row in sorted(info_object_list, key=lambda x: x.name)
+        ]
+        self.write_table(title, headers, rows)
+
+    def write_table(self, title: str, headers: list[str], rows: list) -> None:
+        """Lay out a table and write it to the stream."""
+        rows = [[self.clean_cell(cell) for cell in row] for row in rows]
+        indent = "" if self.tsv else " " * 8
+
+        if self.tsv:
+            lines = ["\t".join(headers)] + ["\t".join(row) for row in rows]
+        else:
+            widths = [len(header) for header in headers]
+            for row in rows:
+                widths = [max(width, len(cell)) for width, cell in zip(widths, row)]
+            lines = [
+                "  ".join(header.ljust(width) for header, width in zip(headers, widths)).rstrip(),
+                "  ".join("-" * width for width in widths),
+            ] + ["  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip() for row in rows]
+
+        self.stream.write(f"\n{indent}{title}\n" + "".join(f"{indent}{line}\n" for line in lines))
+
+    def clean_cell(self, value: Any) -> str:
+        """Fit a value on a single line, so rows stay aligned (or, for TSV, stay a single record)."""
+        value = "" if value is None else str(value)
+        if "\n" in value or "\t" in value:
+            value = " ".join(value.split())
+        return value
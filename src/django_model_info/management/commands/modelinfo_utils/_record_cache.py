@@ -0,0 +1,93 @@
+"""Cache the records built by the modelinfo command, keyed by a fingerprint of each model's source files."""
+
+import hashlib
+import inspect
+import json
+import os
+from importlib.metadata import PackageNotFoundError, version
+
+import django
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models import Model
+
+from ..common_utils._cache import cache, get_cache_version
+from ..common_utils._settings import CACHE_KEY_PREFIX, CACHE_TIMEOUT, EXHAUSTIVE_MANAGER_SCAN
+from ._field_index import build_field_index
+from ._info_classes import ModelRecord
+from ._model_attr_utils import get_model_file
+
+
+def get_package_version() -> str:
+    """Get the installed version of django-model-info."""
+    try:
+        return version("django-model-info")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def get_model_source_files(model: Model) -> list[str]:
+    """Get the files whose contents affect what modelinfo reports for the model.
+
+    That is the file of every class in the model's MRO, plus the files of the models on the other end of its
+    relations, since adding or removing a ``ForeignKey`` elsewhere changes this model's reverse relations.
+    """
+    classes = [cls for cls in inspect.getmro(model) if cls is not object]
+    field_index = build_field_index(model)
+    classes.extend(field.related_model for field in field_index.relations + field_index.reverse_relations)
+
+    return sorted({get_model_file(cls) for cls in classes if isinstance(cls, type)} - {""})
+
+
+def get_model_fingerprint(model: Model) -> str:
+    """Get a fingerprint that changes whenever the model's source files, Django, or this package change."""
+    sources = []
+    for file in get_model_source_files(model):
+        try:
+            sources.append((file, os.stat(file).st_mtime_ns))
+        except OSError:
+            sources.append((file, None))
+
+    key_data = {
+        "sources": sources,
+        "django": django.get_version(),
+        "package": get_package_version(),
+    }
+    key_str = json.dumps(key_data, sort_keys=True)
+    return hashlib.md5(key_str.encode(), usedforsecurity=False).hexdigest()
+
+
+def get_record_cache_key(
+    model: Model,
+    verbosity: int,
+    exclude_defaults: bool,
+    markdown: bool,
+    modelinfo_rows: int | None = None,
+    databases: tuple[str, ...] = (DEFAULT_DB_ALIAS,),
+) -> str:
+    """Generate a cache key for a model's record based on its fingerprint and the options that shape it."""
+    key_data = {
+        "model": f"{model.__module__}.{model.__qualname__}",
+        "fingerprint": get_model_fingerprint(model),
+        "verbosity": verbosity,
+        "exclude_defaults": exclude_defaults,
+        "markdown": markdown,
+        "modelinfo_rows": modelinfo_rows,
+        "databases": list(databases),
+        "exhaustive_manager_scan": EXHAUSTIVE_MANAGER_SCAN,
+        "version": get_cache_version(),  # Include cache version in key
+    }
+
+    key_str = json.dumps(key_data, sort_keys=True)
+    key_hash = hashlib.md5(key_str.encode(), usedforsecurity=False).hexdigest()
+
+    return f"{CACHE_KEY_PREFIX}modelinfo:{key_hash}"
+
+
+def get_cached_record(cache_key: str) -> ModelRecord | None:
+    """Get a cached record, if one exists for the key."""
+    return cache.get(cache_key)
+
+
+def set_cached_record(cache_key: str, record: ModelRecord) -> None:
+    """Store a record in the cache."""
+    cache.set(cache_key, record, CACHE_TIMEOUT)
@@ -0,0 +1,83 @@
+"""Find where classes and functions are defined by parsing each source file once."""
+
+import ast
+import inspect
+import linecache
+from functools import lru_cache
+
+
+class _DefinitionCollector(ast.NodeVisitor):
+    """Collect the line number of every class and function definition in a module, keyed by qualified name."""
+
+    def __init__(self):
+        self.stack: list[str] = []
+        self.line_numbers: dict[str, list[int]] = {}
+
+    def _add(self, node: ast.AST) -> None:
+        self.stack.append(node.name)
+        # Like inspect, a decorated definition starts at its first decorator
+        line_number = node.decorator_list[0].lineno if node.decorator_list else node.lineno
+        self.line_numbers.setdefault(".".join(self.stack), []).append(line_number)
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        self._add(node)
+        self.generic_visit(node)
+        self.stack.pop()
+
+    def visit_FunctionDef(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
+        self._add(node)
+        self.stack.append("<locals>")
+        self.generic_visit(node)
+        self.stack.pop()
+        self.stack.pop()
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+
+@lru_cache(maxsize=None)
+def get_source_index(filename: str) -> dict[str, list[int]] | None:
+    """Get the line numbers of every class and function defined in a file, keyed by qualified name.
+
+    Returns None if the file can't be read or parsed. Files are read through ``linecache``, so any file that
+    ``inspect`` has already loaded isn't read again.
+    """
+    lines = linecache.getlines(filename)
+    if not lines:
+        return None
+
+    try:
+        tree = ast.parse("".join(lines), filename)
+    except (SyntaxError, ValueError):
+        return None
+
+    collector = _DefinitionCollector()
+    collector.visit(tree)
+    return collector.line_numbers
+
+
+def find_source_line_number(obj: object) -> int:
+    """Get the line number where a class or function is defined.
+
+    Gives the same result as ``inspect.getsourcelines(obj)[1]``, but looks the definition up in the index of
+    its file, so resolving every method of a module only reads and parses that module once. Anything the
+    index can't resolve is passed to ``inspect``, which raises ``OSError`` or ``TypeError`` as usual.
+    """
+    target = inspect.unwrap(obj)
+    if inspect.ismethod(target):
+        target = target.__func__
+
+    if inspect.isclass(target) or inspect.isfunction(target):
+        filename = inspect.getsourcefile(target)
+        index = get_source_index(filename) if filename else None
+        line_numbers = index.get(target.__qualname__) if index else None
+
+        if line_numbers:
+            if inspect.isfunction(target):
+                # A redefined function shares its qualified name with the earlier definitions, but its code
+                # object knows which one it came from.
+                if target.__code__.co_firstlineno in line_numbers:
+                    return target.__code__.co_firstlineno
+            else:
+                return vars(target).get("__firstlineno__", line_numbers[0])
+
+    return inspect.getsourcelines(obj)[1]